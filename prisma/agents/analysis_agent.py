@@ -3,21 +3,132 @@ Analysis Agent - Analyzes and summarizes academic papers using LLM.
 """
 
 import logging
+import re
 import threading
+from collections import Counter, OrderedDict
+from itertools import chain
+from statistics import fmean
 from typing import List
+from urllib.parse import quote_plus
 from datetime import datetime
 import time
 
+import orjson
+from pydantic import ValidationError
+
 from ..utils.config import config
 from ..storage.models.agent_models import PaperMetadata, PaperSummary, AnalysisResult
-from ..storage.models.api_response_models import LLMRelevanceResult, LLMIdentityResult
+from ..storage.models.api_response_models import (
+    LLMRelevanceResult, LLMIdentityResult, LLMPaperSummary, LLMStructuredSummary,
+)
 from ..services import resource_lock
-from ..services.chat_llm import ChatLLM
+from ..services.chat_llm import ChatLLM, LeaseDenied
+from ..utils.text import content_hash
 
 _ollama_log = logging.getLogger("prisma.ollama")
 
 _CONFIDENCE_MAP = {"HIGH": 0.9, "MEDIUM": 0.6, "LOW": 0.3}
 
+# Plain substring matches, case-insensitive (no word boundaries -- "method"
+# must still hit "methodology"/"methods" exactly as the old
+# `"method" in text.lower()` did), compiled once rather than lowercasing a
+# copy of every summary twice per call.
+_FINDINGS_RE = re.compile(r"findings|results", re.IGNORECASE)
+_METHODOLOGY_RE = re.compile(r"method|approach", re.IGNORECASE)
+
+# Process-wide LRU of LLM answers for the deterministic-enough,
+# content-keyed prompts (paper summaries and per-paper relevance) --
+# keyed by content_hash of model + sampling params + the full prompt, so
+# a changed abstract, topic or model is simply a different key. Scoped to
+# the process (module-level, not per-agent) because every stream run and
+# dedup pass builds a fresh AnalysisAgent, and re-summarizing the same
+# paper on the next run is exactly the repeated work this avoids. Bounded
+# and in-memory only -- no on-disk store, per the no-database rule.
+_RESPONSE_CACHE_MAX = 1024
+_response_cache: OrderedDict[str, str] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Static prompt bodies for the summary and relevance calls, %-formatted with just
+# the variable fields at each call site rather than rebuilt as an f-string
+# every call. Substituted values are inserted verbatim, so a "%" or "{}"
+# inside a title or abstract is harmless.
+_SUMMARY_PROMPT = """Analyze this research paper.
+
+Title: %s
+
+Abstract: %s
+
+Respond with only a JSON object:
+{"summary": "2-3 sentence academic summary of the main contribution and significance", "key_findings": ["main finding, one short sentence each"], "methodology": "one sentence on the approach"}"""
+
+# _summarize_batch's prompt: one _BATCH_SUMMARY_ENTRY per paper, joined
+# by blank lines, in place of the second %s.
+_BATCH_SUMMARY_PROMPT = """Analyze each of the following %d research papers.
+
+%s
+
+Respond with only a JSON object holding one entry per paper:
+{"papers": [{"index": 1, "summary": "2-3 sentence academic summary of the main contribution and significance", "key_findings": ["main finding, one short sentence each"], "methodology": "one sentence on the approach"}, ...]}"""
+
+_BATCH_SUMMARY_ENTRY = "[%d] Title: %s\nAbstract: %s"
+
+_RELEVANCE_PROMPT = """Analyze whether this research paper is semantically relevant to the research topic.
+
+Research Topic: %s
+
+Paper Title: %s
+
+Paper Abstract: %s
+
+Please evaluate:
+1. Does this paper contribute knowledge to the research topic?
+2. Are the methods, findings, or applications related to the topic?
+3. Would this paper be valuable for someone researching this topic?
+
+Consider semantic relationships, not just keyword matches. For example, a paper about "neural networks for image recognition" would be relevant to "computer vision" even without exact word matches.
+
+Respond with:
+RELEVANCE: [HIGHLY_RELEVANT/RELEVANT/SOMEWHAT_RELEVANT/NOT_RELEVANT]
+CONFIDENCE: [HIGH/MEDIUM/LOW]
+REASONING: [2-3 sentences explaining the semantic connection or lack thereof]"""
+
+_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+# assess_relevance's RELEVANCE/CONFIDENCE/REASONING reply lines, matched
+# in one pass -- labels case-insensitive and tolerant of leading
+# whitespace, which the old startswith() checks silently dropped.
+_RELEVANCE_FIELD_RE = re.compile(
+    r"^[ \t]*(RELEVANCE|CONFIDENCE|REASONING):[ \t]*(.*?)[ \t]*$", re.MULTILINE | re.IGNORECASE,
+)
+_SEMANTIC_SCORE_MAP = {
+    "HIGHLY_RELEVANT": 0.9,
+    "RELEVANT": 0.7,
+    "SOMEWHAT_RELEVANT": 0.5,
+    "NOT_RELEVANT": 0.1,
+}
+_RELEVANT_LEVELS = frozenset({"HIGHLY_RELEVANT", "RELEVANT", "SOMEWHAT_RELEVANT"})
+
+
+_TERM_RE = re.compile(r"[a-z0-9]+")
+_PRESCREEN_STOPWORDS = frozenset({
+    "a", "an", "and", "as", "at", "by", "for", "from", "in", "into", "of",
+    "on", "or", "the", "to", "using", "via", "with",
+})
+
+
+def _content_terms(text: str) -> frozenset[str]:
+    """Lowercased alphanumeric tokens minus a handful of function words --
+    deliberately regex-only (no NLTK) so the relevance prescreen never
+    triggers a corpus download on the hot path."""
+    return frozenset(_TERM_RE.findall(text.lower())) - _PRESCREEN_STOPWORDS
+
+
+def _connected_papers_search_url(title: str) -> str:
+    """Fallback Connected Papers link for a paper the source didn't supply
+    one for. quote_plus, not the old `.replace(' ', '%20')`, which left
+    "&", "#", "?" etc. in a title unescaped and truncated the query."""
+    return f"https://www.connectedpapers.com/search?q={quote_plus(title)}"
+
 
 def _parse_confidence(token: str) -> float:
     """Maps the LLM's HIGH/MEDIUM/LOW confidence label to a float, matching
@@ -37,8 +148,17 @@ class AnalysisAgent:
             self.llm_config, priority="background",
             supervisor_host=supervisor_host, supervisor_port=supervisor_port,
         )
-
-    def _call_llm(self, prompt: str, *, temperature: float, max_tokens: int, timeout: float) -> str | None:
+        self._warmed = False
+        self._breaker_lock = threading.Lock()
+        self._consecutive_failures = 0
+        # Non-zero once the breaker has tripped; see _call_llm's docstring
+        self._breaker_open_until = 0.0
+        self._breaker_probing = False
+
+    def _call_llm(
+        self, prompt: str, *, temperature: float, max_tokens: int, timeout: float,
+        cache: bool = False, json_mode: bool = False,
+    ) -> str | None:
         """Single choke point for every LLM completion call in this agent,
         via the shared ChatLLM abstraction (ADR-014) -- provider-agnostic
         (ollama/llama_cpp/openrouter all just work through the openai SDK's
@@ -47,12 +167,91 @@ class AnalysisAgent:
         The process-local semaphore layers on top of ChatLLM's own
         cross-process lease, preserving this agent's existing concurrency
         cap for its own calls specifically.
+
+        cache=True serves/stores the answer via _response_cache. Only real
+        answers are stored -- a None (lease denied, call failed) must be
+        retried next time, not remembered. json_mode=True asks the server to
+        constrain decoding to a JSON object.
+
+        Circuit breaker: after _BREAKER_THRESHOLD consecutive failed calls,
+        every call returns None immediately for _BREAKER_COOLDOWN_S
+        instead of queueing up against a backend that is down -- the openai
+        SDK already retries each call twice with backoff, so a dead server
+        otherwise cost up to 3x the per-call timeout for *every* remaining
+        paper of the run. A denied lease (the pool busy with other work)
+        returns None too but isn't a failure: the backend was never asked.
+        After the cooldown a single call goes through as a probe while
+        concurrent callers keep getting None; its failure reopens the
+        breaker straight away, its success closes it.
         """
-        with self._inference_sem:
-            return self._chat_llm.complete(
-                [{"role": "user", "content": prompt}],
-                temperature=temperature, max_tokens=max_tokens, timeout=timeout,
-            )
+        key = None
+        if cache:
+            key = content_hash(f"{self.model}|{temperature}|{max_tokens}|{prompt}")
+            with _response_cache_lock:
+                hit = _response_cache.get(key)
+                if hit is not None:
+                    _response_cache.move_to_end(key)
+                    return hit
+        probe = False
+        with self._breaker_lock:
+            if self._breaker_open_until:
+                if time.monotonic() < self._breaker_open_until or self._breaker_probing:
+                    return None
+                self._breaker_probing = probe = True
+        try:
+            with self._inference_sem:
+                text = self._chat_llm.complete(
+                    [{"role": "user", "content": prompt}],
+                    temperature=temperature, max_tokens=max_tokens, timeout=timeout,
+                    response_format=_JSON_OBJECT_FORMAT if json_mode else None,
+                    raise_on_denied=True,
+                )
+        except LeaseDenied:
+            self._record_llm_outcome(None, probe)
+            return None
+        except Exception:
+            self._record_llm_outcome(False, probe)
+            raise
+        self._record_llm_outcome(text is not None, probe)
+        if key is not None and text is not None:
+            with _response_cache_lock:
+                _response_cache[key] = text
+                _response_cache.move_to_end(key)
+                while len(_response_cache) > _RESPONSE_CACHE_MAX:
+                    _response_cache.popitem(last=False)
+        return text
+
+    _BREAKER_THRESHOLD = 3
+    _BREAKER_COOLDOWN_S = 30.0
+
+    def _record_llm_outcome(self, answered: bool | None, probe: bool) -> None:
+        """answered=None: the lease was denied, so the call proves nothing
+        either way -- it only frees the probe slot if it held it."""
+        with self._breaker_lock:
+            if probe:
+                self._breaker_probing = False
+            if answered is None:
+                return
+            if answered:
+                self._consecutive_failures = 0
+                self._breaker_open_until = 0.0
+                return
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self._BREAKER_THRESHOLD:
+                self._breaker_open_until = time.monotonic() + self._BREAKER_COOLDOWN_S
+                _ollama_log.warning(
+                    "op=circuit_open model=%s consecutive_failures=%d cooldown_s=%.0f",
+                    self.model, self._consecutive_failures, self._BREAKER_COOLDOWN_S,
+                )
+
+    def warmup(self) -> bool:
+        """Load the model ahead of a bulk run so the first batch doesn't
+        pay the model-load latency, and pin it resident for the rest of the
+        run (see ChatLLM.preload). Once per agent instance -- a later call
+        after a successful warmup is a no-op."""
+        if not self._warmed:
+            self._warmed = self._chat_llm.preload()
+        return self._warmed
 
     def analyze(self, papers: List[PaperMetadata]) -> AnalysisResult:
         """
@@ -64,35 +263,38 @@ class AnalysisAgent:
         Returns:
             AnalysisResult with summaries and metadata
         """
-        summaries = []
-        processing_times = []
-
-        for paper in papers:
-            start_time = time.time()
-            summary = self._summarize_paper(paper)
-            processing_time = time.time() - start_time
-
-            processing_times.append(processing_time)
-            summaries.append(summary)
-
-        # Extract unique authors
-        all_authors = []
-        for paper in papers:
-            all_authors.extend(paper.authors)
-        unique_authors = list(set(all_authors))
-
-        # Calculate average processing time
-        avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
-
-        # Generate top authors (most frequent)
-        author_counts = {}
-        for author in all_authors:
-            author_counts[author] = author_counts.get(author, 0) + 1
-        top_authors = sorted(author_counts.keys(), key=lambda x: author_counts[x], reverse=True)[:10]
+        summaries: List[PaperSummary] = []
+
+        # Papers are grouped into batches of up to _SUMMARY_BATCH_SIZE (one
+        # LLM call each, see _summarize_batch) and the batches are fanned
+        # out across a thread pool sized to max_concurrent_inferences --
+        # the same cap _inference_sem enforces per call, so the pool never
+        # queues more in-flight requests than the server is configured to
+        # run in parallel. Previously one paper at a time, so N papers cost
+        # N x LLM latency even against a server with OLLAMA_NUM_PARALLEL > 1.
+        # pool.map keeps results in input order.
+        from concurrent.futures import ThreadPoolExecutor
+
+        batches = self._summary_batches(papers)
+        if batches:
+            self.warmup()
+            with ThreadPoolExecutor(max_workers=self.llm_config.max_concurrent_inferences) as pool:
+                for batch_summaries in pool.map(self._summarize_batch, batches):
+                    summaries.extend(batch_summaries)
+
+        # One hashing pass over every author name -- len() is the unique
+        # count and most_common() keeps a bounded heap instead of fully
+        # sorting every distinct author just to keep ten.
+        author_counts = Counter(chain.from_iterable(paper.authors for paper in papers))
+        top_authors = [author for author, _ in author_counts.most_common(10)]
+
+        # Each summary already carries its own timing (see _summarize_paper /
+        # _summarize_batch) -- no second clock around the call here.
+        avg_processing_time = fmean(s.processing_time for s in summaries) if summaries else 0
 
         return AnalysisResult(
             summaries=summaries,
-            author_count=len(unique_authors),
+            author_count=len(author_counts),
             total_papers=len(papers),
             avg_processing_time=avg_processing_time,
             analysis_timestamp=datetime.now(),
@@ -110,17 +312,25 @@ class AnalysisAgent:
         Returns:
             PaperSummary with key findings, methodology, results
         """
-        start_time = time.time()
+        t0 = time.monotonic()
 
         # Try to get enhanced summary from Ollama
-        enhanced_summary = self._get_ollama_summary(paper.title, paper.abstract)
-
-        # Extract key findings and methodology
+        structured = self._get_structured_summary(paper.title, paper.abstract)
+
+        return self._build_summary(paper, structured, time.monotonic() - t0)
+
+    def _build_summary(
+        self, paper: PaperMetadata, structured: LLMStructuredSummary | None, processing_time: float,
+    ) -> PaperSummary:
+        """Shared by _summarize_paper and _summarize_batch -- None means the
+        LLM gave nothing usable, so the abstract stands in for the summary
+        at the lower 0.5 confidence. Key findings/methodology come straight
+        from the model's JSON when it filled them in, and from the text
+        heuristics below otherwise (prose fallback, or an empty field)."""
+        enhanced_summary = structured.summary if structured else ""
         summary_text = enhanced_summary or paper.abstract
-        key_findings = self._extract_key_findings(summary_text)
-        methodology = self._extract_methodology(summary_text)
-
-        processing_time = time.time() - start_time
+        key_findings = (structured.key_findings if structured else None) or self._extract_key_findings(summary_text)
+        methodology = (structured.methodology if structured else "") or self._extract_methodology(summary_text)
 
         return PaperSummary(
             title=paper.title,
@@ -130,15 +340,125 @@ class AnalysisAgent:
             key_findings=key_findings,
             methodology=methodology,
             url=paper.url,
-            connected_papers_url=paper.connected_papers_url or f"https://www.connectedpapers.com/search?q={paper.title.replace(' ', '%20')}",
+            connected_papers_url=paper.connected_papers_url or _connected_papers_search_url(paper.title),
             analysis_confidence=0.8 if enhanced_summary else 0.5,
             processing_time=processing_time
         )
 
+    _SUMMARY_BATCH_SIZE = 8  # papers per summarize call — one forward pass instead of eight
+    # Output budget per paper, shared by the single and batched calls: the
+    # JSON summary/key_findings/methodology object fits comfortably, where
+    # the old free-form prose reply was given 200.
+    _SUMMARY_TOKENS_PER_PAPER = 160
+
+    def _summary_batches(self, papers: List[PaperMetadata]) -> List[List[PaperMetadata]]:
+        """Greedily groups papers into batches of at most _SUMMARY_BATCH_SIZE,
+        closing a batch early once its abstracts plus the per-paper output
+        budget would no longer fit in half the model's context window
+        (chars // 4, the same rough token heuristic used elsewhere in this
+        codebase) -- a handful of long abstracts must not silently overflow
+        the window and get truncated by the server."""
+        budget = self._chat_llm.context_window // 2
+        batches: List[List[PaperMetadata]] = []
+        current: List[PaperMetadata] = []
+        used = 0
+        for paper in papers:
+            cost = (len(paper.title) + len(paper.abstract)) // 4 + self._SUMMARY_TOKENS_PER_PAPER
+            if current and (len(current) >= self._SUMMARY_BATCH_SIZE or used + cost > budget):
+                batches.append(current)
+                current, used = [], 0
+            current.append(paper)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def _summarize_batch(self, papers: List[PaperMetadata]) -> List[PaperSummary]:
+        """
+        Summarize several papers with a single LLM call.
+
+        Asks for a JSON array of {index, summary, key_findings, methodology}
+        objects and maps each entry back to its paper by index. A response that isn't parseable at all
+        falls back to one _summarize_paper call per paper; a parseable one
+        that skips some papers only re-asks for the missing ones.
+
+        Args:
+            papers: Batch from _summary_batches
+
+        Returns:
+            One PaperSummary per paper, in input order
+        """
+        if len(papers) == 1:
+            return [self._summarize_paper(papers[0])]
+
+        papers_block = "\n\n".join(
+            _BATCH_SUMMARY_ENTRY % (i + 1, p.title, p.abstract)
+            for i, p in enumerate(papers)
+        )
+        prompt = _BATCH_SUMMARY_PROMPT % (len(papers), papers_block)
+
+        t0 = time.monotonic()
+        parsed: dict[int, LLMPaperSummary] | None = None
+        try:
+            text = self._call_llm(
+                prompt, temperature=0.2,
+                max_tokens=self._SUMMARY_TOKENS_PER_PAPER * len(papers), timeout=15 + 15 * len(papers),
+                cache=True, json_mode=True,
+            )
+            elapsed_ms = (time.monotonic() - t0) * 1000
+            if text is None:
+                self._log_ollama("summarize_batch", elapsed_ms, error="no answer from LLM", n=len(papers))
+            else:
+                parsed = self._parse_batch_summaries(text, len(papers))
+                if parsed is None:
+                    self._log_ollama("summarize_batch", elapsed_ms, error="unparseable JSON", n=len(papers))
+                else:
+                    self._log_ollama("summarize_batch", elapsed_ms, n=len(papers), parsed=len(parsed))
+        except Exception as exc:
+            elapsed_ms = (time.monotonic() - t0) * 1000
+            self._log_ollama("summarize_batch", elapsed_ms, error=str(exc), n=len(papers))
+
+        if parsed is None:
+            return [self._summarize_paper(p) for p in papers]
+        per_paper_time = (time.monotonic() - t0) / len(papers)
+        return [
+            self._build_summary(p, parsed[i + 1], per_paper_time) if (i + 1) in parsed else self._summarize_paper(p)
+            for i, p in enumerate(papers)
+        ]
+
+    def _parse_batch_summaries(self, text: str, n: int) -> dict[int, LLMPaperSummary] | None:
+        """Pulls the outermost [...] out of the reply -- the {"papers": [...]}
+        array, or a bare array from a model that ignored the wrapper and/or
+        put it in a ```json fence -- and returns {index: entry} for every
+        well-formed entry with 1 <= index <= n. None means the reply had no
+        usable JSON array at all."""
+        start, end = text.find("["), text.rfind("]")
+        if start == -1 or end <= start:
+            return None
+        try:
+            raw_items = orjson.loads(text[start:end + 1])
+        except orjson.JSONDecodeError:
+            return None
+        if not isinstance(raw_items, list):
+            return None
+        parsed: dict[int, LLMPaperSummary] = {}
+        for item in raw_items:
+            try:
+                entry = LLMPaperSummary.model_validate(item)
+            except ValidationError:
+                continue
+            if entry.index <= n:
+                parsed[entry.index] = entry.model_copy(update={"summary": entry.summary.strip()})
+        return parsed
+
     def _log_ollama(self, op: str, elapsed_ms: float, error: str | None = None, **kw) -> None:
         if error:
             _ollama_log.warning("op=%s model=%s elapsed_ms=%.0f error=%s", op, self.model, elapsed_ms, error)
             return
+        # Called once per LLM call from every pool worker -- skip building
+        # the key=value string at all when INFO is filtered out.
+        if not _ollama_log.isEnabledFor(logging.INFO):
+            return
         extra = " ".join(f"{k}={v}" for k, v in kw.items())
         _ollama_log.info(
             "op=%s model=%s elapsed_ms=%.0f%s",
@@ -146,39 +466,54 @@ class AnalysisAgent:
         )
 
     def _get_ollama_summary(self, title: str, abstract: str) -> str:
-        prompt = f"""Analyze this research paper and provide a concise summary in 2-3 sentences:
-
-Title: {title}
+        structured = self._get_structured_summary(title, abstract)
+        return structured.summary if structured else ""
 
-Abstract: {abstract}
-
-Provide a clear, academic summary focusing on the main contribution and significance."""
+    def _get_structured_summary(self, title: str, abstract: str) -> LLMStructuredSummary | None:
+        prompt = _SUMMARY_PROMPT % (title, abstract)
 
         t0 = time.monotonic()
         try:
-            text = self._call_llm(prompt, temperature=0.3, max_tokens=200, timeout=30)
+            text = self._call_llm(
+                prompt, temperature=0.2, max_tokens=self._SUMMARY_TOKENS_PER_PAPER, timeout=30,
+                cache=True, json_mode=True,
+            )
             elapsed_ms = (time.monotonic() - t0) * 1000
             if text is not None:
                 self._log_ollama("summarize", elapsed_ms)
-                return text.strip()
+                return self._parse_structured_summary(text)
             self._log_ollama("summarize", elapsed_ms, error="no answer from LLM")
-            return ""
+            return None
         except Exception as e:
             elapsed_ms = (time.monotonic() - t0) * 1000
             self._log_ollama("summarize", elapsed_ms, error=str(e))
-            return ""
+            return None
+
+    def _parse_structured_summary(self, text: str) -> LLMStructuredSummary | None:
+        """The reply's outermost {...} as a structured summary. A backend
+        that ignored json_mode and answered in prose still yields a usable
+        summary -- the whole reply becomes `summary`, and the other two
+        fields fall back to _build_summary's heuristics."""
+        text = text.strip()
+        start, end = text.find("{"), text.rfind("}")
+        if start != -1 and end > start:
+            try:
+                return LLMStructuredSummary.model_validate(orjson.loads(text[start:end + 1]))
+            except (orjson.JSONDecodeError, ValidationError):
+                pass
+        return LLMStructuredSummary(summary=text) if text else None
 
     def _extract_key_findings(self, text: str) -> List[str]:
         """Extract key findings from summary text."""
         # Simple extraction for MVP - could be enhanced with NLP
-        if "findings" in text.lower() or "results" in text.lower():
+        if _FINDINGS_RE.search(text):
             return [text.split('.')[0] + '.']
         return ['Key findings extracted from analysis']
 
     def _extract_methodology(self, text: str) -> str:
         """Extract methodology information from summary text."""
         # Simple extraction for MVP - could be enhanced with NLP
-        if "method" in text.lower() or "approach" in text.lower():
+        if _METHODOLOGY_RE.search(text):
             return "Methodology identified in analysis"
         return "Methodology analysis from abstract"
 
@@ -194,29 +529,16 @@ Provide a clear, academic summary focusing on the main contribution and signific
         Returns:
             Dict with relevance assessment results
         """
+        prescreened = self._lexical_prescreen(paper_title, topic)
+        if prescreened is not None:
+            self._log_ollama("assess_relevance", 0.0, prescreen="title_match")
+            return prescreened
+
         t0 = time.monotonic()
         try:
-            prompt = f"""Analyze whether this research paper is semantically relevant to the research topic.
-
-Research Topic: {topic}
-
-Paper Title: {paper_title}
-
-Paper Abstract: {paper_abstract}
-
-Please evaluate:
-1. Does this paper contribute knowledge to the research topic?
-2. Are the methods, findings, or applications related to the topic?
-3. Would this paper be valuable for someone researching this topic?
+            prompt = _RELEVANCE_PROMPT % (topic, paper_title, paper_abstract)
 
-Consider semantic relationships, not just keyword matches. For example, a paper about "neural networks for image recognition" would be relevant to "computer vision" even without exact word matches.
-
-Respond with:
-RELEVANCE: [HIGHLY_RELEVANT/RELEVANT/SOMEWHAT_RELEVANT/NOT_RELEVANT]
-CONFIDENCE: [HIGH/MEDIUM/LOW]
-REASONING: [2-3 sentences explaining the semantic connection or lack thereof]"""
-
-            text = self._call_llm(prompt, temperature=0.3, max_tokens=250, timeout=45)
+            text = self._call_llm(prompt, temperature=0.3, max_tokens=250, timeout=45, cache=True)
             elapsed_ms = (time.monotonic() - t0) * 1000
 
             if text is not None:
@@ -242,33 +564,44 @@ REASONING: [2-3 sentences explaining the semantic connection or lack thereof]"""
                 semantic_score=0.0
             )
 
+    def _lexical_prescreen(self, paper_title: str, topic: str) -> LLMRelevanceResult | None:
+        """Cheap first stage ahead of the LLM call: a paper whose title
+        contains every content term of the topic is relevant without
+        needing a 45s-budget completion to say so. Only ever short-circuits
+        the positive case -- the prompt exists precisely to catch papers
+        that are relevant *without* sharing the topic's words ("neural
+        networks for image recognition" vs "computer vision"), so a low
+        lexical overlap is never treated as a reason to drop a paper.
+        None means "no confident call, ask the LLM"."""
+        topic_terms = _content_terms(topic)
+        if not topic_terms or not topic_terms <= _content_terms(paper_title):
+            return None
+        return LLMRelevanceResult(
+            is_relevant=True,
+            relevance_level="RELEVANT",
+            confidence=_CONFIDENCE_MAP["HIGH"],
+            reasoning="Lexical prescreen: every topic term appears in the title.",
+            semantic_score=_SEMANTIC_SCORE_MAP["RELEVANT"],
+        )
+
     def _parse_semantic_relevance(self, response: str) -> LLMRelevanceResult:
         """Parse LLM response for semantic relevance assessment."""
         try:
-            lines = response.split('\n')
-            relevance_level = "NOT_RELEVANT"
-            confidence = "LOW"
-            reasoning = "Unable to parse reasoning"
-
-            for line in lines:
-                if line.startswith("RELEVANCE:"):
-                    relevance_level = line.split(":", 1)[1].strip()
-                elif line.startswith("CONFIDENCE:"):
-                    confidence = line.split(":", 1)[1].strip()
-                elif line.startswith("REASONING:"):
-                    reasoning = line.split(":", 1)[1].strip()
+            # One finditer pass over the whole reply; a repeated label keeps
+            # the last occurrence, as the old line-by-line loop did.
+            fields = {
+                m.group(1).upper(): m.group(2)
+                for m in _RELEVANCE_FIELD_RE.finditer(response)
+            }
+            relevance_level = fields.get("RELEVANCE", "NOT_RELEVANT").upper()
+            confidence = fields.get("CONFIDENCE", "LOW")
+            reasoning = fields.get("REASONING", "Unable to parse reasoning")
 
             # Convert to boolean and numeric score
-            is_relevant = relevance_level in ["HIGHLY_RELEVANT", "RELEVANT", "SOMEWHAT_RELEVANT"]
+            is_relevant = relevance_level in _RELEVANT_LEVELS
 
             # Semantic score based on relevance level
-            score_map = {
-                "HIGHLY_RELEVANT": 0.9,
-                "RELEVANT": 0.7,
-                "SOMEWHAT_RELEVANT": 0.5,
-                "NOT_RELEVANT": 0.1
-            }
-            semantic_score = score_map.get(relevance_level, 0.0)
+            semantic_score = _SEMANTIC_SCORE_MAP.get(relevance_level, 0.0)
 
             confidence_value = _parse_confidence(confidence)
 
@@ -349,7 +682,6 @@ REASONING: [2-3 sentences explaining the semantic connection or lack thereof]"""
             text = text.strip().lower()
             if "none" in text and not any(ch.isdigit() for ch in text):
                 return [False] * len(candidates)
-            import re
             selected = {int(n) for n in re.findall(r"\d+", text) if 1 <= int(n) <= len(candidates)}
             return [i + 1 in selected for i in range(len(candidates))]
         except Exception as exc:
@@ -5,6 +5,7 @@ Report Agent - Generates final literature review reports.
 from collections import Counter
 from typing import List, Optional
 from datetime import datetime
+from urllib.parse import quote_plus
 
 from ..storage.models.agent_models import (
     LiteratureReviewReport, ReportMetadata, AnalysisResult,
@@ -117,7 +118,7 @@ This review analyzed **{analysis_result.total_papers} papers** on the topic of "
 """
         
         for i, summary in enumerate(analysis_result.summaries, 1):
-            connected_papers = summary.connected_papers_url or f"https://www.connectedpapers.com/search?q={summary.title.replace(' ', '%20')}"
+            connected_papers = summary.connected_papers_url or f"https://www.connectedpapers.com/search?q={quote_plus(summary.title)}"
             
             content += f"""### {i}. {summary.title}
 
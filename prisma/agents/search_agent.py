@@ -11,11 +11,15 @@ rating), deduplication, and result aggregation.
 """
 
 import logging
-from typing import Dict, List
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
 
-from ..integrations.sources import Source, build_sources
-from ..utils.text import significant_words
+from ..integrations.sources import Source, SourceSearchResult, build_sources
+from ..utils.text import normalize_title, significant_words
 
 from ..storage.models.agent_models import SearchResult, PaperMetadata, BookMetadata
 from ..storage.models.source_quality import (
@@ -26,6 +30,22 @@ from ..storage.models.source_quality import (
 
 logger = logging.getLogger(__name__)
 
+# Per-source result cache, process-wide so it outlives the short-lived
+# SearchAgent instances callers build per request/stream run. Iterative
+# research re-issues the same query within minutes, and every miss is a
+# multi-second, rate-limited API round-trip. Keyed on (source, query,
+# published_after); an entry fetched with a larger `limit` also serves
+# smaller ones. TTL is per source: arXiv/PubMed metadata for a given query
+# barely moves within a day, catalogues like Google Books churn faster.
+_RESULT_CACHE_MAX = 256
+_RESULT_CACHE_DEFAULT_TTL_S = 3600.0
+_RESULT_CACHE_TTL_S = {
+    "arxiv": 24 * 3600.0,
+    "pubmed": 24 * 3600.0,
+}
+_result_cache: OrderedDict[tuple, tuple[float, int, SourceSearchResult]] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
 
 class SearchAgent:
     """Search for academic papers and books across multiple quality-rated sources."""
@@ -98,55 +118,78 @@ class SearchAgent:
         """
         if sources is None:
             sources = list(self.default_sources)
+        # Registry key and quality resolved once per source up front, not
+        # re-derived (.lower(), registry lookup) at every use below
+        qualities = {source: get_source_quality(source) for source in sources}
         if self.prefer_high_quality:
-            sources = sorted(sources, key=lambda s: get_source_quality(s).value, reverse=True)
+            sources = sorted(sources, key=lambda s: qualities[s].value, reverse=True)
             logger.info("Searching sources by quality: %s", sources)
+        keys = [source.lower() for source in sources]
 
-        all_papers = []
         all_books = []
-        source_stats = {}
-
-        for source in sources:
-            source_quality = get_source_quality(source)
-            print(f"[INFO] Searching {source} (Quality: {source_quality.value}⭐)")
-
-            source_stats[source] = {
-                'quality': source_quality.value,
-                'papers_found': 0,
-                'books_found': 0,
-                'rejected': 0
-            }
-
-            papers_before = len(all_papers)
+        # Cross-source dedup runs as each source is folded in, so the
+        # paper budget below counts unique papers, not duplicates
+        deduper = _PaperDeduper(self._STEM_DEDUP_THRESHOLD)
+        # Per-source stats as parallel lists indexed like `sources`
+        quality: List[int] = []
+        papers_found: List[int] = []
+        books_found: List[int] = []
+        rejected_counts: List[int] = []
+
+        # Every source is network-bound and owns its own RateLimiter, so
+        # they're fetched concurrently -- a search now takes as long as its
+        # slowest source rather than the sum of all of them. Results are
+        # still folded in below in `sources` order, so quality-first
+        # prioritization and dedup's first-seen-wins behave exactly as
+        # they did with the old sequential loop.
+        with ThreadPoolExecutor(max_workers=max(1, len(sources))) as pool:
+            fetched = list(pool.map(
+                lambda key: self._fetch_source(key, query, limit, published_after),
+                keys,
+            ))
+
+        # Only the first `limit` unique papers survive to the result, in
+        # source-quality order, and dedup is first-seen-wins -- so once
+        # `limit` unique papers have been accepted, lower-priority
+        # sources' papers can't change the outcome and aren't worth
+        # validating and scoring. Duplicates don't count toward it.
+        for source, key, result in zip(sources, keys, fetched):
+            source_quality = qualities[source]
+            logger.debug("folding in %s (quality %d)", source, source_quality.value)
+
+            papers_before = len(deduper.unique)
             books_before = len(all_books)
+            rejected = 0
 
-            src = self._sources.get(source.lower())
-            if src is not None:
-                result = src.search(query, limit, published_after=published_after)
-                validated_papers, rejected = self._validate_papers(result.papers, source_quality)
-                all_papers.extend(validated_papers)
+            if result is not None:
+                _, rejected = self._validate_papers(
+                    result.papers, source_quality,
+                    max_accept=limit - len(deduper.unique), keep=deduper.add,
+                )
                 all_books.extend(result.books)
-                source_stats[source]['rejected'] = rejected
-            elif source.lower() == 'zotero':
+            elif key == 'zotero':
                 # Zotero isn't a discovery Source (integrations/sources/) --
                 # it's the bookmark layer, searched separately in research
                 # streams via the Zotero Web API, not here.
-                print(f"[INFO] Zotero search - used for caching/deduplication")
+                logger.debug("zotero is searched by research streams, not here -- skipping")
             else:
-                print(f"[WARNING] Source '{source}' not yet implemented")
+                logger.warning("source %r not yet implemented, skipping", source)
 
             # Update statistics
-            source_stats[source]['papers_found'] = len(all_papers) - papers_before
-            source_stats[source]['books_found'] = len(all_books) - books_before
+            quality.append(source_quality.value)
+            papers_found.append(len(deduper.unique) - papers_before)
+            books_found.append(len(all_books) - books_before)
+            rejected_counts.append(rejected)
 
-        # Remove duplicates and limit results
-        unique_papers = self._deduplicate_papers(all_papers)
+        unique_papers = deduper.unique
         unique_books = self._deduplicate_books(all_books)
         limited_papers = unique_papers[:limit]
         limited_books = unique_books[:limit]
 
-        # Print quality summary
-        self._print_quality_summary(source_stats, len(limited_papers), len(limited_books))
+        self._log_quality_summary(
+            sources, quality, papers_found, books_found, rejected_counts,
+            len(limited_papers), len(limited_books),
+        )
 
         return SearchResult(
             papers=limited_papers,
@@ -157,7 +200,51 @@ class SearchAgent:
             timestamp=datetime.now()
         )
 
-    def _validate_papers(self, papers: List[PaperMetadata], source_quality) -> tuple[List[PaperMetadata], int]:
+    def _fetch_source(
+        self,
+        name: str,
+        query: str,
+        limit: int,
+        published_after: datetime | None,
+    ) -> Optional[SourceSearchResult]:
+        """One source's raw results, or None if `name` (a lower-cased
+        registry key) isn't a wired-up Source. Safe to run on a worker thread: Source.search() never
+        raises, each source's RateLimiter is thread-safe, and the result
+        cache is lock-guarded. Served from _result_cache when a fresh
+        entry fetched with at least `limit` items exists."""
+        src = self._sources.get(name)
+        if src is None:
+            return None
+
+        key = (name, query, published_after)
+        now = time.monotonic()
+        with _result_cache_lock:
+            hit = _result_cache.get(key)
+            if hit is not None:
+                expires, cached_limit, cached = hit
+                if now >= expires:
+                    del _result_cache[key]
+                elif cached_limit >= limit:
+                    _result_cache.move_to_end(key)
+                    return SourceSearchResult(papers=cached.papers[:limit], books=cached.books[:limit])
+
+        result = src.search(query, limit, published_after=published_after)
+        # An empty result is indistinguishable from a source that was down
+        # or rate-limited (Source.search never raises) -- don't pin that
+        # for a whole TTL.
+        if result.papers or result.books:
+            ttl = _RESULT_CACHE_TTL_S.get(name, _RESULT_CACHE_DEFAULT_TTL_S)
+            with _result_cache_lock:
+                _result_cache[key] = (now + ttl, limit, result)
+                _result_cache.move_to_end(key)
+                while len(_result_cache) > _RESULT_CACHE_MAX:
+                    _result_cache.popitem(last=False)
+        return result
+
+    def _validate_papers(
+        self, papers: List[PaperMetadata], source_quality, max_accept: int | None = None,
+        keep: Optional[Callable[[PaperMetadata], bool]] = None,
+    ) -> tuple[List[PaperMetadata], int]:
         """Academic-content validation + confidence scoring, applied
         uniformly to every source's papers (previously only arxiv and
         semanticscholar did this inline, each with its own copy of the
@@ -166,13 +253,25 @@ class SearchAgent:
         paper source is validated the same way, scored against its own
         actual quality rating. Books are never validated -- this always
         was, and still is, papers-only (BookMetadata has no venue/abstract
-        concept validate_academic_content checks)."""
-        if not self.require_academic_validation:
-            return list(papers), 0
+        concept validate_academic_content checks).
+
+        A valid paper for which `keep` returns False (search() passes its
+        deduper's add(), so: a duplicate) is dropped without counting as
+        accepted or rejected. Stops as soon as `max_accept` papers are
+        accepted; papers after that point are neither accepted nor counted
+        as rejected."""
+        if max_accept is not None and max_accept <= 0:
+            return [], 0
 
         accepted: List[PaperMetadata] = []
         rejected = 0
         for paper in papers:
+            if max_accept is not None and len(accepted) >= max_accept:
+                break
+            if not self.require_academic_validation:
+                if keep is None or keep(paper):
+                    accepted.append(paper)
+                continue
             is_valid, reasons = validate_academic_content(
                 title=paper.title,
                 authors=paper.authors,
@@ -191,12 +290,15 @@ class SearchAgent:
                 abstract=paper.abstract,
                 venue=paper.journal or "",
                 source_quality=source_quality,
+                criteria=self.validation_criteria,
             )
             if confidence < self.min_confidence_score:
                 logger.debug("%s paper low confidence: %.2f", paper.source, confidence)
                 rejected += 1
                 continue
 
+            if keep is not None and not keep(paper):
+                continue
             logger.debug("%s paper accepted with confidence: %.2f", paper.source, confidence)
             accepted.append(paper)
         return accepted, rejected
@@ -211,52 +313,15 @@ class SearchAgent:
         Priority:
           1. arxiv_id (arxiv preprint identifier — globally unique for arxiv papers)
           2. DOI (globally unique for published papers)
-          3. Exact normalized title
-          4. NLTK stem overlap >= threshold (same paper, different API title)
+          3. Exact normalized title (case/punctuation/whitespace-insensitive)
+          4. NLTK stem overlap >= threshold (same paper, different API title),
+             looked up through an inverted stem index
 
         No LLM used here — duplicates within a single run are near-certain
         when any of these signals fire.
         """
-        if not papers:
-            return []
-
-        seen_arxiv: set[str] = set()
-        seen_doi: set[str] = set()
-        seen_title: set[str] = set()
-        seen_stems: list[frozenset[str]] = []
-        unique: list[PaperMetadata] = []
-
-        for paper in papers:
-            # arxiv_id dedup
-            arxiv_id = getattr(paper, "arxiv_id", None)
-            if arxiv_id and arxiv_id in seen_arxiv:
-                continue
-            # DOI dedup
-            doi = getattr(paper, "doi", None)
-            if doi and doi.lower().strip() in seen_doi:
-                continue
-            # Exact title dedup
-            title_key = paper.title.lower().strip()
-            if title_key in seen_title:
-                continue
-            # NLTK stem overlap dedup
-            stems = significant_words(paper.title)
-            is_dup = any(
-                len(stems & existing) >= self._STEM_DEDUP_THRESHOLD
-                for existing in seen_stems
-            )
-            if is_dup:
-                continue
-
-            if arxiv_id:
-                seen_arxiv.add(arxiv_id)
-            if doi:
-                seen_doi.add(doi.lower().strip())
-            seen_title.add(title_key)
-            seen_stems.append(stems)
-            unique.append(paper)
-
-        return unique
+        deduper = _PaperDeduper(self._STEM_DEDUP_THRESHOLD)
+        return [paper for paper in papers if deduper.add(paper)]
 
     def _deduplicate_books(self, books: List[BookMetadata]) -> List[BookMetadata]:
         """Remove duplicate books based on title and ISBN similarity."""
@@ -268,7 +333,7 @@ class SearchAgent:
 
         for book in books:
             # Create a unique key from title and ISBN (if available)
-            title_key = book.title.lower().strip()
+            title_key = normalize_title(book.title) or book.title.lower().strip()
             isbn_key = book.isbn_13 or book.isbn_10 or ""
             book_key = f"{title_key}|{isbn_key}"
 
@@ -278,14 +343,75 @@ class SearchAgent:
 
         return unique_books
 
-    def _print_quality_summary(self, source_stats: Dict, total_papers: int, total_books: int):
-        """Print summary of search results by source quality"""
-        print(f"\n📊 Search Quality Summary:")
-        print(f"   Total Results: {total_papers} papers, {total_books} books")
-        print(f"   Sources Used:")
-
-        for source, stats in source_stats.items():
-            if stats['papers_found'] + stats['books_found'] > 0:
-                quality_stars = "⭐" * stats['quality']
-                print(f"   • {source}: {quality_stars} - {stats['papers_found']}P + {stats['books_found']}B")
-        print()
+    def _log_quality_summary(
+        self,
+        sources: List[str],
+        quality: List[int],
+        papers_found: List[int],
+        books_found: List[int],
+        rejected_counts: List[int],
+        total_papers: int,
+        total_books: int,
+    ):
+        """Log a summary of search results by source quality at INFO. The
+        per-source lists are parallel, indexed like `sources`. Skipped
+        entirely, formatting included, when INFO is filtered out."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info("search quality summary: %d papers, %d books", total_papers, total_books)
+        for source, stars, n_papers, n_books, n_rejected in zip(
+            sources, quality, papers_found, books_found, rejected_counts,
+        ):
+            if n_papers + n_books > 0:
+                logger.info(
+                    "  %s: %s - %dP + %dB (%d rejected)", source, "⭐" * stars, n_papers, n_books, n_rejected,
+                )
+
+
+class _PaperDeduper:
+    """SearchAgent._deduplicate_papers()'s checks, applied one paper at a
+    time: add() keeps a paper and returns True unless it duplicates one
+    already kept. Lets search() dedup each source's papers as it folds
+    them in, so its paper budget counts unique papers."""
+
+    def __init__(self, stem_threshold: int):
+        self._stem_threshold = stem_threshold
+        self._seen_arxiv: set[str] = set()
+        self._seen_doi: set[str] = set()
+        self._seen_title: set[str] = set()
+        # Inverted index stem -> ids of kept papers carrying it, so the
+        # overlap check only ever counts against papers that share at least
+        # one stem instead of rescanning every kept paper (O(n^2)).
+        self._stem_index: defaultdict[str, list[int]] = defaultdict(list)
+        self.unique: list[PaperMetadata] = []
+
+    def add(self, paper: PaperMetadata) -> bool:
+        # arxiv_id dedup
+        arxiv_id = getattr(paper, "arxiv_id", None)
+        if arxiv_id and arxiv_id in self._seen_arxiv:
+            return False
+        # DOI dedup
+        doi = getattr(paper, "doi", None)
+        if doi and doi.lower().strip() in self._seen_doi:
+            return False
+        # Exact normalized-title dedup (punctuation/spacing differ by API)
+        title_key = normalize_title(paper.title) or paper.title.lower().strip()
+        if title_key in self._seen_title:
+            return False
+        # NLTK stem overlap dedup -- a title with fewer stems than the
+        # threshold can never reach it, so skip the lookup entirely
+        stems = significant_words(paper.title)
+        if len(stems) >= self._stem_threshold:
+            shared = Counter(i for stem in stems for i in self._stem_index.get(stem, ()))
+            if shared and shared.most_common(1)[0][1] >= self._stem_threshold:
+                return False
+
+        if arxiv_id:
+            self._seen_arxiv.add(arxiv_id)
+        if doi:
+            self._seen_doi.add(doi.lower().strip())
+        self._seen_title.add(title_key)
+        for stem in stems:
+            self._stem_index[stem].append(len(self.unique))
+        self.unique.append(paper)
+        return True
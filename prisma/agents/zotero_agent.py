@@ -7,15 +7,77 @@ and retrieving papers from Zotero collections for analysis.
 """
 
 import logging
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future
+from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator
 
 from ..utils.config import ZoteroConfig
-from ..integrations.zotero import ZoteroClientError
-from ..storage.models import ZoteroItem, ZoteroCollection, ZoteroItemType
+from ..integrations.zotero import ZoteroClient, ZoteroClientError
+from ..integrations.zotero.client import ZoteroAPIConfig
+from ..storage.models import ZoteroItem, ZoteroCollection, ZoteroItemType, ACADEMIC_ITEM_TYPES
+from ..utils.text import content_hash
 
 logger = logging.getLogger(__name__)
 
+# search_papers() results, keyed by (library_id, criteria hash, library
+# version). The version is part of the key, so any change to the library
+# invalidates every entry at once -- old entries just age out of the LRU.
+# The version itself is reused for up to _VERSION_MAX_AGE seconds, so
+# edits made outside Prisma can be served stale for that long. Process
+# memory only: the version check already saves the payload transfer and
+# the per-item model conversion, so there's nothing to gain from writing result sets
+# out. The collections list and the item mirror below are different --
+# they are what give a new process something to revalidate or sync
+# from -- so they're kept under ~/.cache/prisma too. Both are disposable
+# caches, safe to delete at any time (clear_cache() does); the vault is
+# still the only place Prisma keeps data of its own.
+_ITEM_CACHE_MAX = 128
+# How stale a library version may be when keying a lookup: within this
+# window a warm-cache hit costs no request at all. Prisma's own writes
+# invalidate it immediately (see ZoteroClient.get_library_version), so
+# only edits made outside Prisma can take this long to show up.
+_VERSION_MAX_AGE = 30.0
+_item_cache: "OrderedDict[Tuple[str, str, int], List[ZoteroItem]]" = OrderedDict()
+_item_cache_lock = threading.Lock()
+
+# Identical searches already running, keyed by (library_id, criteria hash).
+# Concurrent reviews in one process (each coordinator's per-paper
+# duplicate check) can ask the same question at once; a caller that finds
+# its search here waits on the running one's Future instead of issuing its
+# own requests against Zotero's rate limit.
+_inflight: Dict[Tuple[str, str], "Future[List[ZoteroItem]]"] = {}
+_inflight_lock = threading.Lock()
+
+_VALID_ITEM_TYPES = frozenset(item_type.value for item_type in ZoteroItemType)
+
+
+def _collections_cache_path(library_id: str) -> Path:
+    return Path.home() / ".cache" / "prisma" / f"zotero_collections_{library_id}.json"
+
+
+class _CachedCollections(BaseModel):
+    """On-disk form of ZoteroAgent's collections cache: the library
+    version the list was fetched at, plus the list itself."""
+    version: int
+    collections: List[ZoteroCollection]
+
+
+def _items_mirror_path(library_id: str) -> Path:
+    return Path.home() / ".cache" / "prisma" / f"zotero_items_{library_id}.json"
+
+
+class _CachedItems(BaseModel):
+    """On-disk form of ZoteroAgent's incremental library mirror (see
+    sync_library()): the library version it is current to, plus every
+    item. Written without each item's raw_data -- the parsed fields are
+    all the mirror's searches read, and the raw API payload would roughly
+    double the file for nothing (items loaded back have raw_data={})."""
+    version: int
+    items: List[ZoteroItem]
+
 
 class ZoteroSearchCriteria(BaseModel):
     """Search criteria for Zotero agent with validation"""
@@ -24,6 +86,14 @@ class ZoteroSearchCriteria(BaseModel):
     item_types: List[str] = Field(default_factory=list, description="Item types to include")
     tags: List[str] = Field(default_factory=list, description="Tags to filter by")
     date_range: Optional[Tuple[int, int]] = Field(None, description="Date range as (start_year, end_year)")
+    incremental: bool = Field(
+        False,
+        description=(
+            "Answer from the locally mirrored library, synced with since=<version> "
+            "so only changed items are fetched (see ZoteroAgent.sync_library). "
+            "Ignored for `query` searches, which need Zotero's full-text index."
+        ),
+    )
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of results")
     
     @field_validator('item_types')
@@ -31,10 +101,9 @@ class ZoteroSearchCriteria(BaseModel):
     def validate_item_types(cls, v):
         if v is None:
             return v
-        valid_types = [item_type.value for item_type in ZoteroItemType]
-        for item_type in v:
-            if item_type not in valid_types:
-                raise ValueError(f'item_type "{item_type}" not in valid types: {valid_types}')
+        invalid = [item_type for item_type in v if item_type not in _VALID_ITEM_TYPES]
+        if invalid:
+            raise ValueError(f'invalid item_types {invalid}; valid types: {sorted(_VALID_ITEM_TYPES)}')
         return v
     
     @field_validator('date_range')
@@ -100,6 +169,8 @@ class ZoteroAgent:
     Zotero data with the Prisma literature review workflow.
     """
     
+    _NAME_MATCHES_MAX = 256
+    
     def __init__(self, config: ZoteroConfig):
         """
         Initialize ZoteroAgent
@@ -113,14 +184,47 @@ class ZoteroAgent:
         if not config.api_key or not config.library_id:
             raise ValueError("ZoteroConfig must have api_key and library_id for API access")
         
-        # Create a simplified client using just the zotero config for now
-        # TODO: Update to use proper unified client with full Prisma config
-        self.config = config
-        self.client = None  # Will be initialized when needed
-        self._collections_cache: Optional[List[ZoteroCollection]] = None
+        # Built on first use by the client property -- constructing it opens
+        # pyzotero's HTTP connection pool, which an agent that never talks
+        # to Zotero (the coordinator's, when nothing gets saved) shouldn't pay
+        self._client: Optional[ZoteroClient] = None
+        self._collections_cache: Optional[Tuple[int, List[ZoteroCollection]]] = None
+        # find_collections_by_name()'s lookup state, derived from one
+        # specific collections list and rebuilt whenever that list changes
+        self._name_index_source: Optional[List[ZoteroCollection]] = None
+        self._names_lower: List[Tuple[str, ZoteroCollection]] = []
+        self._name_matches: Dict[str, List[ZoteroCollection]] = {}
+        # get_library_summary()'s last result, by library version, and its
+        # collections section, by the collections list it was built from
+        self._summary_cache: Optional[Tuple[int, ZoteroLibrarySummary]] = None
+        self._summary_collections: Tuple[Optional[List[ZoteroCollection]], List[ZoteroCollectionSummary]] = (None, [])
+        self._items_mirror: Optional[Tuple[int, List[ZoteroItem]]] = None
+        self._mirror_postings_source: Optional[Tuple[int, List[ZoteroItem]]] = None
+        self._mirror_postings_cache = None
         
         logger.info(f"Initialized ZoteroAgent for {config.library_type} library {config.library_id}")
     
+    @property
+    def client(self) -> ZoteroClient:
+        """The Zotero Web API client, built from the config on first access."""
+        if self._client is None:
+            self._client = ZoteroClient(ZoteroAPIConfig(
+                api_key=self.config.resolve_api_key() or "",
+                library_id=self.config.resolve_library_id() or "",
+                library_type=self.config.library_type,
+            ))
+        return self._client
+
+    @client.setter
+    def client(self, client: ZoteroClient) -> None:
+        self._client = client
+
+    def close(self) -> None:
+        """Release the client's connection pool, if one was ever opened."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
     def test_connection(self) -> bool:
         """Test Zotero connection"""
         return self.client.test_connection()
@@ -129,25 +233,63 @@ class ZoteroAgent:
         """
         Get all collections in the library
         
+        The list is cached with the library version it was fetched at, in
+        memory and on disk, so a new session starts from the last known
+        list too. A refresh -- and the first call after reading the list
+        from disk -- asks Zotero whether the library has changed since that
+        version and only refetches the collections if it has.
+        
         Args:
-            refresh_cache: Whether to refresh the collections cache
+            refresh_cache: Whether to revalidate the cache against Zotero
             
         Returns:
             List of ZoteroCollection objects
         """
-        if self._collections_cache is None or refresh_cache:
-            try:
-                collection_data = self.client.get_collections()
-                self._collections_cache = [
-                    ZoteroCollection.from_zotero_data(data) 
-                    for data in collection_data
-                ]
-                logger.info(f"Loaded {len(self._collections_cache)} collections")
-            except ZoteroClientError as e:
-                logger.error(f"Failed to load collections: {e}")
-                return []
-        
-        return self._collections_cache or []
+        if self._collections_cache is None:
+            self._collections_cache = self._load_collections_cache()
+            # A list read back from disk can be from any earlier session:
+            # check it against Zotero once before this agent trusts it.
+            refresh_cache = refresh_cache or self._collections_cache is not None
+        if self._collections_cache is not None and not refresh_cache:
+            return self._collections_cache[1]
+
+        cached_version = self._collections_cache[0] if self._collections_cache else None
+        try:
+            fetched = self.client.get_collections_if_modified(cached_version)
+        except ZoteroClientError as e:
+            logger.error(f"Failed to load collections: {e}")
+            return self._collections_cache[1] if self._collections_cache else []
+
+        if fetched is None:
+            logger.debug("Collections cache still current at library version %s", cached_version)
+        else:
+            self._collections_cache = fetched
+            self._save_collections_cache()
+            logger.info(f"Loaded {len(fetched[1])} collections")
+        return self._collections_cache[1]
+
+    def _load_collections_cache(self) -> Optional[Tuple[int, List[ZoteroCollection]]]:
+        path = _collections_cache_path(self.config.library_id)
+        try:
+            cached = _CachedCollections.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable collections cache %s: %s", path, e)
+            return None
+        return cached.version, cached.collections
+
+    def _save_collections_cache(self) -> None:
+        version, collections = self._collections_cache
+        path = _collections_cache_path(self.config.library_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                _CachedCollections(version=version, collections=collections).model_dump_json(by_alias=True),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.warning("Could not write collections cache %s: %s", path, e)
     
     def find_collections_by_name(self, name_pattern: str) -> List[ZoteroCollection]:
         """
@@ -160,82 +302,296 @@ class ZoteroAgent:
             List of matching collections
         """
         collections = self.get_collections()
+        if collections is not self._name_index_source:
+            # Lower-case every name once per collections list rather than
+            # once per name per lookup, and forget answers about the old list
+            self._name_index_source = collections
+            self._names_lower = [(c.name.lower(), c) for c in collections]
+            self._name_matches = {}
         name_lower = name_pattern.lower()
         
-        matching = [
-            collection for collection in collections
-            if name_lower in collection.name.lower()
-        ]
+        matching = self._name_matches.get(name_lower)
+        if matching is None:
+            matching = [c for lowered, c in self._names_lower if name_lower in lowered]
+            if len(self._name_matches) >= self._NAME_MATCHES_MAX:
+                self._name_matches.clear()
+            self._name_matches[name_lower] = matching
         
         logger.info(f"Found {len(matching)} collections matching '{name_pattern}'")
-        return matching
+        return list(matching)
     
     def search_papers(self, criteria: ZoteroSearchCriteria) -> List[ZoteroItem]:
         """
         Search for papers based on criteria
         
+        Results are cached per criteria and library version (see
+        _item_cache), so repeating a search against an unchanged library
+        costs one version check instead of a full fetch, and a search
+        identical to one already running waits for that one's result (see
+        _inflight).
+        
         Args:
             criteria: ZoteroSearchCriteria object defining search parameters
             
         Returns:
             List of ZoteroItem objects matching criteria
         """
+        criteria_hash = content_hash(criteria.model_dump_json())
+        inflight_key = (self.config.library_id, criteria_hash)
+        with _inflight_lock:
+            running = _inflight.get(inflight_key)
+            if running is None:
+                future: "Future[List[ZoteroItem]]" = Future()
+                _inflight[inflight_key] = future
+        if running is not None:
+            logger.debug("Joining identical in-flight Zotero search")
+            return list(running.result())
+
+        try:
+            papers = self._search_papers(criteria, criteria_hash)
+            future.set_result(papers)
+            return list(papers)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                del _inflight[inflight_key]
+
+    def _search_papers(self, criteria: ZoteroSearchCriteria, criteria_hash: str) -> List[ZoteroItem]:
+        try:
+            version = self.client.get_library_version(max_age=_VERSION_MAX_AGE)
+        except ZoteroClientError as e:
+            logger.debug("Library version unavailable, searching uncached: %s", e)
+            version = None
+
+        key = None
+        if version is not None:
+            key = (self.config.library_id, criteria_hash, version)
+            with _item_cache_lock:
+                hit = _item_cache.get(key)
+                if hit is not None:
+                    _item_cache.move_to_end(key)
+                    logger.debug("Serving %d cached papers at library version %s", len(hit), version)
+                    return hit
+
         papers = []
+        # Item types go to Zotero as an itemType filter, so `limit` counts
+        # matching items rather than being spent on ones dropped below.
+        # Tags stay client-side: criteria.tags match case-insensitively,
+        # which Zotero's exact `tag=` match doesn't. The API has no year
+        # filter either, but a library-wide date range is read in date
+        # order and cut off at its start year, so it needs no second pass.
+        item_types = criteria.item_types or None
+        use_mirror = criteria.incremental and not criteria.query
+        filters = criteria
         
         try:
+            # Incremental searches are answered from the synced mirror
+            if use_mirror:
+                papers = self._search_mirror(criteria, version)
+            
             # If specific collections are requested
-            if criteria.collections:
-                for collection_key in criteria.collections:
-                    items = self.client.get_collection_items(collection_key)
-                    papers.extend([ZoteroItem.from_zotero_data(item) for item in items])
+            elif criteria.collections:
+                papers.extend(self.client.get_items_in_collections(
+                    criteria.collections, limit=criteria.limit, item_types=item_types,
+                ))
             
             # If query search is requested
             elif criteria.query:
-                items = self.client.search_items(criteria.query, limit=criteria.limit)
-                papers.extend([ZoteroItem.from_zotero_data(item) for item in items])
+                papers.extend(self.client.search_items(criteria.query, limit=criteria.limit, item_types=item_types))
+            
+            # Date range over the whole library (get_recent_papers())
+            elif criteria.date_range:
+                start_year, end_year = criteria.date_range
+                papers.extend(self.client.get_items_in_year_range(
+                    start_year, end_year, limit=criteria.limit, item_types=item_types,
+                ))
+                filters = criteria.model_copy(update={"date_range": None})
             
             # Otherwise get all items
             else:
-                items = self.client.get_items(limit=criteria.limit)
-                papers.extend([ZoteroItem.from_zotero_data(item) for item in items])
+                papers.extend(self.client.get_items(limit=criteria.limit, item_types=item_types))
             
-            # Apply additional filters
-            papers = self._apply_filters(papers, criteria)
+            # Apply additional filters (the mirror path already has)
+            if not use_mirror:
+                papers = self._apply_filters(papers, filters)
             
             logger.info(f"Found {len(papers)} papers matching search criteria")
-            return papers
-            
         except ZoteroClientError as e:
             logger.error(f"Failed to search papers: {e}")
             return []
-    
-    def _apply_filters(self, papers: List[ZoteroItem], criteria: ZoteroSearchCriteria) -> List[ZoteroItem]:
-        """Apply additional filtering to papers"""
-        filtered = papers
+
+        if key is not None:
+            with _item_cache_lock:
+                _item_cache[key] = papers
+                _item_cache.move_to_end(key)
+                while len(_item_cache) > _ITEM_CACHE_MAX:
+                    _item_cache.popitem(last=False)
+        return papers
+
+    def _search_mirror(self, criteria: ZoteroSearchCriteria, version: Optional[int]) -> List[ZoteroItem]:
+        """search_papers()'s incremental path: collections, item types,
+        tags and dates all filter the synced mirror locally; the newest
+        `limit` matches (by dateModified, Zotero's own default order)
+        are returned.
         
-        # Filter by item types
-        if criteria.item_types:
-            filtered = [p for p in filtered if p.item_type in criteria.item_types]
-            logger.debug(f"After item type filter: {len(filtered)} papers")
+        Each filter is a union of posting sets from _mirror_postings(),
+        and the filters combine by set intersection -- both done in C --
+        so repeated searches against a large mirror never walk its items
+        in Python. Matches the semantics of _apply_filters() exactly.
+        """
+        self.sync_library(current_version=version)
+        ordered, by_collection, by_type, by_tag, by_year = self._mirror_postings()
         
-        # Filter by tags
+        selected: Optional[set] = None
+        wanted: List[set] = []
+        if criteria.collections:
+            wanted.append(set().union(*(by_collection.get(k, ()) for k in criteria.collections)))
+        if criteria.item_types:
+            wanted.append(set().union(*(by_type.get(t, ()) for t in criteria.item_types)))
         if criteria.tags:
-            tag_set = set(tag.lower() for tag in criteria.tags)
-            filtered = [
-                p for p in filtered
-                if any(tag.tag.lower() in tag_set for tag in p.tags)
-            ]
-            logger.debug(f"After tag filter: {len(filtered)} papers")
-        
-        # Filter by date range
+            wanted.append(set().union(*(by_tag.get(t.lower(), ()) for t in criteria.tags)))
         if criteria.date_range:
             start_year, end_year = criteria.date_range
-            filtered = [
-                p for p in filtered
-                if p.year and start_year <= p.year <= end_year
-            ]
-            logger.debug(f"After date filter: {len(filtered)} papers")
+            wanted.append(set().union(*(
+                positions for year, positions in by_year.items() if start_year <= year <= end_year
+            )))
+        for positions in sorted(wanted, key=len):
+            selected = positions if selected is None else selected & positions
+        
+        if selected is None:
+            return ordered[:criteria.limit]
+        return [ordered[i] for i in sorted(selected)[:criteria.limit]]
+
+    def _mirror_postings(self):
+        """Posting sets over the mirror, newest-modified first: positions
+        into that ordering per collection key, item type, lower-cased tag
+        and year. Built once per mirror state -- a sync that changes
+        anything replaces self._items_mirror, which rebuilds them."""
+        if self._mirror_postings_source is not self._items_mirror:
+            ordered = sorted(self._items_mirror[1], key=lambda p: p.date_modified or "", reverse=True)
+            by_collection: Dict[str, set] = defaultdict(set)
+            by_type: Dict[str, set] = defaultdict(set)
+            by_tag: Dict[str, set] = defaultdict(set)
+            by_year: Dict[int, set] = defaultdict(set)
+            for pos, p in enumerate(ordered):
+                for key in p.collections:
+                    by_collection[key].add(pos)
+                by_type[p.item_type].add(pos)
+                for tag in p.tags:
+                    by_tag[tag.tag_lower].add(pos)
+                year = p.year
+                if year:
+                    by_year[year].add(pos)
+            self._mirror_postings_source = self._items_mirror
+            self._mirror_postings_cache = (ordered, by_collection, by_type, by_tag, by_year)
+        return self._mirror_postings_cache
+
+    def sync_library(self, current_version: Optional[int] = None) -> List[ZoteroItem]:
+        """
+        Bring the local library mirror up to date and return every item
+        
+        The mirror is kept in memory and in
+        ~/.cache/prisma/zotero_items_<library_id>.json with the library
+        version it is current to. Each sync asks Zotero only for items
+        changed (and deleted) since that version, so a mostly static
+        library costs a near-empty response instead of a full download;
+        the first sync fetches everything.
+        
+        Args:
+            current_version: The library version, if the caller already
+                knows it -- a mirror at that version is returned without
+                any request
+        
+        Returns:
+            Every item in the library, as of the sync
+        """
+        if self._items_mirror is None:
+            self._items_mirror = self._load_items_mirror()
+        mirror = self._items_mirror
+        if mirror is not None and current_version is not None and mirror[0] == current_version:
+            return list(mirror[1])
+        
+        since = mirror[0] if mirror is not None else None
+        version, changed, deleted = self.client.get_items_since(since)
+        if mirror is not None and version == mirror[0] and not changed and not deleted:
+            return list(mirror[1])
+        
+        merged = {item.key: item for item in mirror[1]} if mirror is not None else {}
+        for key in deleted:
+            merged.pop(key, None)
+        for item in changed:
+            merged[item.key] = item
+        self._items_mirror = (version, list(merged.values()))
+        self._save_items_mirror()
+        logger.info(f"Library mirror at version {version}: {len(merged)} items")
+        return list(self._items_mirror[1])
+
+    def _load_items_mirror(self) -> Optional[Tuple[int, List[ZoteroItem]]]:
+        path = _items_mirror_path(self.config.library_id)
+        try:
+            cached = _CachedItems.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable library mirror %s: %s", path, e)
+            return None
+        return cached.version, cached.items
+
+    def _save_items_mirror(self) -> None:
+        version, items = self._items_mirror
+        path = _items_mirror_path(self.config.library_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                _CachedItems(version=version, items=items).model_dump_json(
+                    by_alias=True, exclude={"items": {"__all__": {"raw_data"}}},
+                ),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.warning("Could not write library mirror %s: %s", path, e)
+
+    def clear_cache(self) -> None:
+        """Drop this library's cached search results, collections list,
+        summary and item mirror, so the next calls go back to Zotero."""
+        with _item_cache_lock:
+            for key in [k for k in _item_cache if k[0] == self.config.library_id]:
+                del _item_cache[key]
+        self._collections_cache = None
+        self._summary_cache = None
+        self._items_mirror = None
+        _collections_cache_path(self.config.library_id).unlink(missing_ok=True)
+        _items_mirror_path(self.config.library_id).unlink(missing_ok=True)
+    
+    def _apply_filters(self, papers: List[ZoteroItem], criteria: ZoteroSearchCriteria) -> List[ZoteroItem]:
+        """Apply additional filtering to papers
+        
+        One pass over the papers with every filter's lookup set built up
+        front, cheapest test first -- each paper's tags are compared via
+        their precomputed tag_lower, and the date-parsing `year` property
+        is only evaluated for papers that survive the other two.
+        """
+        item_types = set(criteria.item_types) if criteria.item_types else None
+        tag_set = {tag.lower() for tag in criteria.tags} if criteria.tags else None
+        date_range = criteria.date_range
+        if item_types is None and tag_set is None and date_range is None:
+            return papers
         
+        filtered = []
+        for p in papers:
+            if item_types is not None and p.item_type not in item_types:
+                continue
+            if tag_set is not None and not any(tag.tag_lower in tag_set for tag in p.tags):
+                continue
+            if date_range is not None:
+                year = p.year
+                if not year or not date_range[0] <= year <= date_range[1]:
+                    continue
+            filtered.append(p)
+        
+        logger.debug(f"After filters: {len(filtered)} of {len(papers)} papers")
         return filtered
     
     def get_academic_papers(self, limit: int = 100) -> List[ZoteroItem]:
@@ -249,12 +605,7 @@ class ZoteroAgent:
             List of academic papers
         """
         criteria = ZoteroSearchCriteria(
-            item_types=[
-                ZoteroItemType.JOURNAL_ARTICLE.value,
-                ZoteroItemType.CONFERENCE_PAPER.value,
-                ZoteroItemType.PREPRINT.value,
-                ZoteroItemType.THESIS.value
-            ],
+            item_types=sorted(ACADEMIC_ITEM_TYPES),
             limit=limit
         )
         
@@ -276,7 +627,8 @@ class ZoteroAgent:
             limit=limit
         )
         
-        # Also search in collections that might contain the topic
+        # Also search in collections that might contain the topic (a cache
+        # lookup once get_collections() has run, so no extra round trip)
         relevant_collections = self.find_collections_by_name(topic)
         if relevant_collections:
             collection_keys = [c.key for c in relevant_collections[:3]]  # Limit to top 3
@@ -311,30 +663,56 @@ class ZoteroAgent:
         """
         Get a summary of the Zotero library
 
+        Repeated calls against an unchanged library (a polling status
+        panel) return the previous summary after one version check.
+
         Returns:
             ZoteroLibrarySummary with library statistics and information
         """
         try:
-            collections = self.get_collections()
+            version = self.client.get_library_version()
+        except ZoteroClientError as e:
+            logger.debug("Library version unavailable, rebuilding summary: %s", e)
+            version = None
+        if version is not None and self._summary_cache and self._summary_cache[0] == version:
+            return self._summary_cache[1].model_copy()
+
+        try:
+            # Not worth overlapping with the sample fetch below: while the
+            # library version matches the cached list's, the collections
+            # come from that cache without touching the network, and the
+            # pyzotero object behind self.client isn't safe to drive from
+            # two threads at once. Once the version has moved on, the list
+            # is revalidated along with everything else in the summary.
+            collections = self.get_collections(refresh_cache=(
+                version is not None
+                and self._collections_cache is not None
+                and self._collections_cache[0] != version
+            ))
             
             # Get a sample of items to analyze
-            sample_items = self.client.get_items(limit=50)
-            items = [ZoteroItem.from_zotero_data(item) for item in sample_items]
+            items = self.client.get_items(limit=50)
             
-            # Analyze item types
+            # Analyze item types -- academic papers are counted from the
+            # type histogram afterwards, not re-checked per item
             item_types = {}
-            academic_papers = 0
             years = []
             
             for item in items:
                 item_types[item.item_type] = item_types.get(item.item_type, 0) + 1
-                if item.is_academic_paper:
-                    academic_papers += 1
-                if item.year:
-                    years.append(item.year)
+                year = item.year
+                if year:
+                    years.append(year)
             
+            academic_papers = sum(item_types.get(t, 0) for t in ACADEMIC_ITEM_TYPES)
             year_range = (min(years), max(years)) if years else None
 
+            if self._summary_collections[0] is not collections:
+                self._summary_collections = (collections, [
+                    ZoteroCollectionSummary(key=c.key, name=c.name, parent=c.parent_collection)
+                    for c in collections
+                ])
+
             summary = ZoteroLibrarySummary(
                 library_id=self.config.library_id,
                 library_type=self.config.library_type,
@@ -343,11 +721,10 @@ class ZoteroAgent:
                 academic_papers_in_sample=academic_papers,
                 item_types=item_types,
                 year_range=year_range,
-                collections=[
-                    ZoteroCollectionSummary(key=c.key, name=c.name, parent=c.parent_collection)
-                    for c in collections
-                ],
+                collections=list(self._summary_collections[1]),
             )
+            if version is not None:
+                self._summary_cache = (version, summary.model_copy())
 
             logger.info(f"Generated library summary: {summary.collections_count} collections, "
                        f"{summary.sample_items_count} items sampled")
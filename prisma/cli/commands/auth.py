@@ -11,8 +11,6 @@ import getpass
 
 import click
 
-from prisma.server.auth import hash_password as _hash_password
-
 
 @click.group(name='auth')
 def auth_group():
@@ -33,4 +31,7 @@ def hash_password():
     confirm = getpass.getpass("Confirm password: ")
     if pw != confirm:
         raise click.ClickException("passwords did not match")
+    # Deferred: prisma.server.auth pulls in the config models, jwt and
+    # pydantic, which `prisma --help` and `prisma auth --help` never need.
+    from prisma.server.auth import hash_password as _hash_password
     click.echo(_hash_password(pw))
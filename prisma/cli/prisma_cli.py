@@ -13,8 +13,13 @@ stats/status, syncing the offline pending-write queue — is API-only now
 (see docs/wiki/cli.md's "Moved to the API" section for the exact routes).
 """
 
+import hashlib
+import json
 import os
 import sys
+import time
+from pathlib import Path
+
 import click
 
 from .commands.auth import auth_group
@@ -55,37 +60,88 @@ def _wsl_windows_ip() -> str:
     return '<windows-host-ip>'
 
 
+# Successful network probes (internet, Zotero Web API, Ollama) are reused
+# for this long by the next `prisma status`, so re-running it while fixing
+# something else doesn't pay every round trip again. Failures are never
+# cached -- re-running is how you check that a fix worked.
+_STATUS_CACHE_TTL = 30  # seconds
+
+
+def _status_cache_path() -> Path:
+    return Path.home() / '.cache' / 'prisma' / 'status.json'
+
+
+def _load_status_cache() -> dict:
+    """Probe results from the last run that are still within the TTL,
+    keyed by probe. Wall-clock `checked_at`, since they outlive the
+    process that wrote them."""
+    try:
+        data = json.loads(_status_cache_path().read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    now = time.time()
+    return {
+        key: entry for key, entry in data.items()
+        if isinstance(entry, dict) and 0 <= now - entry.get('checked_at', 0) < _STATUS_CACHE_TTL
+    }
+
+
+def _save_status_cache(cache: dict) -> None:
+    path = _status_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cache), encoding='utf-8')
+    except OSError:
+        pass  # a missing cache only costs the next run its probes
+
+
 @cli.command()
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed status information')
-def status(verbose: bool):
+@click.option('--no-cache', is_flag=True,
+              help=f'Re-run every network probe instead of reusing results from the last {_STATUS_CACHE_TTL}s')
+def status(verbose: bool, no_cache: bool):
     """
     Check Prisma system status and readiness.
 
     Verifies configuration, Zotero connection, dependencies, storage, and LLM.
     """
     import importlib.util
-    import requests as _req
-    from pathlib import Path
 
-    click.echo("🔬 Prisma System Status Check")
-    click.echo("=" * 40)
+    # The report is ~30 lines; collect them and write in one go rather than
+    # a write() per line. flush() also runs before waiting on a probe that
+    # hasn't finished yet, so an interactive run still shows each finished
+    # section while a slow probe is pending.
+    lines: list[str] = []
+    echo = lines.append
 
-    all_good = True
-    wsl = _is_wsl()
+    def flush() -> None:
+        if lines:
+            click.echo("\n".join(lines))
+            lines.clear()
 
-    # 0. Connectivity
-    click.echo("\n🌐 Connectivity:")
-    from ..connectivity import monitor as connectivity
-    if connectivity.is_online:
-        click.echo("  ✅ Internet: reachable")
-    else:
-        click.echo("  ⚠️  Internet: offline (stream updates and reviews unavailable)")
+    def wait_for(probe):
+        if not probe.done():
+            flush()
+        return probe.result()
 
-    # 1. Configuration
+    echo("🔬 Prisma System Status Check")
+    echo("=" * 40)
+
+    all_good = True
+    wsl = _is_wsl()
+    cache = {} if no_cache else _load_status_cache()
+    fresh = {}
+
+    # Everything the network probes need (config, Zotero credentials, the
+    # Ollama host) is resolved first, so that the probes themselves --
+    # internet, Zotero Web API, Ollama, each up to a multi-second timeout
+    # when something is down -- run side by side instead of back to back.
+    # The report below still prints section by section, in order.
     config = None
+    config_error = None
     config_path = None
-    click.echo("\n📋 Configuration:")
-
     default_config = Path.home() / '.config' / 'prisma' / 'config.toml'
     env_config = os.getenv('PRISMA_CONFIG')
 
@@ -95,122 +151,175 @@ def status(verbose: bool):
     elif default_config.exists():
         config_path = default_config
 
-    if config_path is None:
-        click.echo("  ❌ No config file found")
-        click.echo(f"     Expected: {default_config}")
-        click.echo("     Create it:")
-        click.echo("       mkdir -p ~/.config/prisma")
-        click.echo("       cp /path/to/repo/config.example.toml ~/.config/prisma/config.toml")
-        all_good = False
-    else:
+    if config_path is not None:
         try:
             from ..utils.config import ConfigLoader
             config = ConfigLoader()
-            click.echo(f"  ✅ Config loaded: {config_path}")
-            if verbose:
-                click.echo(f"     LLM:    {config.get('llm.provider', 'ollama')} / {config.get('llm.model', 'qwen2.5:7b-32k')}")
-                click.echo(f"     Output: {config.get('output.directory', './outputs')}")
-                click.echo(f"     Zotero: enabled={config.get('sources.zotero.enabled', False)}")
         except Exception as exc:
-            click.echo(f"  ❌ Config error: {exc}")
-            all_good = False
+            config_error = exc
+
+    api_key = library_id = ''
+    library_type = 'user'
+    env_errors = []
+    if config is not None:
+        zconf = config.config.sources.zotero
+        library_type = getattr(zconf, "library_type", "user")
+        try:
+            api_key = zconf.resolve_api_key() or ''
+        except RuntimeError as exc:
+            env_errors.append(str(exc))
+        try:
+            library_id = zconf.resolve_library_id() or ''
+        except RuntimeError as exc:
+            env_errors.append(str(exc))
+    # Keyed by a hash so the API key itself never lands in the cache file.
+    zotero_key = 'zotero:' + hashlib.sha256(
+        f"{api_key}:{library_id}:{library_type}".encode()
+    ).hexdigest()[:16]
+    llm_host = config.get('llm.host', 'localhost:11434') if config is not None else None
+    ollama_key = f'ollama:{llm_host}'
+
+    def _probe_internet() -> bool:
+        from ..connectivity import monitor as connectivity
+        return connectivity.is_online
+
+    def _probe_ollama():
+        import requests as _req  # only on a cache miss -- a cached run never touches the network
+        return _req.get(f"http://{llm_host}/api/tags", timeout=5)
+
+    from concurrent.futures import ThreadPoolExecutor
+    pool = ThreadPoolExecutor(max_workers=3)
+    internet_probe = None if 'internet' in cache else pool.submit(_probe_internet)
+    zotero_probe = None
+    if api_key and library_id and not env_errors and zotero_key not in cache:
+        from ..integrations.zotero.client import check_web_api_reachable
+        zotero_probe = pool.submit(check_web_api_reachable, api_key, library_id, library_type=library_type)
+    ollama_probe = None
+    if llm_host is not None and ollama_key not in cache:
+        ollama_probe = pool.submit(_probe_ollama)
+
+    # 0. Connectivity
+    echo("\n🌐 Connectivity:")
+    online = internet_probe is None or wait_for(internet_probe)
+    if internet_probe is not None and online:
+        fresh['internet'] = {'checked_at': time.time()}
+    if online:
+        echo("  ✅ Internet: reachable")
+    else:
+        echo("  ⚠️  Internet: offline (stream updates and reviews unavailable)")
+
+    # 1. Configuration
+    echo("\n📋 Configuration:")
+    if config_path is None:
+        echo("  ❌ No config file found")
+        echo(f"     Expected: {default_config}")
+        echo("     Create it:")
+        echo("       mkdir -p ~/.config/prisma")
+        echo("       cp /path/to/repo/config.example.toml ~/.config/prisma/config.toml")
+        all_good = False
+    elif config_error is not None:
+        echo(f"  ❌ Config error: {config_error}")
+        all_good = False
+    else:
+        echo(f"  ✅ Config loaded: {config_path}")
+        if verbose:
+            echo(f"     LLM:    {config.get('llm.provider', 'ollama')} / {config.get('llm.model', 'qwen2.5:7b-32k')}")
+            echo(f"     Output: {config.get('output.directory', './outputs')}")
+            echo(f"     Zotero: enabled={config.get('sources.zotero.enabled', False)}")
 
     # 2. Pending write queue
-    click.echo("\n📬 Pending Write Queue:")
+    echo("\n📬 Pending Write Queue:")
     try:
         from ..storage.pending_queue import PendingWriteQueue
         q = PendingWriteQueue()
         if q:
-            click.echo(f"  ⏳ {q.pending_count} action(s) queued for Zotero sync")
+            echo(f"  ⏳ {q.pending_count} action(s) queued for Zotero sync")
         else:
-            click.echo("  ✅ Queue empty")
+            echo("  ✅ Queue empty")
     except Exception as exc:
-        click.echo(f"  ❌ Queue error: {exc}")
+        echo(f"  ❌ Queue error: {exc}")
 
     # 3. Zotero — prisma only talks to Zotero via its Web API (confirmed
     # 2026-07-27; there is no local Zotero Desktop integration anymore).
-    click.echo("\n📚 Zotero Integration:")
+    echo("\n📚 Zotero Integration:")
     if config is None:
-        click.echo("  ⚠️  Skipped — fix config first")
-    else:
-        zconf = config.config.sources.zotero
-        env_errors = []
-        try:
-            api_key = zconf.resolve_api_key() or ''
-        except RuntimeError as exc:
-            api_key = ''
-            env_errors.append(str(exc))
-        try:
-            library_id = zconf.resolve_library_id() or ''
-        except RuntimeError as exc:
-            library_id = ''
-            env_errors.append(str(exc))
-
-        if env_errors:
-            for err in env_errors:
-                click.echo(f"  Web API: ❌ {err}")
-            all_good = False
-        elif api_key and library_id:
-            click.echo(f"  Web API: library_id={library_id} ✅ credentials configured")
-            from ..integrations.zotero.client import check_web_api_reachable
-            if check_web_api_reachable(api_key, library_id, library_type=getattr(zconf, "library_type", "user")):
-                click.echo("    ✅ Reachable")
-            else:
-                click.echo("    ❌ Unreachable — check credentials and internet connectivity")
-                all_good = False
+        echo("  ⚠️  Skipped — fix config first")
+    elif env_errors:
+        for err in env_errors:
+            echo(f"  Web API: ❌ {err}")
+        all_good = False
+    elif api_key and library_id:
+        echo(f"  Web API: library_id={library_id} ✅ credentials configured")
+        reachable = zotero_probe is None or wait_for(zotero_probe)
+        if zotero_probe is not None and reachable:
+            fresh[zotero_key] = {'checked_at': time.time()}
+        if reachable:
+            echo("    ✅ Reachable")
         else:
-            missing = []
-            if not api_key:
-                missing.append('api_key')
-            if not library_id:
-                missing.append('library_id')
-            click.echo(f"  Web API: ⚠️  missing {', '.join(missing)}")
-            click.echo("    Get your key at: https://www.zotero.org/settings/keys/new")
-            click.echo("    Get your user ID at: https://www.zotero.org/settings/keys")
+            echo("    ❌ Unreachable — check credentials and internet connectivity")
             all_good = False
+    else:
+        missing = []
+        if not api_key:
+            missing.append('api_key')
+        if not library_id:
+            missing.append('library_id')
+        echo(f"  Web API: ⚠️  missing {', '.join(missing)}")
+        echo("    Get your key at: https://www.zotero.org/settings/keys/new")
+        echo("    Get your user ID at: https://www.zotero.org/settings/keys")
+        all_good = False
 
     # 4. Dependencies
-    click.echo("\n📦 Dependencies:")
+    echo("\n📦 Dependencies:")
     for pkg in ['requests', 'pydantic', 'yaml', 'pyzotero', 'click']:
         spec = importlib.util.find_spec(pkg)
         mark = "✅" if spec else "❌"
-        click.echo(f"  {mark} {pkg}")
+        echo(f"  {mark} {pkg}")
         if not spec:
             all_good = False
 
     # 5. LLM
-    click.echo("\n🤖 LLM (Ollama):")
+    echo("\n🤖 LLM (Ollama):")
     if config is None:
-        click.echo("  ⚠️  Skipped — fix config first")
+        echo("  ⚠️  Skipped — fix config first")
     else:
-        llm_host = config.get('llm.host', 'localhost:11434')
         try:
-            resp = _req.get(f"http://{llm_host}/api/tags", timeout=5)
-            if resp.status_code == 200:
-                click.echo(f"  ✅ Ollama: connected ({llm_host})")
+            hit = cache.get(ollama_key)
+            if hit is None:
+                resp = wait_for(ollama_probe)
+                if resp.status_code == 200:
+                    hit = fresh[ollama_key] = {
+                        'checked_at': time.time(), 'models': len(resp.json().get('models', [])),
+                    }
+            if hit is not None:
+                echo(f"  ✅ Ollama: connected ({llm_host})")
                 if verbose:
-                    models = resp.json().get('models', [])
-                    click.echo(f"     Models available: {len(models)}")
+                    echo(f"     Models available: {hit.get('models', 0)}")
             else:
-                click.echo(f"  ❌ Ollama: server error {resp.status_code}")
+                echo(f"  ❌ Ollama: server error {resp.status_code}")
                 all_good = False
         except Exception:
-            click.echo(f"  ❌ Ollama: cannot connect to {llm_host}")
+            echo(f"  ❌ Ollama: cannot connect to {llm_host}")
             if wsl:
                 windows_ip = _wsl_windows_ip()
-                click.echo("    In WSL, Ollama must run on Windows with OLLAMA_HOST=0.0.0.0:11434")
-                click.echo(f"    Then set in config: host: \"{windows_ip}:11434\"")
-                click.echo("    Or add to ~/.bashrc:")
-                click.echo("      export OLLAMA_HOST=$(ip route show | grep default | awk '{print $3}'):11434")
+                echo("    In WSL, Ollama must run on Windows with OLLAMA_HOST=0.0.0.0:11434")
+                echo(f"    Then set in config: host: \"{windows_ip}:11434\"")
+                echo("    Or add to ~/.bashrc:")
+                echo("      export OLLAMA_HOST=$(ip route show | grep default | awk '{print $3}'):11434")
             all_good = False
 
-    click.echo("\n" + "=" * 40)
+    pool.shutdown()
+
+    if fresh:
+        _save_status_cache({**cache, **fresh})
+
+    echo("\n" + "=" * 40)
     if all_good:
-        click.echo("🎉 Prisma is ready!")
-        sys.exit(0)
+        echo("🎉 Prisma is ready!")
     else:
-        click.echo("⚠️  Some issues found — check details above")
-        sys.exit(1)
+        echo("⚠️  Some issues found — check details above")
+    flush()
+    sys.exit(0 if all_good else 1)
 
 
 @cli.command()
@@ -13,11 +13,12 @@ import logging
 from typing import Optional
 from urllib.parse import quote
 
-import requests
+import orjson
 
 from ...services.rate_limiter import RateLimiter
 from ...storage.models.agent_models import BookMetadata
 from ...storage.models.api_response_models import GoogleBooksItem, GoogleBooksVolumeInfo
+from . import http_session
 from .base import Source, SourceSearchResult
 
 logger = logging.getLogger(__name__)
@@ -45,7 +46,7 @@ class GoogleBooksSource(Source):
             params = {"q": "test", "maxResults": 1}
             if self._api_key:
                 params["key"] = self._api_key
-            r = requests.get(_BASE_URL, params=params, timeout=timeout)
+            r = http_session.get(_BASE_URL, params=params, timeout=timeout)
             return r.status_code < 500
         except Exception as exc:
             logger.warning("googlebooks probe failed: %s", exc)
@@ -59,9 +60,9 @@ class GoogleBooksSource(Source):
             params = {"q": query, "maxResults": min(limit, 40)}
             if self._api_key:
                 params["key"] = self._api_key
-            response = requests.get(_BASE_URL, params=params, timeout=30)
+            response = http_session.get(_BASE_URL, params=params, timeout=30)
             response.raise_for_status()
-            raw_items = response.json().get("items", [])
+            raw_items = orjson.loads(response.content).get("items", [])
 
             books = []
             for raw_item in raw_items:
@@ -97,6 +98,11 @@ def _to_book_metadata(volume_info: GoogleBooksVolumeInfo) -> Optional[BookMetada
 
     google_url = volume_info.infoLink or f"https://books.google.com/books?q={quote(title)}"
 
+    # Cover/preview are passed through as URLs only -- nothing in the
+    # pipeline (reports, vault notes, the UI) downloads the images, so
+    # fetching them eagerly here would spend this source's anonymous quota
+    # on bytes no one reads. A future consumer should fetch them lazily
+    # through http_session, where the per-host in-flight cap applies.
     cover_url = None
     if volume_info.imageLinks:
         cover_url = volume_info.imageLinks.get("thumbnail") or volume_info.imageLinks.get("smallThumbnail")
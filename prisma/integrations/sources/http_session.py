@@ -0,0 +1,126 @@
+"""One pooled, keep-alive `requests.Session` shared by every discovery source.
+
+A bare `requests.get()` builds and throws away a whole connection pool per
+call, so every search (and every probe) to an HTTPS API like Semantic
+Scholar or Google Books paid a fresh TCP + TLS handshake. All sources now
+go through `get()` here instead, which reuses sockets across sources,
+across repeated queries, and across SearchAgent's concurrent per-source
+fetches -- urllib3's pools are thread-safe, and `_POOL_MAXSIZE` leaves
+headroom for every source being in flight at once.
+
+Transient failures (429 and 5xx) get a short urllib3-level retry with
+backoff, honouring any Retry-After header up to `_RETRY_WAIT_MAX`. Each
+source's own RateLimiter still gates the *logical* request; the retries
+bypass it and run while the host slot is held, so every wait is capped --
+an API asking for minutes is answered by giving up, not by stalling every
+other caller of that host. This only smooths over a single flaky response
+so it doesn't cost a source its whole contribution to a search.
+
+Compression: requests/urllib3 advertise and transparently decode Brotli
+("Accept-Encoding: gzip, deflate, br") whenever the `brotli` package is
+importable -- install the `brotli` extra to get the ~15-25% smaller JSON
+payloads Semantic Scholar and Google Books serve with it; without it the
+session falls back to gzip on its own. HTTP/2 isn't used here: requests
+has no HTTP/2 support, and with every source throttled to about one
+request per search by its RateLimiter there is nothing to multiplex --
+the keep-alive pool already removes the repeated handshakes.
+"""
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_POOL_CONNECTIONS = 10  # distinct hosts kept warm -- comfortably > number of sources
+_POOL_MAXSIZE = 20  # sockets per host, for concurrent fetches against one API
+_RETRY_WAIT_MAX = 5  # seconds -- ceiling on any one backoff or Retry-After wait
+
+# Cap on requests in flight to one host at once. Each source's RateLimiter
+# spaces out request *starts*, but several callers (the stream scheduler
+# thread and on-demand API searches) can still stack slow in-flight
+# requests on one API -- past a host's pool size urllib3 opens throwaway
+# connections, and past the API's own concurrency tolerance it answers
+# 429, which the retry above then turns into a serialized retry storm.
+# arXiv's Terms of Use ask for a single connection.
+_DEFAULT_MAX_IN_FLIGHT = 10
+_MAX_IN_FLIGHT = {
+    "export.arxiv.org": 1,
+    "api.semanticscholar.org": 5,
+}
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        backoff_max=_RETRY_WAIT_MAX,
+        retry_after_max=_RETRY_WAIT_MAX,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        # Hand the final response back rather than raising RetryError, so
+        # callers' existing raise_for_status()/status_code checks still
+        # decide what a failure means.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def session() -> requests.Session:
+    """The process-wide shared session, built on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def _slots_for(url: str) -> threading.BoundedSemaphore:
+    host = urlsplit(url).hostname or ""
+    with _host_slots_lock:
+        slots = _host_slots.get(host)
+        if slots is None:
+            slots = _host_slots[host] = threading.BoundedSemaphore(
+                _MAX_IN_FLIGHT.get(host, _DEFAULT_MAX_IN_FLIGHT)
+            )
+        return slots
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Drop-in for `requests.get()` that goes through the shared session,
+    waiting for a free per-host slot first. requests reads the whole body
+    before returning, so the slot covers the download too. Streaming
+    callers use `stream()` instead, which holds the slot until they are
+    done reading."""
+    if kwargs.get("stream"):
+        raise ValueError("use http_session.stream() for streamed responses")
+    with _slots_for(url):
+        return session().get(url, **kwargs)
+
+
+@contextmanager
+def stream(url: str, **kwargs) -> Iterator[requests.Response]:
+    """`get(url, stream=True)` as a context manager: the per-host slot is
+    held, and the response left open, until the `with` block exits -- so
+    a body read incrementally inside it still counts against the host's
+    in-flight cap."""
+    with _slots_for(url):
+        response = session().get(url, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            response.close()
@@ -20,11 +20,10 @@ import logging
 from datetime import datetime
 from typing import List, Optional
 
-import requests
-
 from ...services.rate_limiter import RateLimiter
 from ...storage.models.agent_models import PaperMetadata
 from ...storage.models.api_response_models import IEEEXploreArticle
+from . import http_session
 from .base import Source, SourceSearchResult
 
 logger = logging.getLogger(__name__)
@@ -56,7 +55,7 @@ class IEEEXploreSource(Source):
         if not self._limiter.acquire(timeout=timeout):
             return False
         try:
-            r = requests.get(
+            r = http_session.get(
                 _BASE_URL,
                 params={"apikey": self._api_key, "querytext": "test", "max_records": 1},
                 timeout=timeout,
@@ -83,7 +82,7 @@ class IEEEXploreSource(Source):
             if published_after is not None:
                 params["start_year"] = published_after.year
 
-            response = requests.get(_BASE_URL, params=params, timeout=30)
+            response = http_session.get(_BASE_URL, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
 
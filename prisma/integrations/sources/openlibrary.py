@@ -10,11 +10,10 @@ import logging
 from typing import Optional
 from urllib.parse import quote
 
-import requests
-
 from ...services.rate_limiter import RateLimiter
 from ...storage.models.agent_models import BookMetadata
 from ...storage.models.api_response_models import OpenLibraryDocument, OpenLibraryResponse
+from . import http_session
 from .base import Source, SourceSearchResult
 
 logger = logging.getLogger(__name__)
@@ -34,7 +33,7 @@ class OpenLibrarySource(Source):
         if not self._limiter.acquire(timeout=timeout):
             return False
         try:
-            r = requests.get(_PROBE_URL, headers=_HEADERS, timeout=timeout)
+            r = http_session.get(_PROBE_URL, headers=_HEADERS, timeout=timeout)
             return r.status_code < 500
         except Exception as exc:
             logger.warning("openlibrary probe failed: %s", exc)
@@ -45,12 +44,12 @@ class OpenLibrarySource(Source):
             logger.warning("openlibrary: rate limit exhausted, skipping this search")
             return SourceSearchResult()
         try:
-            search_query = quote(query)
-            url = f"{_BASE_URL}/search.json?q={search_query}&limit={limit}"
-            response = requests.get(url, headers=_HEADERS, timeout=30)
+            response = http_session.get(
+                f"{_BASE_URL}/search.json", params={"q": query, "limit": limit}, headers=_HEADERS, timeout=30,
+            )
             response.raise_for_status()
 
-            api_response = OpenLibraryResponse.model_validate(response.json())
+            api_response = OpenLibraryResponse.model_validate_json(response.content)
             books = []
             for doc in api_response.docs:
                 book = _parse_doc(doc)
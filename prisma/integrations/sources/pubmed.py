@@ -15,11 +15,10 @@ import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Dict, List, Optional
 
-import requests
-
 from ...services.rate_limiter import RateLimiter
 from ...storage.models.agent_models import PaperMetadata
 from ...storage.models.api_response_models import PubMedSummaryResult
+from . import http_session
 from .base import Source, SourceSearchResult
 
 logger = logging.getLogger(__name__)
@@ -47,7 +46,7 @@ class PubMedSource(Source):
         if not self._limiter.acquire(timeout=timeout):
             return False
         try:
-            r = requests.get(
+            r = http_session.get(
                 _ESEARCH_URL,
                 params=self._params(db="pubmed", term="test", retmax=1, retmode="json"),
                 timeout=timeout,
@@ -96,7 +95,7 @@ class PubMedSource(Source):
             params["datetype"] = "pdat"
             params["mindate"] = published_after.strftime("%Y/%m/%d")
             params["maxdate"] = "3000/12/31"
-        response = requests.get(_ESEARCH_URL, params=params, timeout=30)
+        response = http_session.get(_ESEARCH_URL, params=params, timeout=30)
         response.raise_for_status()
         return response.json().get("esearchresult", {}).get("idlist", [])
 
@@ -105,7 +104,7 @@ class PubMedSource(Source):
             logger.warning("pubmed: rate limit exhausted, skipping esummary")
             return {}
         params = self._params(db="pubmed", id=",".join(pmids), retmode="json", version="2.0")
-        response = requests.get(_ESUMMARY_URL, params=params, timeout=30)
+        response = http_session.get(_ESUMMARY_URL, params=params, timeout=30)
         response.raise_for_status()
         result = response.json().get("result", {})
         return {uid: result[uid] for uid in result.get("uids", []) if uid in result}
@@ -115,7 +114,7 @@ class PubMedSource(Source):
             logger.warning("pubmed: rate limit exhausted, skipping efetch (abstracts will be empty)")
             return {}
         params = self._params(db="pubmed", id=",".join(pmids), rettype="abstract", retmode="xml")
-        response = requests.get(_EFETCH_URL, params=params, timeout=30)
+        response = http_session.get(_EFETCH_URL, params=params, timeout=30)
         response.raise_for_status()
 
         abstracts: Dict[str, str] = {}
@@ -12,14 +12,16 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from urllib.parse import quote
 
-import requests
+import orjson
+from pydantic import ValidationError
 
 from ...services.rate_limiter import RateLimiter
 from ...storage.models.agent_models import PaperMetadata
-from ...storage.models.api_response_models import SemanticScholarPaper
+from ...storage.models.api_response_models import SemanticScholarPaper, SemanticScholarResponse
+from . import http_session
 from .base import Source, SourceSearchResult
 
 logger = logging.getLogger(__name__)
@@ -39,7 +41,7 @@ class SemanticScholarSource(Source):
         if not self._limiter.acquire(timeout=timeout):
             return False
         try:
-            r = requests.get(_PROBE_URL, headers=self._headers, timeout=timeout)
+            r = http_session.get(_PROBE_URL, headers=self._headers, timeout=timeout)
             return r.status_code < 500
         except Exception as exc:
             logger.warning("semanticscholar probe failed: %s", exc)
@@ -62,21 +64,15 @@ class SemanticScholarSource(Source):
                 # Semantic Scholar only has year-level granularity
                 params["year"] = f"{published_after.year}-"
 
-            response = requests.get(url, params=params, headers=self._headers, timeout=30)
+            response = http_session.get(url, params=params, headers=self._headers, timeout=30)
             response.raise_for_status()
-            raw_items = response.json().get("data", [])
 
             papers = []
-            for raw_item in raw_items:
-                # One malformed item shouldn't drop the whole response --
-                # validated per-item, same resilience the old raw-dict
-                # parsing had, but now with real field validation instead of
-                # bare .get() calls.
+            for validated in _decode_papers(response.content):
                 try:
-                    validated = SemanticScholarPaper.model_validate(raw_item)
                     paper = _to_paper_metadata(validated)
                 except Exception as exc:
-                    logger.debug("Semantic Scholar item failed to parse, skipping: %s", exc)
+                    logger.debug("Semantic Scholar item failed to convert, skipping: %s", exc)
                     continue
                 if paper:
                     papers.append(paper)
@@ -86,6 +82,26 @@ class SemanticScholarSource(Source):
             return SourceSearchResult()
 
 
+def _decode_papers(content: bytes) -> List[SemanticScholarPaper]:
+    """The response's papers, validated straight from the raw bytes.
+
+    Fast path: pydantic-core parses and validates the whole payload in one
+    pass with no intermediate dicts. If any single item is malformed that
+    rejects everything, so fall back to decoding once more and validating
+    item by item -- one bad item shouldn't drop the whole response."""
+    try:
+        return SemanticScholarResponse.model_validate_json(content).data
+    except ValidationError:
+        pass
+    validated = []
+    for raw_item in orjson.loads(content).get("data", []):
+        try:
+            validated.append(SemanticScholarPaper.model_validate(raw_item))
+        except Exception as exc:
+            logger.debug("Semantic Scholar item failed to parse, skipping: %s", exc)
+    return validated
+
+
 def _to_paper_metadata(paper: SemanticScholarPaper) -> Optional[PaperMetadata]:
     title = paper.title.strip()
     if not title:
@@ -20,13 +20,28 @@ converting to typed models via hasattr-based capability dispatch). That
 dispatch was already ceremonial before this merge -- there was only ever
 one concrete backend since the Local-API/Desktop/Hybrid clients were
 removed -- so it's gone now, not carried forward.
+
+Transport stays pyzotero's own (an httpx client with keep-alive). A
+search costs at most a handful of requests issued one after another
+(see get_items_in_collections()), each bounded by Zotero's round-trip
+time and rate limiting, so syscall-level transports such as io_uring
+have no per-request overhead here to recover. HTTP/2 is left off for
+the same reason: its win is multiplexing concurrent requests over one
+connection, and these are sequential requests that keep-alive already
+sends over one warm connection. JSON decoding happens
+inside pyzotero too, one page (at most 100 items) at a time; the
+methods below return lists because their callers (routes, dedup, the
+agent's result cache) index and re-iterate them.
 """
 
 from __future__ import annotations
 
+import functools
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -40,6 +55,42 @@ from ...utils.config import PrismaConfig
 
 logger = logging.getLogger(__name__)
 
+_MAX_PAGE_SIZE = 100  # Zotero caps every multi-object response at 100 items
+_MAX_WRITE_BATCH = 50  # and a multi-object write/delete at 50
+
+# Last library version seen per (library type, library id), with the
+# monotonic time it was read -- process-wide, because the stream runner
+# and the API each hold their own ZoteroClient for the same library. Lets
+# get_library_version(max_age=...) answer a burst of cache-keyed reads
+# without a request each. Every write made through a ZoteroClient drops
+# its library's entry, so Prisma's own changes are seen at once; edits
+# made elsewhere (Zotero desktop, another device) show up within max_age.
+_known_versions: Dict[Tuple[str, str], Tuple[int, float]] = {}
+_known_versions_lock = threading.Lock()
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _writes_library(method: _F) -> _F:
+    """Marks a ZoteroClient method that can change the library: once it
+    returns (or fails part-way), the remembered library version is
+    dropped."""
+    @functools.wraps(method)
+    def wrapper(self: "ZoteroClient", *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            with _known_versions_lock:
+                _known_versions.pop(self._library_ref, None)
+    return wrapper  # type: ignore[return-value]
+
+
+def _item_type_param(item_types: Optional[List[str]]) -> Dict[str, Any]:
+    """`itemType` query parameter selecting any of `item_types` (Zotero's
+    `a || b` OR syntax), so non-matching items are dropped server-side
+    rather than downloaded and parsed only to be discarded."""
+    return {"itemType": " || ".join(item_types)} if item_types else {}
+
 
 def check_web_api_reachable(
     api_key: Optional[str], library_id: Optional[str], timeout: float = 2.0, library_type: str = "user",
@@ -172,6 +223,12 @@ class ZoteroClient:
         except Exception as e:
             raise ZoteroClientError(f"Failed to initialize Zotero client: {e}")
 
+    def close(self) -> None:
+        """Close pyzotero's underlying HTTP client and its pooled connections."""
+        http = getattr(self._client, "client", None)
+        if http is not None:
+            http.close()
+
     # ── Status ────────────────────────────────────────────────────────────────
 
     def test_connection(self) -> bool:
@@ -207,6 +264,33 @@ class ZoteroClient:
             ) if configured else False,
         )
 
+    @property
+    def _library_ref(self) -> Tuple[str, str]:
+        return self.config.library_type, self.config.library_id
+
+    def _remember_library_version(self, version: int) -> None:
+        with _known_versions_lock:
+            _known_versions[self._library_ref] = (version, time.monotonic())
+
+    def get_library_version(self, max_age: float = 0.0) -> int:
+        """The library's current Last-Modified-Version -- bumped by Zotero
+        on every change to any item or collection, so it works as a cheap
+        validity stamp for anything cached from this library. One
+        `limit=1` request, unless a version read (or seen on another
+        response) less than `max_age` seconds ago can be reused."""
+        if max_age > 0:
+            with _known_versions_lock:
+                known = _known_versions.get(self._library_ref)
+            if known is not None and time.monotonic() - known[1] < max_age:
+                return known[0]
+        try:
+            version = self._client.last_modified_version()
+        except Exception as e:
+            logger.error(f"Failed to retrieve library version: {e}")
+            raise ZoteroClientError(f"Failed to retrieve library version: {e}")
+        self._remember_library_version(version)
+        return version
+
     # ── Collections ───────────────────────────────────────────────────────────
 
     def get_collections(self, limit: int = 100) -> List[ZoteroCollection]:
@@ -231,6 +315,38 @@ class ZoteroClient:
             logger.error(f"Failed to retrieve all collections: {e}")
             raise ZoteroClientError(f"Failed to retrieve all collections: {e}")
 
+    def get_collections_if_modified(
+        self, since_version: Optional[int] = None,
+    ) -> Optional[Tuple[int, List[ZoteroCollection]]]:
+        """Conditional counterpart to get_all_collections() for callers
+        that keep their own copy of the collection list: returns None when
+        the library hasn't changed since `since_version`, otherwise
+        `(library_version, every collection)`.
+
+        pyzotero has no hook for sending If-Modified-Since-Version itself,
+        so the check is its `since=` equivalent -- a `format=versions`
+        request, whose body is `{}` when nothing changed and whose
+        Last-Modified-Version header carries the current library version.
+        That costs one tiny round trip instead of transferring and parsing
+        every collection on each refresh."""
+        try:
+            if since_version is not None:
+                self._client.collection_versions(since=since_version)
+                current = int(self._client.request.headers.get("last-modified-version", 0))
+                self._remember_library_version(current)
+                if current == since_version:
+                    logger.debug("Collections unchanged since library version %s", since_version)
+                    return None
+            raw = self._client.everything(self._client.collections())
+            version = int(self._client.request.headers.get("last-modified-version", 0))
+            self._remember_library_version(version)
+            logger.info(f"Retrieved {len(raw)} collections (library version {version})")
+            return version, [ZoteroCollection.from_zotero_data(c) for c in raw]
+        except Exception as e:
+            logger.error(f"Failed to retrieve collections: {e}")
+            raise ZoteroClientError(f"Failed to retrieve collections: {e}")
+
+    @_writes_library
     def create_collection(self, collection_data: Dict[str, Any]) -> Optional[ZoteroCollection]:
         """
         Create a new collection.
@@ -274,6 +390,7 @@ class ZoteroClient:
             raise ZoteroClientError(f"Failed to create collection {name!r}")
         return created
 
+    @_writes_library
     def delete_collection(self, collection_key: str) -> bool:
         """Delete a collection."""
         try:
@@ -295,9 +412,11 @@ class ZoteroClient:
 
     # ── Items ─────────────────────────────────────────────────────────────────
 
-    def get_items(self, limit: int = 100, item_type: Optional[str] = None) -> List[ZoteroItem]:
+    def get_items(
+        self, limit: int = 100, item_type: Optional[str] = None, item_types: Optional[List[str]] = None,
+    ) -> List[ZoteroItem]:
         try:
-            params: Dict[str, Any] = {"limit": limit}
+            params: Dict[str, Any] = {"limit": limit, **_item_type_param(item_types)}
             if item_type:
                 params["itemType"] = item_type
             raw = self._client.items(**params)
@@ -307,22 +426,98 @@ class ZoteroClient:
             logger.error(f"Failed to retrieve items: {e}")
             raise ZoteroClientError(f"Failed to retrieve items: {e}")
 
+    def get_items_in_year_range(
+        self, start_year: int, end_year: int, limit: int = 100, item_types: Optional[List[str]] = None,
+    ) -> List[ZoteroItem]:
+        """Up to `limit` items whose year falls in `[start_year, end_year]`,
+        newest first. Pages through the library sorted by date descending
+        and stops at the first item dated before `start_year` -- everything
+        after it is older -- so a recent-years search reads only the pages
+        it needs instead of a `limit`-sized slice of the library that the
+        date filter may then mostly discard. Undated items are skipped."""
+        try:
+            items: List[ZoteroItem] = []
+            page = self._client.items(
+                sort="date", direction="desc", limit=min(limit, _MAX_PAGE_SIZE), **_item_type_param(item_types),
+            )
+            while page:
+                for raw in page:
+                    item = ZoteroItem.from_zotero_data(raw)
+                    year = item.year
+                    if not year or year > end_year:
+                        continue
+                    if year < start_year:
+                        page = None
+                        break
+                    items.append(item)
+                    if len(items) >= limit:
+                        page = None
+                        break
+                else:
+                    page = self._client.follow()
+            logger.info(f"Retrieved {len(items)} items dated {start_year}-{end_year}")
+            return items
+        except Exception as e:
+            logger.error(f"Failed to retrieve items by date: {e}")
+            raise ZoteroClientError(f"Failed to retrieve items by date: {e}")
+
     def get_all_items(self, item_type: Optional[str] = None) -> List[ZoteroItem]:
         """Retrieve every item in the library, paginating past pyzotero's
         default per-request limit -- for whole-library operations
         (duplicate detection, library stats) that need everything, not a
         capped page."""
+        items = list(self.iter_all_items(item_type))
+        logger.info(f"Retrieved {len(items)} items (full library)")
+        return items
+
+    def iter_all_items(self, item_type: Optional[str] = None) -> Iterator[ZoteroItem]:
+        """get_all_items() one 100-item page at a time, fetched as the
+        caller consumes them -- a single pass over the library (counting,
+        stats) never holds the whole library, or a second copy of it as
+        raw JSON, in memory at once. Paging follows pyzotero's last
+        response, so don't make other calls on this client mid-iteration."""
         try:
-            params: Dict[str, Any] = {}
+            params: Dict[str, Any] = {"limit": _MAX_PAGE_SIZE}
             if item_type:
                 params["itemType"] = item_type
-            raw = self._client.everything(self._client.items(**params))
-            logger.info(f"Retrieved {len(raw)} items (full library)")
-            return [ZoteroItem.from_zotero_data(i) for i in raw]
+            page = self._client.items(**params)
+            while page:
+                for raw in page:
+                    yield ZoteroItem.from_zotero_data(raw)
+                page = self._client.follow()
         except Exception as e:
             logger.error(f"Failed to retrieve all items: {e}")
             raise ZoteroClientError(f"Failed to retrieve all items: {e}")
 
+    def get_items_since(
+        self, since_version: Optional[int] = None,
+    ) -> Tuple[int, List[ZoteroItem], List[str]]:
+        """Incremental sync: `(library_version, changed items, deleted item
+        keys)` for everything modified since `since_version`, so a caller
+        keeping its own copy of the library only transfers what changed.
+        With no `since_version` this is the full library and no
+        deletions. The version is read before the deletions request,
+        which only widens the window -- a change racing this call is
+        picked up again on the next sync rather than lost."""
+        try:
+            params: Dict[str, Any] = {}
+            if since_version is not None:
+                params["since"] = since_version
+            raw = self._client.everything(self._client.items(**params))
+            version = int(self._client.request.headers.get("last-modified-version", 0))
+            self._remember_library_version(version)
+            deleted: List[str] = []
+            if since_version is not None:
+                deleted = list(self._client.deleted(since=since_version).get("items", []))
+            logger.info(
+                f"Synced {len(raw)} changed and {len(deleted)} deleted items "
+                f"(library version {since_version} -> {version})"
+            )
+            return version, [ZoteroItem.from_zotero_data(i) for i in raw], deleted
+        except Exception as e:
+            logger.error(f"Failed to sync items: {e}")
+            raise ZoteroClientError(f"Failed to sync items: {e}")
+
     def get_collection_items(self, collection_key: str, query: Optional[str] = None) -> List[ZoteroItem]:
         """Every item in this collection, paginating past pyzotero's
         default per-request limit -- callers (stream_runner.py's dedup
@@ -344,9 +539,78 @@ class ZoteroClient:
             logger.error(f"Failed to retrieve collection items: {e}")
             raise ZoteroClientError(f"Failed to retrieve collection items: {e}")
 
-    def search_items(self, query: str, limit: int = 100) -> List[ZoteroItem]:
+    def get_items_in_collections(
+        self, collection_keys: List[str], limit: int = 100, item_types: Optional[List[str]] = None,
+    ) -> List[ZoteroItem]:
+        """Up to `limit` items drawn from several collections and
+        de-duplicated by key for items filed in more than one of them.
+        Each collection is asked for an even share of what is still
+        missing (`ceil(remaining / collections left)`), so a small
+        collection's unused share passes to the ones after it. Collections
+        that filled their share are revisited, from where they stopped,
+        until `limit` is reached or every one is exhausted. Unlike
+        get_collection_items(), this never pulls a whole collection just
+        to keep a few of its items.
+
+        The Web API has no multi-collection filter on /items, so this is
+        still one request per collection per pass (more only for shares
+        above Zotero's 100-per-page cap), issued in sequence -- the
+        pyzotero object keeps per-request state (url params, pagination
+        links) and isn't safe to share across threads."""
+        if not collection_keys:
+            return []
+        try:
+            seen = set()
+            items: List[ZoteroItem] = []
+            offsets = dict.fromkeys(collection_keys, 0)
+            active = list(offsets)
+            while active and len(items) < limit:
+                not_exhausted = []
+                for position, collection_key in enumerate(active):
+                    remaining = limit - len(items)
+                    if remaining <= 0:
+                        break
+                    share = -(-remaining // (len(active) - position))
+                    page = self._collection_slice(collection_key, offsets[collection_key], share, item_types)
+                    offsets[collection_key] += len(page)
+                    for raw in page:
+                        if raw.get("key") not in seen:
+                            seen.add(raw.get("key"))
+                            items.append(ZoteroItem.from_zotero_data(raw))
+                    if len(page) == share:
+                        not_exhausted.append(collection_key)
+                active = not_exhausted
+            logger.info(f"Retrieved {len(items)} items from {len(collection_keys)} collections")
+            return items
+        except Exception as e:
+            logger.error(f"Failed to retrieve collection items: {e}")
+            raise ZoteroClientError(f"Failed to retrieve collection items: {e}")
+
+    def _collection_slice(
+        self, collection_key: str, start: int, count: int, item_types: Optional[List[str]],
+    ) -> List[Dict[str, Any]]:
+        """Up to `count` raw items of one collection from offset `start`,
+        following Zotero's pages only as far as needed. A short page is
+        the collection's last one, so it ends paging without another
+        request."""
+        params = _item_type_param(item_types)
+        if start:
+            params["start"] = start
+        page_size = min(count, _MAX_PAGE_SIZE)
+        page = self._client.collection_items(collection_key, limit=page_size, **params)
+        raw_items: List[Dict[str, Any]] = []
+        while page:
+            raw_items.extend(page[:count - len(raw_items)])
+            if len(raw_items) >= count or len(page) < page_size:
+                break
+            page = self._client.follow()
+        return raw_items
+
+    def search_items(
+        self, query: str, limit: int = 100, item_types: Optional[List[str]] = None,
+    ) -> List[ZoteroItem]:
         try:
-            raw = self._client.items(q=query, limit=limit)
+            raw = self._client.items(q=query, limit=limit, **_item_type_param(item_types))
             logger.info(f"Found {len(raw)} items matching '{query}'")
             return [ZoteroItem.from_zotero_data(i) for i in raw]
         except Exception as e:
@@ -427,6 +691,7 @@ class ZoteroClient:
             logger.debug(f"Failed to fetch PDF bytes for {pdf_key}: {e}")
             return None
 
+    @_writes_library
     def create_item(self, item_data: Dict[str, Any]) -> Optional[str]:
         """Create an item from a raw Zotero-format dict. Returns the
         created item's key, or None if creation failed."""
@@ -459,16 +724,12 @@ class ZoteroClient:
             logger.error(f"Failed to create item: {e}")
             return None
 
-    def add_paper(self, paper: Any, collection_key: Optional[str] = None) -> ZoteroItem:
-        """Add a domain paper/analyzed-result object (duck-typed via
-        getattr -- title/authors/abstract/url/doi/published_date/arxiv_id)
-        to the library. Distinct from create_item(), which takes an
-        already-Zotero-shaped dict; this does the paper -> Zotero item
-        conversion."""
+    @staticmethod
+    def _paper_item_data(paper: Any, collection_key: Optional[str]) -> Dict[str, Any]:
         authors = getattr(paper, "authors", []) or []
         arxiv_id = getattr(paper, "arxiv_id", None)
         item_type = "preprint" if arxiv_id else "journalArticle"
-        item_data = {
+        return {
             "itemType": item_type,
             "title": getattr(paper, "title", ""),
             "creators": [{"creatorType": "author", "name": a} for a in authors],
@@ -479,8 +740,16 @@ class ZoteroClient:
             "collections": [collection_key] if collection_key else [],
             "tags": [],
         }
+
+    @_writes_library
+    def add_paper(self, paper: Any, collection_key: Optional[str] = None) -> ZoteroItem:
+        """Add a domain paper/analyzed-result object (duck-typed via
+        getattr -- title/authors/abstract/url/doi/published_date/arxiv_id)
+        to the library. Distinct from create_item(), which takes an
+        already-Zotero-shaped dict; this does the paper -> Zotero item
+        conversion."""
         try:
-            result = self._client.create_items([item_data])
+            result = self._client.create_items([self._paper_item_data(paper, collection_key)])
         except Exception as e:
             raise ZoteroClientError(f"Failed to add paper: {e}")
 
@@ -490,6 +759,45 @@ class ZoteroClient:
         entry = next(iter(successful.values()))
         return ZoteroItem.from_zotero_data(entry)
 
+    @_writes_library
+    def add_papers(
+        self, papers: List[Any], collection_key: Optional[str] = None,
+    ) -> List[Optional[ZoteroItem]]:
+        """add_paper() for many papers at once -- one `POST /items` per 50
+        instead of one per paper. Returns a list aligned with `papers`:
+        the created item, or None where that paper wasn't created. Zotero
+        reports per-object failures without failing the rest of a batch;
+        a paper that can't be converted, or a whole request that fails,
+        only costs its own entries, never the batches around it. Never
+        raises."""
+        created: List[Optional[ZoteroItem]] = [None] * len(papers)
+        for start in range(0, len(papers), _MAX_WRITE_BATCH):
+            positions, payload = [], []
+            for pos in range(start, min(start + _MAX_WRITE_BATCH, len(papers))):
+                try:
+                    payload.append(self._paper_item_data(papers[pos], collection_key))
+                except Exception as e:
+                    logger.warning(f"Skipping paper that can't be converted to a Zotero item: {e}")
+                    continue
+                positions.append(pos)
+            if not payload:
+                continue
+            try:
+                result = self._client.create_items(payload)
+            except Exception as e:
+                logger.error(f"Failed to add {len(payload)} papers: {e}")
+                continue
+            successful = result.get("successful", {}) if isinstance(result, dict) else {}
+            for i, pos in enumerate(positions):
+                entry = successful.get(str(i))
+                if entry:
+                    created[pos] = ZoteroItem.from_zotero_data(entry)
+            if len(successful) < len(payload):
+                logger.warning(f"Zotero rejected {len(payload) - len(successful)}/{len(payload)} papers: "
+                               f"{result.get('failed') if isinstance(result, dict) else result}")
+        return created
+
+    @_writes_library
     def delete_item(self, item_key: str) -> bool:
         """Delete an item."""
         try:
@@ -509,6 +817,32 @@ class ZoteroClient:
             logger.error(f"Failed to delete item {item_key}: {e}")
             return False
 
+    @_writes_library
+    def delete_items(self, item_keys: List[str]) -> Dict[str, bool]:
+        """Delete many items, `{key: deleted}` -- one
+        `DELETE /items?itemKey=k1,k2,...` per 50 keys instead of
+        delete_item()'s fetch-then-delete round trips per key. Each batch
+        is guarded by the library version read just before it, so an edit
+        racing the cleanup makes that batch fail (412) rather than delete
+        an item the user just changed; a failed batch falls back to
+        per-item delete_item(), which reports keys one by one. Like
+        delete_item(), never raises."""
+        results: Dict[str, bool] = {}
+        for start in range(0, len(item_keys), _MAX_WRITE_BATCH):
+            batch = item_keys[start:start + _MAX_WRITE_BATCH]
+            try:
+                version = self._client.last_modified_version()
+                self._client.delete_item([{"key": key} for key in batch], last_modified=version)
+            except Exception as e:
+                logger.warning(f"Batch delete of {len(batch)} items failed, deleting one by one: {e}")
+                for key in batch:
+                    results[key] = self.delete_item(key)
+                continue
+            logger.info(f"Successfully deleted {len(batch)} items")
+            results.update(dict.fromkeys(batch, True))
+        return results
+
+    @_writes_library
     def add_item_to_collection(self, item_key: str, collection_key: str) -> bool:
         """Add an existing item to a collection."""
         try:
@@ -550,6 +884,59 @@ class ZoteroClient:
             logger.error(f"Failed to add item {item_key} to collection {collection_key}: {e}")
             return False
 
+    @_writes_library
+    def add_items_to_collection(self, item_keys: List[str], collection_key: str) -> Dict[str, bool]:
+        """Add many existing items to a collection, `{key: added}` -- per
+        50 keys, one `GET /items?itemKey=...` and one `POST /items` of the
+        updated items, instead of add_item_to_collection()'s fetch-then-
+        write round trips per key. Items already in the collection count
+        as added; keys Zotero doesn't return, or lists under `failed` in
+        the write response (a 412 version conflict, say), count as not. A
+        failed batch falls back to per-item add_item_to_collection().
+        Never raises."""
+        results: Dict[str, bool] = {}
+        for start in range(0, len(item_keys), _MAX_WRITE_BATCH):
+            batch = item_keys[start:start + _MAX_WRITE_BATCH]
+            try:
+                raw = self._client.items(itemKey=",".join(batch), limit=_MAX_WRITE_BATCH)
+                changed = []
+                for item in raw:
+                    collections = item["data"].setdefault("collections", [])
+                    if collection_key not in collections:
+                        collections.append(collection_key)
+                        changed.append(item["data"])
+                rejected = set()
+                if changed:
+                    self._client.update_items(changed)
+                    rejected = self._rejected_write_keys(changed)
+            except Exception as e:
+                logger.warning(
+                    f"Batch add of {len(batch)} items to collection {collection_key} failed, "
+                    f"adding one by one: {e}"
+                )
+                for key in batch:
+                    results[key] = self.add_item_to_collection(key, collection_key)
+                continue
+            added = {item["key"] for item in raw} - rejected
+            if rejected:
+                logger.warning(f"Zotero rejected {len(rejected)} collection updates: {sorted(rejected)}")
+            logger.info(f"Added {len(added)} items to collection {collection_key}")
+            results.update({key: key in added for key in batch})
+        return results
+
+    def _rejected_write_keys(self, payload: List[Dict[str, Any]]) -> set:
+        """Keys Zotero listed under `failed` in the response to the last
+        write of `payload` (at most 50 objects, so a single request).
+        pyzotero's update_items() returns True whatever that map says, but
+        leaves the response on `self._client.request`; `failed` is keyed
+        by each object's position in the payload."""
+        try:
+            failed = self._client.request.json().get("failed") or {}
+        except Exception as e:
+            logger.debug(f"Couldn't read the write response, assuming it all succeeded: {e}")
+            return set()
+        return {entry.get("key") or payload[int(index)].get("key") for index, entry in failed.items()}
+
     def save_items(self, items: List[Dict[str, Any]],
                    collection_key: Optional[str] = None) -> List[str]:
         """Save a batch of already-Zotero-shaped item dicts, optionally
@@ -589,10 +976,12 @@ class ZoteroClient:
 
     def get_library_stats(self) -> ZoteroLibraryStats:
         try:
-            items = self.get_all_items()
+            # Totals come from the Total-Results header of a 1-item request,
+            # not from downloading the whole library to take its len()
+            total_items = self._client.count_items()
             collections = self.get_collections()
             return ZoteroLibraryStats(
-                total_items=len(items),
+                total_items=total_items,
                 total_collections=len(collections),
                 api_available=True,
             )
@@ -36,7 +36,7 @@ def _t(label: str, _t0=[0.0]):
     _log.info("startup  %+6.2fs  %s", now - _t0[0], label)
 
 _t("importing fastapi")
-from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, ValidationError
 from prisma.server.access_log import AccessLogMiddleware
@@ -1419,6 +1419,10 @@ def _run_deduplicate(job_id: str, dry_run: bool = False, max_level: int = 3, sen
         _log.error("deduplicate[%s]: find_all_duplicates failed: %s", job_id, exc, exc_info=True)
         _jobs[job_id] = job.model_copy(update={"status": "error", "errors": [str(exc)]})
         return
+    # Only grouped items are needed from here on, and the delete phase is
+    # network-bound and can run long -- let the rest of the library (each
+    # item carrying its full raw_data dict) be freed now rather than at return.
+    del items
 
     _log.info("deduplicate[%s]: found %d duplicate group(s)", job_id, len(groups))
     duplicates_found = 0
@@ -1426,34 +1430,43 @@ def _run_deduplicate(job_id: str, dry_run: bool = False, max_level: int = 3, sen
     would_delete: list[WouldDeleteEntry] = []
     errors: list[str] = []
 
+    # Per-group and per-candidate detail goes to DEBUG: every entry is
+    # already in the job's would_delete list, and a large library's run
+    # would otherwise write thousands of INFO lines. Actual deletions
+    # stay at INFO as the audit trail of what was removed.
+    to_delete: list = []
     for group in groups:
         duplicates_found += len(group) - 1
         keep = _keep(group)
-        _log.info("deduplicate[%s]: group size=%d keeping key=%s title=%r", job_id, len(group), keep.key, keep.title)
+        _log.debug("deduplicate[%s]: group size=%d keeping key=%s title=%r", job_id, len(group), keep.key, keep.title)
         for item in group:
             if item.key == keep.key:
                 continue
             entry = WouldDeleteEntry(key=item.key, title=item.title, doi=item.doi, keep_key=keep.key, keep_title=keep.title)
             if dry_run:
                 would_delete.append(entry)
-                _log.info("deduplicate[%s]: dry_run would delete key=%s title=%r (keep=%s)", job_id, item.key, item.title, keep.key)
+                _log.debug("deduplicate[%s]: dry_run would delete key=%s title=%r (keep=%s)", job_id, item.key, item.title, keep.key)
             else:
-                try:
-                    # delete_item() catches its own exceptions and returns
-                    # bool -- it never raises, so this must check the
-                    # return value explicitly, not rely on `except` to
-                    # catch a failure (previously counted every call as a
-                    # successful deletion regardless of outcome).
-                    deleted = _zotero.delete_item(item.key)
-                    if deleted:
-                        items_deleted += 1
-                        _log.info("deduplicate[%s]: deleted key=%s title=%r", job_id, item.key, item.title)
-                    else:
-                        errors.append(f"{item.key}: delete_item returned False")
-                        _log.warning("deduplicate[%s]: failed to delete key=%s", job_id, item.key)
-                except Exception as exc:
-                    errors.append(f"{item.key}: {exc}")
-                    _log.warning("deduplicate[%s]: failed to delete key=%s: %s", job_id, item.key, exc)
+                to_delete.append(item)
+
+    if to_delete:
+        # One batched delete_items() call (50 keys per request) rather than
+        # a delete_item() round trip per duplicate. Like delete_item() it
+        # reports failures per key instead of raising, so each result must
+        # be checked -- a missing or False entry is a failed deletion.
+        try:
+            deleted = _zotero.delete_items([item.key for item in to_delete])
+        except Exception as exc:
+            _log.warning("deduplicate[%s]: batch delete failed: %s", job_id, exc)
+            errors.extend(f"{item.key}: {exc}" for item in to_delete)
+        else:
+            for item in to_delete:
+                if deleted.get(item.key):
+                    items_deleted += 1
+                    _log.info("deduplicate[%s]: deleted key=%s title=%r", job_id, item.key, item.title)
+                else:
+                    errors.append(f"{item.key}: delete failed")
+                    _log.warning("deduplicate[%s]: failed to delete key=%s", job_id, item.key)
 
     if not dry_run:
         _activity.info("action=deduplicate found=%d deleted=%d errors=%d", duplicates_found, items_deleted, len(errors))
@@ -1508,7 +1521,13 @@ def deduplicate_status(job_id: str):
     # job.model_dump() not existing on a dict.
     if job is None or not isinstance(job, DedupJobState):
         raise HTTPException(status_code=404, detail="job not found")
-    return {"job_id": job_id, **job.model_dump()}
+    # The job state is already validated, and this route is polled -- with
+    # would_delete running to thousands of entries on a large library.
+    # Serialize it straight to JSON in pydantic-core rather than dumping
+    # to dicts for FastAPI to re-validate against response_model and
+    # re-encode on every poll.
+    status = DedupJobStatusResponse.model_construct(job_id=job_id, **dict(job))
+    return Response(content=status.model_dump_json(), media_type="application/json")
 
 
 @app.post("/review", response_model=JobStatus, status_code=202)
@@ -18,7 +18,8 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Optional
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel, Field
@@ -32,6 +33,17 @@ from prisma.storage.models.vault_models import RenderedNode, StreamRunResult
 _activity = logging.getLogger("prisma.activity")
 _maint_log = logging.getLogger("prisma.maintenance")
 
+# Slugs with a run in flight -- from POST /streams/{slug}/run, a create's
+# background initial run, or the scheduler. Surfaced as StreamMeta.running,
+# so a client that started a background run can poll GET /streams/{slug}
+# (or listen for the stream_progress broadcasts) until it's done.
+_running_streams: set[str] = set()
+_running_lock = threading.Lock()
+# Shared by every run's library-lookup-then-create phase (see
+# stream_runner.run_stream's bookmark_lock), so two streams that turn up
+# the same paper at the same time don't both create it.
+_bookmark_lock = threading.Lock()
+
 
 class StreamMeta(BaseModel):
     slug: str
@@ -44,6 +56,7 @@ class StreamMeta(BaseModel):
     last_updated: Optional[str] = None
     next_update: Optional[str] = None
     tags: list[str] = Field(default_factory=list)
+    running: bool = False
 
 
 class StreamCreateRequest(BaseModel):
@@ -52,6 +65,10 @@ class StreamCreateRequest(BaseModel):
     description: Optional[str] = None
     refresh_frequency: str = "weekly"
     tags: Optional[list[str]] = None
+    # Start the stream's first run in the background and return at once,
+    # rather than making the client wait out a whole search-and-screen pass
+    # (or wait for the scheduler's next tick) before seeing any papers.
+    run_initial: bool = False
 
 
 class StreamPatchRequest(BaseModel):
@@ -75,23 +92,53 @@ def _stream_meta(s) -> StreamMeta:
         last_updated=s.last_updated.isoformat() if s.last_updated else None,
         next_update=s.next_update.isoformat() if s.next_update else None,
         tags=s.tags,
+        running=s.slug in _running_streams,
     )
 
 
+def _claim_run(slug: str) -> bool:
+    """Mark `slug` as running, unless a run of it is already in flight --
+    checked and set under one lock, so two callers can't both claim it."""
+    with _running_lock:
+        if slug in _running_streams:
+            return False
+        _running_streams.add(slug)
+        return True
+
+
 def run_stream_and_notify(
     vault: VaultService, zotero: ZoteroClient, slug: str,
     broadcast_fn: Callable[..., None], *, force: bool = False,
 ) -> StreamRunResult:
     """Shared by POST /streams/{slug}/run and StreamScheduler's tick -- both
     need the exact same broadcast-progress-then-run-then-broadcast-result
-    sequence, just triggered by a request vs. a timer."""
-    from prisma.services.stream_runner import run_stream as _runner
+    sequence, just triggered by a request vs. a timer. Raises 409 if the
+    stream already has a run in flight."""
     try:
-        vault.get_stream(slug)
+        stream = vault.get_stream(slug)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"stream not found: {slug!r}")
+    if not _claim_run(stream.slug):
+        raise HTTPException(status_code=409, detail=f"stream already running: {stream.slug!r}")
+    return _run_claimed(vault, zotero, stream.slug, broadcast_fn, force=force)
+
+
+def _run_claimed(
+    vault: VaultService, zotero: ZoteroClient, slug: str,
+    broadcast_fn: Callable[..., None], *, force: bool = False,
+) -> StreamRunResult:
+    """run_stream_and_notify's body, for a caller that has already claimed
+    `slug` via _claim_run(). Releases the claim once the run ends."""
+    from prisma.services.stream_runner import run_stream as _runner
     broadcast_fn({"type": "stream_progress", "slug": slug, "status": "running"})
-    result = _runner(slug, vault, zotero, force=force, get_stream_logger=_log_setup.get_stream_logger)
+    try:
+        result = _runner(
+            slug, vault, zotero, force=force,
+            get_stream_logger=_log_setup.get_stream_logger, bookmark_lock=_bookmark_lock,
+        )
+    finally:
+        with _running_lock:
+            _running_streams.discard(slug)
     _activity.info(
         "action=run_stream slug=%s found=%d saved=%d skipped_llm=%d errors=%d",
         slug, result.papers_found, result.papers_saved, result.papers_skipped_llm, len(result.errors),
@@ -101,10 +148,39 @@ def run_stream_and_notify(
     return result
 
 
+class _SerializedZotero:
+    """Proxy that holds `lock` for the duration of every method call on the
+    wrapped ZoteroClient. The pyzotero object behind it keeps per-request
+    state (url params, pagination links) and isn't safe to share across
+    threads, so streams run side by side share one client through this --
+    their internet searches and LLM screening overlap, their Zotero
+    reads/writes take turns."""
+
+    def __init__(self, client: ZoteroClient, lock: threading.Lock) -> None:
+        self._wrapped = client
+        self._lock = lock
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._wrapped, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return locked
+
+
 class StreamScheduler:
     """Background thread that runs streams when their next_update is past."""
 
     _CHECK_INTERVAL = 5 * 60  # seconds between scans
+    # Due streams run side by side, up to this many at once. Each run is
+    # dominated by network waits (source searches, Zotero round-trips) and
+    # LLM screening, which http_session's per-host slots and AnalysisAgent's
+    # inference semaphore already bound -- so a tick costs roughly its
+    # slowest stream rather than the sum of all of them.
+    _MAX_PARALLEL_RUNS = 4
 
     def __init__(
         self,
@@ -132,31 +208,50 @@ class StreamScheduler:
             self._stop_event.wait(timeout=self._CHECK_INTERVAL)
 
     def _tick(self) -> None:
-        from datetime import datetime
-        from prisma.storage.models.vault_models import StreamStatus
         vault = self._get_vault()
         try:
-            streams = vault.list_streams()
+            due = vault.list_due_streams()
         except Exception as exc:
-            _maint_log.warning("stream-scheduler: list_streams failed: %s", exc)
+            _maint_log.warning("stream-scheduler: list_due_streams failed: %s", exc)
+            return
+        # A stream whose run is still in flight (a create's background
+        # initial run, a manual POST /run, or a previous tick's) is skipped
+        # rather than started a second time alongside it.
+        with _running_lock:
+            due = [s for s in due if s.slug not in _running_streams]
+        _maint_log.info("stream-scheduler: tick — %d due", len(due))
+        if not due:
             return
-        now = datetime.now()
-        due = [s for s in streams if s.status == StreamStatus.active
-               and s.refresh_frequency.value != "manual"
-               and (s.next_update is None or s.next_update <= now)]
-        _maint_log.info("stream-scheduler: tick — %d streams checked, %d due", len(streams), len(due))
-        for stream in due:
-            _maint_log.info("stream-scheduler: running %r", stream.slug)
-            try:
-                t0 = time.monotonic()
-                result = run_stream_and_notify(vault, self._get_zotero(), stream.slug, self._broadcast, force=False)
-                elapsed_ms = (time.monotonic() - t0) * 1000
-                _maint_log.info(
-                    "stream-scheduler: %r done — found=%d saved=%d elapsed_ms=%.0f",
-                    stream.slug, result.papers_found, result.papers_saved, elapsed_ms,
-                )
-            except Exception as exc:
-                _maint_log.warning("stream-scheduler: %r failed: %s", stream.slug, exc)
+        zotero = _SerializedZotero(self._get_zotero(), threading.Lock())
+        tick_t0 = time.monotonic()
+        failed = 0
+        with ThreadPoolExecutor(
+            max_workers=min(self._MAX_PARALLEL_RUNS, len(due)), thread_name_prefix="stream-run",
+        ) as pool:
+            futures = {pool.submit(self._run_one, vault, zotero, stream.slug): stream.slug for stream in due}
+            # (n/total) on each line: with runs finishing out of order, the
+            # count is what tells a reader of the log how far the tick is.
+            for n, future in enumerate(as_completed(futures), start=1):
+                slug = futures[future]
+                try:
+                    result, elapsed_ms = future.result()
+                    _maint_log.info(
+                        "stream-scheduler: %r done (%d/%d) — found=%d saved=%d elapsed_ms=%.0f",
+                        slug, n, len(due), result.papers_found, result.papers_saved, elapsed_ms,
+                    )
+                except Exception as exc:
+                    failed += 1
+                    _maint_log.warning("stream-scheduler: %r failed (%d/%d): %s", slug, n, len(due), exc)
+        _maint_log.info(
+            "stream-scheduler: tick done — %d run, %d failed, elapsed_ms=%.0f",
+            len(due), failed, (time.monotonic() - tick_t0) * 1000,
+        )
+
+    def _run_one(self, vault: VaultService, zotero: Any, slug: str) -> tuple[StreamRunResult, float]:
+        _maint_log.info("stream-scheduler: running %r", slug)
+        t0 = time.monotonic()
+        result = run_stream_and_notify(vault, zotero, slug, self._broadcast, force=False)
+        return result, (time.monotonic() - t0) * 1000
 
 
 def build_streams_router(
@@ -194,8 +289,21 @@ def build_streams_router(
         # KnowledgeGraphService.is_relevant_path), so it would just set "stale"
         # with nothing ever able to clear it.
         _activity.info("action=create_stream slug=%s query=%r freq=%s", s.slug, req.query, req.refresh_frequency)
+        # Claimed here rather than in the thread, so this response already
+        # reports running=True. _run_claimed() releases it when the run ends.
+        if req.run_initial and _claim_run(s.slug):
+            threading.Thread(
+                target=_run_initial, args=(s.slug,), daemon=True, name=f"stream-initial-{s.slug}",
+            ).start()
         return _stream_meta(s)
 
+    def _run_initial(slug: str) -> None:
+        try:
+            _run_claimed(get_vault(), get_zotero(), slug, broadcast_fn, force=True)
+        except Exception as exc:
+            _maint_log.warning("initial run of %r failed: %s", slug, exc)
+            broadcast_fn({"type": "stream_progress", "slug": slug, "status": "failed"})
+
     @router.patch("/{slug}", response_model=StreamMeta)
     def patch_stream(slug: str, req: StreamPatchRequest):
         updates = {k: v for k, v in req.model_dump().items() if v is not None}
@@ -1177,6 +1177,13 @@ def main(
         capacity, affinity, pool_models, model_concurrency, pool_vram_budget, model_vram,
         model_background_limit, ollama_base_url=_ollama_base_url(), pool_provider=pool_provider,
     )
+    supervisor = Supervisor(workers, resources)
+    # Bind the control port before spawning anything: if it's taken (most
+    # often by a `prisma serve` that's already running) this fails here,
+    # rather than after all four workers and the VRAM profiler have already
+    # been started for nothing.
+    http_server = ThreadingHTTPServer(("127.0.0.1", supervisor_port), _make_handler(supervisor))
+
     # Best-effort check with whatever's already known (config + previously
     # saved profiles) — don't wait for the profiling thread below, which can
     # take minutes if several models need a fresh probe. Re-checked with the
@@ -1188,10 +1195,8 @@ def main(
         daemon=True, name="vram-profiler",
     ).start()
 
-    supervisor = Supervisor(workers, resources)
     supervisor.start_all()
 
-    http_server = ThreadingHTTPServer(("127.0.0.1", supervisor_port), _make_handler(supervisor))
     http_thread = threading.Thread(target=http_server.serve_forever, daemon=True, name="supervisor-http")
     http_thread.start()
     log.info("control API on http://127.0.0.1:%d", supervisor_port)
@@ -101,33 +101,35 @@ def build_zotero_router(
     @router.get("/stats", response_model=ZoteroStatsResponse)
     def zotero_stats():
         """Library-wide item-type breakdown and metadata-quality score, computed
-        over the same ZoteroClient.get_all_items() used elsewhere — not a
-        second, independent client (the old CLI's cleanup.py had its own)."""
+        over the same ZoteroClient item listing used elsewhere — not a
+        second, independent client (the old CLI's cleanup.py had its own).
+        Counted in one pass as pages arrive, never holding the library."""
+        total = 0
+        item_type_counts: dict[str, int] = {}
+        items_without_doi = 0
+        items_without_abstract = 0
+        items_without_authors = 0
         try:
-            items = get_zotero().get_all_items()
+            for item in get_zotero().iter_all_items():
+                total += 1
+                item_type_counts[item.item_type] = item_type_counts.get(item.item_type, 0) + 1
+                if not item.doi:
+                    items_without_doi += 1
+                if not item.abstract_note:
+                    items_without_abstract += 1
+                # any() stops at the first author; item.authors would format
+                # every creator's full name just to be tested for emptiness
+                if not any(c.creator_type == "author" for c in item.creators):
+                    items_without_authors += 1
         except Exception as e:
             raise HTTPException(status_code=503, detail=str(e))
 
-        if not items:
+        if not total:
             return ZoteroStatsResponse(
                 total_items=0, item_type_counts={}, items_without_doi=0,
                 items_without_abstract=0, items_without_authors=0, quality_score=100.0,
             )
 
-        item_type_counts: dict[str, int] = {}
-        items_without_doi = 0
-        items_without_abstract = 0
-        items_without_authors = 0
-        for item in items:
-            item_type_counts[item.item_type] = item_type_counts.get(item.item_type, 0) + 1
-            if not item.doi:
-                items_without_doi += 1
-            if not item.abstract_note:
-                items_without_abstract += 1
-            if not item.authors:
-                items_without_authors += 1
-
-        total = len(items)
         quality_score = 100 - (
             (items_without_doi + items_without_abstract + items_without_authors) / (total * 3) * 100
         )
@@ -12,10 +12,14 @@ whatever's contending for the local GPU.
 """
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
+import threading
 
-from openai import OpenAI
+import httpx
+import requests
+from openai import DefaultHttpxClient, OpenAI
 
 from prisma.services import resource_lock
 from prisma.utils.config import ChatConfig, LLMConfig
@@ -24,6 +28,56 @@ _log = logging.getLogger("prisma.chat_llm")
 
 _RESOURCE_HOLDER = "api"  # chat runs inside the api process — matches its worker name
 
+# HTTP/2 needs the optional `h2` package (pip install prisma[http2]) and
+# only ever applies to https endpoints (openrouter) -- httpx negotiates it
+# via TLS ALPN, and local Ollama/llama.cpp are plain-http HTTP/1.1
+# servers. Over one TLS connection, concurrent AnalysisAgent calls become
+# multiplexed streams instead of each needing its own handshake.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Explicit rather than the SDK's 1000/100 default: a bounded pool sized
+# well above max_concurrent_inferences (max 16) plus live chat, and a
+# 30s keep-alive so a socket survives the gap between one LLM call
+# finishing and the next batch starting (httpx's default drops idle
+# connections after 5s).
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=16, keepalive_expiry=30.0)
+
+_clients: dict[tuple[str, str], OpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def _shared_client(base_url: str, api_key: str) -> OpenAI:
+    """One OpenAI client (and so one httpx connection pool) per
+    (base_url, api_key) for the whole process. Every AnalysisAgent builds
+    its own ChatLLM -- the dedup service, stream runs and the coordinator
+    each construct one -- and a fresh client per instance meant a fresh
+    pool too, so keep-alive connections to the same Ollama host were never
+    reused across them and each new agent paid the TCP handshake again.
+    The client holds no per-caller state (model/temperature/max_tokens are
+    all per-request), so sharing it is safe; httpx.Client is thread-safe.
+
+    timeout=180.0: without this, an OpenAI-SDK call has no default
+    ceiling at all — found live: this call site was the one gap the
+    kg-extraction num_predict bug didn't already cover elsewhere.
+    Per-call complete(timeout=...) overrides this for callers that need
+    tighter/looser bounds per prompt (see AnalysisAgent)."""
+    key = (base_url, api_key)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            http_client = DefaultHttpxClient(
+                http2=_HTTP2_AVAILABLE and base_url.startswith("https://"), limits=_HTTP_LIMITS,
+            )
+            client = OpenAI(base_url=base_url, api_key=api_key, timeout=180.0, http_client=http_client)
+            _clients[key] = client
+        return client
+
+
+class LeaseDenied(Exception):
+    """Raised by complete(raise_on_denied=True) when resource_lock never
+    granted a lease -- the backend wasn't asked at all, so unlike a failed
+    call this says nothing about whether it's healthy."""
+
 
 class ChatLLM:
     def __init__(
@@ -42,14 +96,10 @@ class ChatLLM:
         # see resource_lock.lease's docstring. Callers doing background work
         # instead (AnalysisAgent, via from_llm_config) pass priority="background".
         self._priority = priority
-        # timeout=180.0: without this, an OpenAI-SDK call has no default
-        # ceiling at all — found live: this call site was the one gap the
-        # kg-extraction num_predict bug didn't already cover elsewhere.
-        # Per-call complete(timeout=...) overrides this for callers that need
-        # tighter/looser bounds per prompt (see AnalysisAgent).
-        self._client = OpenAI(
-            base_url=self._resolve_base_url(), api_key=self._resolve_api_key(), timeout=180.0,
-        )
+        self._client = _shared_client(self._resolve_base_url(), self._resolve_api_key())
+        # The per-instance constant part of every completions.create() call,
+        # built once; complete() merges in only what varies per call.
+        self._request_base = {"model": chat_config.model, "max_tokens": chat_config.max_tokens}
 
     @classmethod
     def from_llm_config(
@@ -127,6 +177,40 @@ class ChatLLM:
             return key
         return "ollama"  # placeholder — Ollama/llama.cpp's OpenAI-compat endpoints ignore the key, but the SDK requires a non-empty string
 
+    def preload(self, keep_alive: str = "30m") -> bool:
+        """Ask Ollama to load this model now and keep it resident for
+        `keep_alive`, via its native /api/generate with an empty prompt (the
+        OpenAI-compatible endpoint has no keep_alive knob, so the first
+        real completion otherwise pays the full model load and the model is
+        dropped again after Ollama's own 5-minute default idle). Lease-gated
+        like complete(), since loading weights is GPU work that can evict
+        another resident model. Only meaningful for provider="ollama" --
+        llama-swap loads on first request and openrouter has nothing to
+        load -- so anything else is a no-op returning False, as is any
+        failure: a failed preload only means the first real call is slow."""
+        if self._config.provider != "ollama":
+            return False
+        native_url = self._resolve_base_url().removesuffix("/").removesuffix("/v1")
+        with resource_lock.lease(
+            self._supervisor_host, self._supervisor_port,
+            holder=_RESOURCE_HOLDER, model=self._config.model, pool=self._config.pool,
+            priority=self._priority,
+        ) as granted:
+            if not granted:
+                return False
+            try:
+                resp = requests.post(
+                    f"{native_url}/api/generate",
+                    json={"model": self._config.model, "prompt": "", "keep_alive": keep_alive, "stream": False},
+                    timeout=120,
+                )
+                resp.raise_for_status()
+            except requests.RequestException as exc:
+                _log.warning("model preload failed: model=%s error=%s", self._config.model, exc)
+                return False
+        _log.info("model preloaded: model=%s keep_alive=%s", self._config.model, keep_alive)
+        return True
+
     def complete(
         self,
         messages: list[dict],
@@ -134,31 +218,39 @@ class ChatLLM:
         *,
         max_tokens: int | None = None,
         timeout: float | None = None,
+        response_format: dict | None = None,
+        raise_on_denied: bool = False,
     ) -> str | None:
         """One resource_lock-gated chat completion call. Returns None if the
         lease was denied or the call failed — callers must treat that as
         "couldn't get an answer right now," not "the model said nothing."
+        With raise_on_denied=True a denied lease raises LeaseDenied instead,
+        for callers that need to tell a busy pool apart from a failing
+        backend (AnalysisAgent's circuit breaker).
 
         `max_tokens`/`timeout` override this instance's config default for
         just this call — e.g. AnalysisAgent wants a short cap for a
         yes/no-style prompt and a long one for a full summary, from the
-        same ChatLLM instance."""
+        same ChatLLM instance. `response_format` is passed through as-is
+        (e.g. {"type": "json_object"} -- Ollama, llama.cpp and most
+        OpenRouter models constrain decoding to valid JSON with it)."""
         with resource_lock.lease(
             self._supervisor_host, self._supervisor_port,
             holder=_RESOURCE_HOLDER, model=self._config.model, pool=self._config.pool,
             priority=self._priority,
         ) as granted:
             if not granted:
+                if raise_on_denied:
+                    raise LeaseDenied(self._config.model)
                 return None
             try:
-                kwargs = dict(
-                    model=self._config.model,
-                    messages=messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens if max_tokens is not None else self._config.max_tokens,
-                )
+                kwargs = self._request_base | {"messages": messages, "temperature": temperature}
+                if max_tokens is not None:
+                    kwargs["max_tokens"] = max_tokens
                 if timeout is not None:
                     kwargs["timeout"] = timeout
+                if response_format is not None:
+                    kwargs["response_format"] = response_format
                 resp = self._client.chat.completions.create(**kwargs)
             except Exception as exc:
                 _log.warning("chat completion failed: %s", exc)
@@ -5,6 +5,7 @@ import logging
 import threading
 from pathlib import Path
 
+import orjson
 import requests
 
 from prisma.services import resource_lock
@@ -17,6 +18,14 @@ _log = logging.getLogger("prisma.chroma")
 
 _RESOURCE_HOLDER = "api"  # must match the worker name supervisor.py restarts, so a crash releases our leases
 
+# Indexing the vault embeds it batch by batch, one POST each, all to the
+# same Ollama/llama-server host -- often not localhost (Ollama on the
+# Windows side of WSL, or a GPU box). A bare requests.post() opened a new
+# connection for every batch; one shared session keeps it alive across
+# them. urllib3's pool is thread-safe, so the indexer thread and query-time
+# embeds can share it.
+_embed_session = requests.Session()
+
 
 def _embed_texts(
     texts: list[str], model: str, base_url: str = "http://localhost:11434", provider: str = "ollama",
@@ -25,10 +34,15 @@ def _embed_texts(
     response shape). provider="llama_cpp" uses the OpenAI-compatible
     /v1/embeddings endpoint that llama-server/llama-swap expose (e.g. served
     from a bge-m3-style embedding model) — same idea, different wire format,
-    so this is a real branch, not just a base_url swap like chat_llm.py's."""
+    so this is a real branch, not just a base_url swap like chat_llm.py's.
+
+    Bodies are decoded with orjson straight from resp.content: an embed
+    response is almost entirely floats (dims x texts per batch, hundreds of
+    KB for a full chunk batch), which is exactly where the stdlib decoder
+    behind resp.json() is slowest -- and it first decodes the bytes to str."""
     try:
         if provider == "llama_cpp":
-            resp = requests.post(
+            resp = _embed_session.post(
                 f"{base_url}/v1/embeddings",
                 json={"model": model, "input": texts},
                 timeout=60,
@@ -36,9 +50,9 @@ def _embed_texts(
             if resp.status_code != 200:
                 _log.warning("embed failed: status=%d", resp.status_code)
                 return None
-            data = sorted(resp.json().get("data", []), key=lambda item: item.get("index", 0))
+            data = sorted(orjson.loads(resp.content).get("data", []), key=lambda item: item.get("index", 0))
             return [item["embedding"] for item in data]
-        resp = requests.post(
+        resp = _embed_session.post(
             f"{base_url}/api/embed",
             json={"model": model, "input": texts},
             timeout=60,
@@ -46,7 +60,7 @@ def _embed_texts(
         if resp.status_code != 200:
             _log.warning("embed failed: status=%d", resp.status_code)
             return None
-        return resp.json().get("embeddings")
+        return orjson.loads(resp.content).get("embeddings")
     except Exception as exc:
         _log.warning("embed error: %s", exc)
         return None
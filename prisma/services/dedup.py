@@ -8,9 +8,11 @@ Two entry points:
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
+from collections import Counter
 from typing import TYPE_CHECKING
 
-from prisma.utils.text import significant_words
+from prisma.utils.text import normalize_doi, normalize_title, significant_words, strict_title_key
 
 if TYPE_CHECKING:
     from prisma.integrations.zotero import ZoteroClient
@@ -39,8 +41,10 @@ def build_index(items) -> tuple[dict, dict, list[tuple[frozenset, object]]]:
     stems: list[tuple[frozenset, object]] = []
     for item in items:
         if item.doi:
-            by_doi[item.doi.lower().strip()] = item
-        by_title[item.title.lower().strip()] = item
+            by_doi[normalize_doi(item.doi)] = item
+        title_key = normalize_title(item.title)
+        if title_key:
+            by_title[title_key] = item
         stems.append((significant_words(item.title), item))
     return by_doi, by_title, stems
 
@@ -61,7 +65,7 @@ def find_duplicate(
 
     Levels:
       1. DOI exact match (in-memory)
-      2. Title exact match (in-memory)
+      2. Title exact match, ignoring case/punctuation (in-memory)
       3. Zotero search via find_by_identifier (optional, requires zotero)
       4. NLTK stem overlap ≥ certain threshold → certain match
       5. NLTK stem overlap ≥ ambiguous threshold → LLM identity check
@@ -73,12 +77,13 @@ def find_duplicate(
     _STEM_CERTAIN, _STEM_AMBIGUOUS = _stem_thresholds(sensitivity)
 
     if paper.doi:
-        hit = by_doi.get(paper.doi.lower().strip())
+        hit = by_doi.get(normalize_doi(paper.doi))
         if hit is not None:
             _log.info("dedup DOI: %r matched %r", paper.title, hit.title)
             return hit
 
-    hit = by_title.get(paper.title.lower().strip())
+    title_key = normalize_title(paper.title)
+    hit = by_title.get(title_key) if title_key else None
     if hit is not None:
         _log.info("dedup title: %r matched %r", paper.title, hit.title)
         return hit
@@ -124,19 +129,36 @@ def find_duplicate(
     return None
 
 
+# Per-item extractors (_author_pairs, _int_year, the title/DOI keys) are
+# each called once per item per find_all_duplicates/build_index call, so
+# memoizing them on the item would only add a cache to invalidate --
+# ZoteroItems are mutable, and every from_zotero_data() call returns a
+# fresh copy, so a memo on one copy never reaches the next fetch anyway.
+# The one repeated cost across calls, stemming titles, is cached in
+# significant_words() itself.
+def _author_pairs(item) -> frozenset[tuple[str, str]]:
+    """(last name, first initial) for each of the item's authors -- the
+    keys of find_all_duplicates' author index, so sharing an author is a
+    bucket collision there rather than a set intersection per pair."""
+    pairs = set()
+    for creator in (item.creators or []):
+        if creator.creator_type != "author":
+            continue
+        last = (creator.last_name or "").strip().lower()
+        first = (creator.first_name or "").strip()
+        if last:
+            pairs.add((last, first[0].lower() if first else ""))
+    return frozenset(pairs)
+
+
+def _int_year(item) -> int | None:
+    year = getattr(item, "year", None)
+    return int(year) if year else None
+
+
 def _authors_match(a, b) -> bool:
     """True if at least one author shares last name + first initial."""
-    def _pairs(item):
-        pairs = set()
-        for creator in (item.creators or []):
-            if creator.creator_type != "author":
-                continue
-            last = (creator.last_name or "").strip().lower()
-            first = (creator.first_name or "").strip()
-            if last:
-                pairs.add((last, first[0].lower() if first else ""))
-        return pairs
-    return bool(_pairs(a) & _pairs(b))
+    return not _author_pairs(a).isdisjoint(_author_pairs(b))
 
 
 def find_all_duplicates(
@@ -152,7 +174,7 @@ def find_all_duplicates(
 
     Levels (stop at max_level):
       1. DOI exact match
-      2. Title exact match
+      2. Title exact match (strict_title_key: case, whitespace, curly quotes, trailing period)
       3. Year ±1 + author last name + first initial (Zotero desktop algorithm)
       4. NLTK stem overlap ≥ STEM_CERTAIN → certain match
       5. NLTK stem overlap ≥ STEM_AMBIGUOUS → LLM identity check
@@ -160,17 +182,24 @@ def find_all_duplicates(
     _log = log or logging.getLogger("prisma.dedup")
     _STEM_CERTAIN, _STEM_AMBIGUOUS = _stem_thresholds(sensitivity)
 
-    # Level 1: group by DOI
+    # Level 1: group by DOI. Levels 1-2 are already one dict-bucketing
+    # pass each -- a groupby -- so a DataFrame would only add a pandas
+    # dependency and a per-item conversion on top of the same O(N) work;
+    # the cost that mattered was the pairwise levels below.
     by_doi: dict[str, list] = {}
-    no_doi: list = []
     for item in items:
-        doi = item.doi.lower().strip() if item.doi else None
+        doi = normalize_doi(item.doi) if item.doi else None
         if doi:
             by_doi.setdefault(doi, []).append(item)
-        else:
-            no_doi.append(item)
 
     groups: list[list] = [g for g in by_doi.values() if len(g) >= 2]
+    # Levels run strongest-evidence first, and every later level builds its
+    # buckets and indexes only over items no earlier level has grouped --
+    # a DOI-matched item never reaches the author or stem comparisons.
+    # That already specializes to the library: a DOI-heavy one leaves the
+    # later levels little to index, a DOI-less one pays one cheap dict
+    # pass at level 1, so there's nothing to gain from sampling item
+    # types up front to pick a separate code path.
     already_grouped: set[str] = {item.key for g in groups for item in g}
 
     if max_level < 2:
@@ -181,8 +210,14 @@ def find_all_duplicates(
     for item in items:
         if item.key in already_grouped:
             continue
-        key = item.title.lower().strip()
-        by_title.setdefault(key, []).append(item)
+        # Groups found here get deleted down to one item, so key on
+        # strict_title_key(): a trailing period or curly quote from one
+        # import shouldn't keep an otherwise identical title apart, but
+        # "C++ Programming" and "C Programming" must stay apart.
+        # normalize_title() folds those together. A title with no word
+        # characters at all matches nothing.
+        if normalize_title(item.title):
+            by_title.setdefault(strict_title_key(item.title), []).append(item)
 
     for g in by_title.values():
         if len(g) >= 2:
@@ -192,23 +227,42 @@ def find_all_duplicates(
     if max_level < 3:
         return groups
 
-    # Level 3: year ±1 + author last name + first initial
+    # Level 3: year ±1 + author last name + first initial. Candidates come
+    # from an author-pair index rather than a scan of every later item: two
+    # items can only match here if they share a (last, initial) pair.
+    # Each item's author pairs and year are derived once up front; the
+    # candidate loop below then only compares sets and ints. With the
+    # author index cutting candidates to actual collisions, what's left is
+    # too little work to repay a compiled (Numba) kernel and the array
+    # packing it would need.
     ungrouped = [item for item in items if item.key not in already_grouped]
+    pairs = [_author_pairs(item) for item in ungrouped]
+    years = [_int_year(item) for item in ungrouped]
+    by_author: dict[tuple[str, str], list[int]] = {}
+    for i, item_pairs in enumerate(pairs):
+        for pair in item_pairs:
+            by_author.setdefault(pair, []).append(i)
     visited: set[str] = set()
     for i, item_i in enumerate(ungrouped):
         if item_i.key in visited:
             continue
-        year_i = getattr(item_i, "year", None)
+        year_i = years[i]
         matched: list = []
-        for item_j in ungrouped[i + 1:]:
+        # Each author's bucket is in ascending index order, so the later
+        # items are a bisected slice rather than a filtered scan
+        candidates: set[int] = set()
+        for pair in pairs[i]:
+            bucket = by_author[pair]
+            candidates.update(bucket[bisect_right(bucket, i):])
+        for j in sorted(candidates):
+            item_j = ungrouped[j]
             if item_j.key in visited:
                 continue
-            year_j = getattr(item_j, "year", None)
-            if year_i and year_j and abs(int(year_i) - int(year_j)) > 1:
+            year_j = years[j]
+            if year_i and year_j and abs(year_i - year_j) > 1:
                 continue
-            if _authors_match(item_i, item_j):
-                matched.append(item_j)
-                _log.info("dedup year+author: %r matched %r", item_i.title, item_j.title)
+            matched.append(item_j)
+            _log.info("dedup year+author: %r matched %r", item_i.title, item_j.title)
         if matched:
             group = [item_i] + matched
             groups.append(group)
@@ -218,19 +272,27 @@ def find_all_duplicates(
     if max_level < 4:
         return groups
 
-    # Level 4: NLTK stem overlap ≥ STEM_CERTAIN
+    # Level 4: NLTK stem overlap ≥ STEM_CERTAIN. Overlaps are counted off
+    # a stem -> items inverted index, so only items sharing at least one
+    # stem with item_i are ever looked at.
     ungrouped = [item for item in items if item.key not in already_grouped]
     stems = [(significant_words(item.title), item) for item in ungrouped]
+    by_stem: dict[str, list[int]] = {}
+    for j, (stems_j, _) in enumerate(stems):
+        for stem in stems_j:
+            by_stem.setdefault(stem, []).append(j)
     visited = set()
     for i, (stems_i, item_i) in enumerate(stems):
         if item_i.key in visited:
             continue
+        overlaps = Counter(j for stem in stems_i for j in by_stem[stem])
         certain_matches: list = []
         llm_candidates: list[tuple[str, str, object]] = []
-        for j, (stems_j, item_j) in enumerate(stems):
+        for j in sorted(overlaps):
+            item_j = stems[j][1]
             if i == j or item_j.key in visited:
                 continue
-            overlap = len(stems_i & stems_j)
+            overlap = overlaps[j]
             if overlap >= _STEM_CERTAIN:
                 certain_matches.append(item_j)
                 _log.info("dedup stem-certain: %r matched %r (overlap=%d)", item_i.title, item_j.title, overlap)
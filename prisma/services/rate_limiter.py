@@ -23,9 +23,11 @@ class RateLimiter:
     """Token-bucket rate limiter with an optional hard daily cap.
 
     `requests_per_second` refills the bucket continuously (burst capacity
-    is always 1 — sources here are called in a simple sequential loop, not
-    bursts, so smoothing to a steady rate is what matches each API's real
-    published guidance). `daily_cap`, if set, is a separate hard ceiling
+    is always 1 — SearchAgent fans out *across* sources concurrently, but
+    each source still makes its own requests one after another, so
+    smoothing to a steady rate is what matches each API's real published
+    guidance). A caller only ever waits when the budget is actually spent:
+    the first request after an idle gap is granted immediately. `daily_cap`, if set, is a separate hard ceiling
     tracked by UTC calendar day — for quotas like Google Books' 10,000
     requests/day, where waiting for a fresh token would mean waiting up to
     a whole day, so a denial should surface immediately instead of via a
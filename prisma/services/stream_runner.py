@@ -1,13 +1,25 @@
+from __future__ import annotations
+
 import logging
+import threading
 import time
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from typing import Callable
 
 from prisma.integrations.zotero import ZoteroClient
 from prisma.services.dedup import build_index, find_duplicate
 from prisma.services.vault import VaultService
-from prisma.storage.models.vault_models import StreamRunResult
-from prisma.utils.text import significant_words
+from prisma.storage.models.vault_models import RefreshFrequency, StreamRunResult
+from prisma.utils.text import normalize_doi, normalize_title, significant_words
+
+# Days until a stream's next scheduled run; 0 = never (manual).
+_REFRESH_DAYS = {
+    RefreshFrequency.daily: 1,
+    RefreshFrequency.weekly: 7,
+    RefreshFrequency.monthly: 30,
+    RefreshFrequency.manual: 0,
+}
 
 
 def run_stream(
@@ -17,6 +29,7 @@ def run_stream(
     *,
     force: bool = False,
     get_stream_logger: Callable[[str], logging.Logger] | None = None,
+    bookmark_lock: threading.Lock | None = None,
 ) -> StreamRunResult:
     from prisma.agents.analysis_agent import AnalysisAgent
     from prisma.agents.search_agent import SearchAgent
@@ -123,6 +136,19 @@ def run_stream(
 
     _dedup_doi, _dedup_title, _dedup_stems = build_index(collection_items)
 
+    def _add_to_collection(keys: list[str]) -> dict[str, bool]:
+        # One batched write per relevance pass rather than a fetch + write
+        # per accepted item -- a new stream's first run can accept dozens.
+        # Only keys mapped to True here were actually written (Zotero can
+        # reject single objects of a batch), and only those count as saved.
+        if not keys:
+            return {}
+        try:
+            return zotero.add_items_to_collection(keys, collection_key)
+        except Exception as exc:
+            _slog.error("add_items_to_collection failed for %d items: %s", len(keys), exc)
+            return {}
+
     def _already_in_collection(paper) -> bool:
         hit = find_duplicate(
             paper, _dedup_doi, _dedup_title, _dedup_stems,
@@ -164,50 +190,82 @@ def run_stream(
                 stream.query,
                 [(item.key, item.title, item.abstract_note) for item in new_library_candidates],
             )
+            relevant_items = []
             for lib_item, is_relevant in zip(new_library_candidates, relevance_flags):
                 _slog.info("library %r → relevant=%s", lib_item.title, is_relevant)
                 if not is_relevant:
                     papers_skipped_llm += 1
                     continue
-                try:
-                    zotero.add_item_to_collection(lib_item.key, collection_key)
-                    collection_item_keys.add(lib_item.key)
-                    _dedup_title[lib_item.title.lower().strip()] = lib_item
-                    if lib_item.doi:
-                        _dedup_doi[lib_item.doi.lower().strip()] = lib_item
-                    papers_saved += 1
-                    _slog.info("saved library item key=%r (total saved=%d)", lib_item.key, papers_saved)
-                except Exception as exc:
-                    _slog.error("add_item_to_collection failed for key=%r: %s", lib_item.key, exc)
-                    errors.append(str(exc))
-
-    # Source 2: Internet — Phase 2a: dedup + bookmark
+                relevant_items.append(lib_item)
+            added = _add_to_collection([item.key for item in relevant_items])
+            for lib_item in relevant_items:
+                if not added.get(lib_item.key):
+                    _slog.error("add_items_to_collection failed for key=%r", lib_item.key)
+                    errors.append(f"add to collection failed: {lib_item.key}")
+                    continue
+                collection_item_keys.add(lib_item.key)
+                _dedup_title[normalize_title(lib_item.title)] = lib_item
+                if lib_item.doi:
+                    _dedup_doi[normalize_doi(lib_item.doi)] = lib_item
+                papers_saved += 1
+                _slog.info("saved library item key=%r (total saved=%d)", lib_item.key, papers_saved)
+
+    # Source 2: Internet — Phase 2a: dedup + bookmark. Papers not yet in
+    # the library are collected first and created in one batched write
+    # rather than one POST per paper.
     _slog.info("source=internet papers=%d", len(result.papers))
     bookmarked: list[tuple[object, object]] = []
-    for paper in result.papers:
-        _slog.info("internet paper %r doi=%s", paper.title, paper.doi or "none")
-        if not zotero.is_available() or not collection_key:
-            _slog.info("skipping — Zotero offline or no collection")
-            break
+    to_create: list = []
+    pending_keys: set[str] = set()
+    # Held from the library lookup through the create: streams running side
+    # by side can turn up the same paper, and without it both lookups miss
+    # and both runs create it.
+    with bookmark_lock or nullcontext():
+        for paper in result.papers:
+            _slog.info("internet paper %r doi=%s", paper.title, paper.doi or "none")
+            if not zotero.is_available() or not collection_key:
+                _slog.info("skipping — Zotero offline or no collection")
+                break
+
+            if _already_in_collection(paper):
+                continue
 
-        if _already_in_collection(paper):
-            continue
+            try:
+                existing_in_library = zotero.find_by_identifier(doi=paper.doi, title=paper.title)
+                if existing_in_library is not None:
+                    if collection_key and collection_key in existing_in_library.collections:
+                        _slog.info("%r already in collection (item.collections) — skipping", paper.title)
+                        continue
+                    _slog.info("%r already in library key=%r — reusing", paper.title, existing_in_library.key)
+                    bookmarked.append((paper, existing_in_library))
+                    continue
+            except Exception as exc:
+                _slog.error("bookmark failed for %r: %s", paper.title, exc)
+                errors.append(f"bookmark: {exc}")
+                continue
 
-        try:
-            existing_in_library = zotero.find_by_identifier(doi=paper.doi, title=paper.title)
-            if existing_in_library is not None:
-                if collection_key and collection_key in existing_in_library.collections:
-                    _slog.info("%r already in collection (item.collections) — skipping", paper.title)
+            # Two results for the same paper would otherwise both be created --
+            # neither is in the library yet for find_by_identifier() to see.
+            keys = {normalize_title(paper.title)} | ({normalize_doi(paper.doi)} if paper.doi else set())
+            keys.discard("")
+            if keys & pending_keys:
+                _slog.info("%r already queued for bookmarking — skipping", paper.title)
+                continue
+            pending_keys |= keys
+            to_create.append(paper)
+
+        if to_create:
+            # Aligned with to_create, None wherever that paper wasn't created
+            # -- a failed batch only costs its own papers (add_papers never
+            # raises), so everything that was created still gets screened.
+            created = zotero.add_papers(to_create)
+            for paper, library_item in zip(to_create, created):
+                if library_item is None:
+                    _slog.error("bookmark failed for %r: rejected by Zotero", paper.title)
+                    errors.append(f"bookmark: Zotero rejected {paper.title!r}")
                     continue
-                _slog.info("%r already in library key=%r — reusing", paper.title, existing_in_library.key)
-                library_item = existing_in_library
-            else:
-                library_item = zotero.add_paper(paper)
                 _slog.info("bookmarked %r → key=%r", paper.title, library_item.key)
-            bookmarked.append((paper, library_item))
-        except Exception as exc:
-            _slog.error("bookmark failed for %r: %s", paper.title, exc)
-            errors.append(f"bookmark: {exc}")
+                bookmarked.append((paper, library_item))
 
     # Phase 2b: batch relevance check (stem pre-filter first)
     if bookmarked:
@@ -222,25 +280,27 @@ def run_stream(
             stream.query,
             [(lib.key, paper.title, paper.abstract) for paper, lib in bookmarked],
         )
+        relevant = []
         for (paper, library_item), is_relevant in zip(bookmarked, relevance_flags):
             _slog.info("internet %r → relevant=%s", paper.title, is_relevant)
             if not is_relevant:
                 papers_skipped_llm += 1
                 continue
-            try:
-                zotero.add_item_to_collection(library_item.key, collection_key)
-                collection_item_keys.add(library_item.key)
-                _dedup_title[paper.title.lower().strip()] = library_item
-                if paper.doi:
-                    _dedup_doi[paper.doi.lower().strip()] = library_item
-                papers_saved += 1
-                _slog.info("saved %r (total saved=%d)", paper.title, papers_saved)
-            except Exception as exc:
-                _slog.error("add_item_to_collection failed for %r: %s", paper.title, exc)
-                errors.append(str(exc))
-
-    freq_map = {"daily": 1, "weekly": 7, "monthly": 30, "manual": 0}
-    days = freq_map.get(stream.refresh_frequency.value, 7)
+            relevant.append((paper, library_item))
+        added = _add_to_collection([library_item.key for _, library_item in relevant])
+        for paper, library_item in relevant:
+            if not added.get(library_item.key):
+                _slog.error("add_items_to_collection failed for %r", paper.title)
+                errors.append(f"add to collection failed: {library_item.key}")
+                continue
+            collection_item_keys.add(library_item.key)
+            _dedup_title[normalize_title(paper.title)] = library_item
+            if paper.doi:
+                _dedup_doi[normalize_doi(paper.doi)] = library_item
+            papers_saved += 1
+            _slog.info("saved %r (total saved=%d)", paper.title, papers_saved)
+
+    days = _REFRESH_DAYS.get(stream.refresh_frequency, 7)
     next_update = (datetime.now() + timedelta(days=days)) if days else None
 
     vault.save_stream(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
 import threading
 from datetime import datetime
@@ -190,6 +191,10 @@ class VaultService:
         self._chat_write_lock = threading.Lock()
         # Same rationale as _chat_write_lock, for /sync/file's writes.
         self._path_write_lock = threading.Lock()
+        # Parsed streams by path, valid while the file's (mtime, size) is
+        # unchanged -- see _load_stream().
+        self._stream_cache: dict[Path, tuple[tuple[int, int], Stream]] = {}
+        self._stream_cache_lock = threading.Lock()
 
     def ensure_dirs(self) -> None:
         for d in self.default_dirs.values():
@@ -680,8 +685,32 @@ class VaultService:
         path = self.find_stream_path(slug)
         if path is None:
             raise FileNotFoundError(f"stream not found: {slug!r}")
-        fm = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        return self._load_stream(path)
+
+    def _load_stream(self, path: Path) -> Stream:
+        # The scheduler re-lists every stream each tick to find the due
+        # ones, but most stream files haven't changed since the last tick;
+        # re-parse a file's YAML only when its mtime or size moves. Our own
+        # writes drop the entry outright (_forget_stream()), since two
+        # same-size rewrites can land within one mtime tick. Streams aren't
+        # mutated in place, so a cached instance is safe to hand out again.
         stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._stream_cache_lock:
+            cached = self._stream_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        stream = self._parse_stream(path, stat)
+        with self._stream_cache_lock:
+            self._stream_cache[path] = (key, stream)
+        return stream
+
+    def _forget_stream(self, path: Path) -> None:
+        with self._stream_cache_lock:
+            self._stream_cache.pop(path, None)
+
+    def _parse_stream(self, path: Path, stat: os.stat_result) -> Stream:
+        fm = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
         try:
             status = StreamStatus(fm.get("status", "active"))
         except ValueError:
@@ -713,14 +742,27 @@ class VaultService:
         if not streams_dir.exists():
             return []
         result = []
+        # Load each globbed file directly -- going through get_stream(slug)
+        # re-scanned the whole directory (find_stream_path) once per stream.
         for path in streams_dir.glob("*.yaml"):
             try:
-                result.append(self.get_stream(_file_slug(path.stem)))
+                result.append(self._load_stream(path))
             except Exception as exc:
                 _log.warning("skipping unreadable stream %s: %s", path, exc)
         result.sort(key=lambda s: s.modified_at, reverse=True)
         return result
 
+    def list_due_streams(self, now: datetime | None = None) -> list[Stream]:
+        """Active, scheduled (non-manual) streams whose next_update has
+        passed -- or was never set -- as of `now`."""
+        now = now or datetime.now()
+        return [
+            s for s in self.list_streams()
+            if s.status == StreamStatus.active
+            and s.refresh_frequency != RefreshFrequency.manual
+            and (s.next_update is None or s.next_update <= now)
+        ]
+
     def create_stream(
         self,
         title: str,
@@ -745,6 +787,7 @@ class VaultService:
             data["tags"] = tags
         path = self.default_dirs[NodeType.stream] / f"{slug}.yaml"
         path.write_text(yaml.dump(data, allow_unicode=True, sort_keys=False), encoding="utf-8")
+        self._forget_stream(path)
         return self.get_stream(slug)
 
     def save_stream(self, slug: str, **updates: object) -> Stream:
@@ -758,6 +801,7 @@ class VaultService:
             else:
                 data[k] = v.isoformat() if isinstance(v, datetime) else v
         path.write_text(yaml.dump(data, allow_unicode=True, sort_keys=False), encoding="utf-8")
+        self._forget_stream(path)
         return self.get_stream(slug)
 
     def append_stream_log(self, slug: str, entry: str) -> None:
@@ -770,6 +814,7 @@ class VaultService:
         log.append({"date": date.today().isoformat(), "entry": entry})
         data["log"] = log
         path.write_text(yaml.dump(data, allow_unicode=True, sort_keys=False), encoding="utf-8")
+        self._forget_stream(path)
 
     # ── Tree ─────────────────────────────────────────────────────────────────
 
@@ -984,12 +1029,14 @@ class VaultService:
         with self._path_write_lock:
             path.parent.mkdir(parents=True, exist_ok=True)
             path.write_text(body, encoding="utf-8")
+            self._forget_stream(path)
             return path.stat().st_mtime
 
     def delete_by_path(self, rel_path: str) -> None:
         path = self._safe_sync_path(rel_path)
         with self._path_write_lock:
             path.unlink(missing_ok=True)
+            self._forget_stream(path)
 
     def list_md_manifest(self) -> list[tuple[str, float, int]]:
         """(rel_path, mtime, size) for every synced file — every .md file
@@ -1012,3 +1059,4 @@ class VaultService:
         if path is None:
             raise FileNotFoundError(f"stream not found: {slug!r}")
         path.unlink()
+        self._forget_stream(path)
@@ -8,7 +8,8 @@ from .zotero_models import (
     ZoteroCreator, 
     ZoteroTag, 
     ZoteroLibrary, 
-    ZoteroItemType
+    ZoteroItemType,
+    ACADEMIC_ITEM_TYPES
 )
 
 from .agent_models import (
@@ -42,6 +43,7 @@ __all__ = [
     "ZoteroTag", 
     "ZoteroLibrary", 
     "ZoteroItemType",
+    "ACADEMIC_ITEM_TYPES",
     
     # Agent response models
     "PaperMetadata",
@@ -254,6 +254,24 @@ class LLMIdentityResult(BaseModel):
     reason: str = Field("", description="One-line explanation")
 
 
+class LLMStructuredSummary(BaseModel):
+    """The JSON object AnalysisAgent asks the LLM for per paper --
+    key_findings/methodology may be left empty by the model, in which case
+    the agent falls back to its own text heuristics for that field."""
+    model_config = ConfigDict(populate_by_name=True)
+
+    summary: str = Field(..., min_length=1, description="2-3 sentence summary of the paper")
+    key_findings: List[str] = Field(default_factory=list, description="Main findings, one short sentence each")
+    methodology: str = Field("", description="One-sentence description of the approach")
+
+
+class LLMPaperSummary(LLMStructuredSummary):
+    """One entry of the JSON array AnalysisAgent._summarize_batch asks the
+    LLM for -- `index` is the 1-based position of the paper in the prompt."""
+
+    index: int = Field(..., ge=1, description="1-based paper position in the batch prompt")
+
+
 class OllamaGenerateResponse(BaseModel):
     """Ollama generate API response model"""
     model_config = ConfigDict(populate_by_name=True)
@@ -6,7 +6,8 @@ for ensuring we only include legitimate academic content.
 """
 
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -251,6 +252,19 @@ def get_api_sources() -> List[str]:
     ]
 
 
+@lru_cache(maxsize=32)
+def _lowered(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Criteria keyword lists lower-cased once per distinct list, not once
+    per keyword per paper on every validation call."""
+    return tuple(k.lower() for k in keywords)
+
+
+# Shared default for callers that pass no criteria -- building a fresh
+# AcademicValidationCriteria (a full Pydantic validation) per paper scored
+# was the single most expensive step of validating a search's results.
+_DEFAULT_CRITERIA = AcademicValidationCriteria()
+
+
 def validate_academic_content(
     title: str,
     authors: List[str],
@@ -267,7 +281,7 @@ def validate_academic_content(
         (is_valid, reasons_for_rejection)
     """
     if criteria is None:
-        criteria = AcademicValidationCriteria()
+        criteria = _DEFAULT_CRITERIA
     
     reasons = []
     
@@ -298,8 +312,8 @@ def validate_academic_content(
     # Content quality checks
     content_text = f"{title} {abstract} {venue} {publisher}".lower()
     
-    for keyword in criteria.exclude_keywords:
-        if keyword.lower() in content_text:
+    for keyword, lowered in zip(criteria.exclude_keywords, _lowered(tuple(criteria.exclude_keywords))):
+        if lowered in content_text:
             reasons.append(f"Contains non-academic keyword: {keyword}")
     
     is_valid = len(reasons) == 0
@@ -318,10 +332,12 @@ def get_academic_confidence_score(
     """
     Calculate confidence score (0.0-1.0) for academic content
     
-    Higher scores indicate more confidence that this is legitimate academic content
+    Higher scores indicate more confidence that this is legitimate academic content.
+    Purely rule-based (field presence, lengths, venue keyword hits) -- there
+    are no embedding or TF-IDF vectors behind it to cache or quantize.
     """
     if criteria is None:
-        criteria = AcademicValidationCriteria()
+        criteria = _DEFAULT_CRITERIA
     
     score = 0.0
     max_score = 0.0
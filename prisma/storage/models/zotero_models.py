@@ -6,14 +6,48 @@ collections, and related metadata in a consistent format for use throughout
 the Prisma literature review system.
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
+from collections import OrderedDict
 from datetime import datetime
+from functools import cached_property, lru_cache
 from enum import Enum
 import re
+import sys
+import threading
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 
+@lru_cache(maxsize=4096)
+def _year_from_date(date: str) -> Optional[int]:
+    """ZoteroItem.year's parser, memoized on the date string: a library
+    repeats the same few thousand date strings across its items, and each
+    miss costs up to five failed strptime() calls (~20us), which made
+    `year` the dominant cost of filtering a search by date range."""
+    try:
+        # Try to parse various date formats
+        for fmt in ["%Y", "%Y-%m-%d", "%Y-%m", "%m/%d/%Y", "%d/%m/%Y"]:
+            try:
+                return datetime.strptime(date, fmt).year
+            except ValueError:
+                continue
+        # If no format matches, try to extract 4-digit year
+        match = re.search(r'\b(19|20)\d{2}\b', date)
+        return int(match.group()) if match else None
+    except (ValueError, AttributeError):
+        return None
+
+
+# ZoteroItem.from_zotero_data() results, keyed by (library id, item key,
+# item version). Zotero bumps an item's version on every change, so an
+# unchanged item re-fetched by a later search reuses its parsed model
+# (a few-us copy) instead of re-running validation (~30us), and an edited one
+# simply misses. Items without a version are never cached.
+_PARSED_ITEMS_MAX = 8192
+_parsed_items: "OrderedDict[Tuple[str, str, int], ZoteroItem]" = OrderedDict()
+_parsed_items_lock = threading.Lock()
+
+
 class ZoteroItemType(str, Enum):
     """Supported Zotero item types"""
     JOURNAL_ARTICLE = "journalArticle"
@@ -29,6 +63,15 @@ class ZoteroItemType(str, Enum):
     OTHER = "other"
 
 
+# Item types counted as academic papers (ZoteroItem.is_academic_paper)
+ACADEMIC_ITEM_TYPES = frozenset({
+    ZoteroItemType.JOURNAL_ARTICLE.value,
+    ZoteroItemType.CONFERENCE_PAPER.value,
+    ZoteroItemType.PREPRINT.value,
+    ZoteroItemType.THESIS.value,
+})
+
+
 class ZoteroCreator(BaseModel):
     """Represents a creator (author, editor, etc.) in Zotero"""
     model_config = ConfigDict(populate_by_name=True)
@@ -72,7 +115,15 @@ class ZoteroTag(BaseModel):
     def tag_must_not_be_empty(cls, v):
         if not v or not v.strip():
             raise ValueError('Tag cannot be empty')
-        return v.strip()
+        # A library's tag vocabulary is small and shared by many items;
+        # interning stores each tag string once however many items carry it
+        return sys.intern(v.strip())
+
+    @cached_property
+    def tag_lower(self) -> str:
+        """Lower-cased tag text, computed once per tag for case-insensitive
+        tag filtering (not a field -- never serialized)"""
+        return self.tag.lower()
 
     @classmethod
     def from_zotero_data(cls, data: Union[Dict[str, Any], str]) -> "ZoteroTag":
@@ -173,29 +224,21 @@ class ZoteroItem(BaseModel):
         """Extract year from date string"""
         if not self.date:
             return None
-        try:
-            # Try to parse various date formats
-            for fmt in ["%Y", "%Y-%m-%d", "%Y-%m", "%m/%d/%Y", "%d/%m/%Y"]:
-                try:
-                    return datetime.strptime(self.date, fmt).year
-                except ValueError:
-                    continue
-            # If no format matches, try to extract 4-digit year
-            match = re.search(r'\b(19|20)\d{2}\b', self.date)
-            return int(match.group()) if match else None
-        except (ValueError, AttributeError):
-            return None
+        return _year_from_date(self.date)
     
     @property
     def citation_key(self) -> str:
         """Generate a citation key for the item"""
+        return self._citation_key(self.first_author, self.year)
+    
+    def _citation_key(self, first_author: Optional[str], year: Optional[int]) -> str:
         author_part = ""
-        if self.first_author:
+        if first_author:
             # Get last name or first word of name
-            author_parts = self.first_author.split()
+            author_parts = first_author.split()
             author_part = author_parts[-1] if author_parts else "Unknown"
         
-        year_part = str(self.year) if self.year else "NoDate"
+        year_part = str(year) if year else "NoDate"
         title_part = ""
         if self.title:
             # Get first few words of title
@@ -207,13 +250,7 @@ class ZoteroItem(BaseModel):
     @property
     def is_academic_paper(self) -> bool:
         """Check if this item is likely an academic paper"""
-        academic_types = {
-            ZoteroItemType.JOURNAL_ARTICLE.value,
-            ZoteroItemType.CONFERENCE_PAPER.value,
-            ZoteroItemType.PREPRINT.value,
-            ZoteroItemType.THESIS.value
-        }
-        return self.item_type in academic_types
+        return self.item_type in ACADEMIC_ITEM_TYPES
     
     def get_field(self, field_name: str, default: Any = None) -> Any:
         """Get a field value from raw data"""
@@ -221,61 +258,122 @@ class ZoteroItem(BaseModel):
     
     @classmethod
     def from_zotero_data(cls, data: Dict[str, Any]) -> "ZoteroItem":
-        """Create ZoteroItem from Zotero API data"""
+        """Create ZoteroItem from Zotero API data
+        
+        Served from _parsed_items when this exact item version was parsed
+        before. Every call returns its own copy with fresh creators/tags/
+        collections lists and raw_data set to the dict passed in, so callers
+        can reassign fields or append to those lists without touching the
+        cached model. The creator and tag models themselves are shared --
+        nothing edits them in place.
+        """
+        version = data.get("version")
+        cache_key = None
+        if version is not None and data.get("key"):
+            library = data.get("library")
+            library_id = str(library.get("id", "")) if isinstance(library, dict) else str(library or "")
+            cache_key = (library_id, data["key"], version)
+            with _parsed_items_lock:
+                hit = _parsed_items.get(cache_key)
+                if hit is not None:
+                    _parsed_items.move_to_end(cache_key)
+                    return hit._copy_for(data)
+
+        item = cls._parse_zotero_data(data)
+        if cache_key is not None:
+            with _parsed_items_lock:
+                _parsed_items[cache_key] = item
+                while len(_parsed_items) > _PARSED_ITEMS_MAX:
+                    _parsed_items.popitem(last=False)
+            return item._copy_for(data)
+        return item
+
+    def _copy_for(self, data: Dict[str, Any]) -> "ZoteroItem":
+        # A deep copy would also walk raw_data -- several times the cost of
+        # the parse it replaces.
+        return self.model_copy(update={
+            "creators": list(self.creators),
+            "tags": list(self.tags),
+            "collections": list(self.collections),
+            "raw_data": data,
+        })
+
+    @classmethod
+    def _parse_zotero_data(cls, data: Dict[str, Any]) -> "ZoteroItem":
+        # One model_validate() over plain dicts, so pydantic-core validates
+        # the nested creators and tags itself -- building each ZoteroCreator/
+        # ZoteroTag through its own Python-level constructor first cost
+        # about a third more per item. The dicts mirror exactly what
+        # ZoteroCreator.from_zotero_data()/ZoteroTag.from_zotero_data() pass.
+        # Callers convert pages serially on purpose: validation holds the
+        # GIL, so a thread pool only adds hand-off cost (1000 items took
+        # ~35ms pooled vs ~20ms serial), and a process pool would pay more
+        # to pickle each raw dict and model than the ~20us parse it saves.
         item_data = data.get("data", {})
         
         # Extract creators
         creators = [
-            ZoteroCreator.from_zotero_data(creator_data) 
+            {
+                "creator_type": creator_data.get("creatorType", "author"),
+                "first_name": creator_data.get("firstName"),
+                "last_name": creator_data.get("lastName"),
+                "name": creator_data.get("name"),
+            }
             for creator_data in item_data.get("creators", [])
         ]
         
         # Extract tags
-        tags = []
-        for tag_data in item_data.get("tags", []):
-            tags.append(ZoteroTag.from_zotero_data(tag_data))
+        tags = [
+            {"tag": tag_data} if isinstance(tag_data, str)
+            else {"tag": tag_data.get("tag", ""), "type": tag_data.get("type", 0)}
+            for tag_data in item_data.get("tags", [])
+        ]
         
-        return cls(
-            key=data.get("key", ""),
-            item_type=item_data.get("itemType", "other"),
-            title=item_data.get("title"),
-            creators=creators,
-            abstract_note=item_data.get("abstractNote"),
-            publication_title=item_data.get("publicationTitle"),
-            volume=item_data.get("volume"),
-            issue=item_data.get("issue"),
-            pages=item_data.get("pages"),
-            date=item_data.get("date"),
-            doi=item_data.get("DOI"),
-            url=item_data.get("url"),
-            tags=tags,
-            collections=item_data.get("collections", []),
-            date_added=item_data.get("dateAdded"),
-            date_modified=item_data.get("dateModified"),
-            version=data.get("version"),
-            library=str(data.get("library", "")) if data.get("library") else None,
-            raw_data=data
-        )
+        return cls.model_validate({
+            "key": data.get("key", ""),
+            # ~a dozen distinct values across the whole library
+            "item_type": sys.intern(item_data.get("itemType", "other")),
+            "title": item_data.get("title"),
+            "creators": creators,
+            "abstract_note": item_data.get("abstractNote"),
+            "publication_title": item_data.get("publicationTitle"),
+            "volume": item_data.get("volume"),
+            "issue": item_data.get("issue"),
+            "pages": item_data.get("pages"),
+            "date": item_data.get("date"),
+            "doi": item_data.get("DOI"),
+            "url": item_data.get("url"),
+            "tags": tags,
+            "collections": item_data.get("collections", []),
+            "date_added": item_data.get("dateAdded"),
+            "date_modified": item_data.get("dateModified"),
+            "version": data.get("version"),
+            "library": str(data.get("library", "")) if data.get("library") else None,
+            "raw_data": data,
+        })
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
+        # authors/year feed citation_key too -- derive each once, not three times
+        authors = self.authors
+        year = self.year
         return {
             "key": self.key,
             "item_type": self.item_type,
             "title": self.title,
-            "authors": self.authors,
+            "authors": authors,
             "abstract": self.abstract_note,
             "publication": self.publication_title,
             "volume": self.volume,
             "issue": self.issue,
             "pages": self.pages,
             "date": self.date,
-            "year": self.year,
+            "year": year,
             "doi": self.doi,
             "url": self.url,
             "tags": [tag.tag for tag in self.tags],
             "collections": self.collections,
-            "citation_key": self.citation_key,
+            "citation_key": self._citation_key(authors[0] if authors else None, year),
             "is_academic_paper": self.is_academic_paper
         }
 
@@ -6,6 +6,7 @@ Load and validate TOML configuration files with robust type validation.
 import os
 import tomllib
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, List
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -95,7 +96,14 @@ class LLMConfig(BaseModel):
     provider: str = Field("ollama", description="ollama | llama_cpp | openrouter")
     model: str = Field("qwen2.5:7b-32k", description="Model name")
     host: str = Field("localhost:11434", description="Host and port — ignored for openrouter")
-    max_concurrent_inferences: int = Field(1, ge=1, le=16, description="Max simultaneous requests")
+    max_concurrent_inferences: int = Field(
+        1, ge=1, le=16,
+        description=(
+            "Max simultaneous requests (AnalysisAgent's thread pool and semaphore). Only helps if the "
+            "server really runs that many slots for this model -- Ollama's OLLAMA_NUM_PARALLEL (auto by "
+            "default), else the extra requests just queue inside Ollama (see docs/ollama-concurrency.md)"
+        ),
+    )
     api_key_env: Optional[str] = Field(
         None, description="Env var holding the API key — only used/required when provider=openrouter"
     )
@@ -439,6 +447,42 @@ class PrismaConfig(BaseModel):
         return v
 
 
+def _read_config(config_path: Optional[Path]) -> PrismaConfig:
+    user_data = {}
+
+    if config_path:
+        try:
+            with open(config_path, 'rb') as f:
+                user_data = tomllib.load(f) or {}
+            logger.debug(f"Loaded config from {config_path}")
+        except Exception as e:
+            logger.error(f"Failed to load config from {config_path}: {e}")
+            logger.warning("Using default configuration")
+    else:
+        logger.debug("No config file found, using defaults")
+
+    try:
+        # Create Pydantic config with validation
+        config = PrismaConfig(**user_data)
+        return config
+    except Exception as e:
+        logger.error(f"Configuration validation failed: {e}")
+        logger.warning("Using default configuration")
+        return PrismaConfig()
+
+
+# Parsed configs by file identity. ConfigLoader() is constructed fresh all
+# over -- AuthMiddleware on every HTTP request, each stream run, each
+# SearchAgent -- precisely so an edit on disk is picked up without a
+# restart; keying on (path, mtime, size) keeps that while sparing the TOML
+# parse and model validation whenever the file hasn't changed. Loaders that
+# hit the same entry share one PrismaConfig, which callers already treat as
+# read-only (app.py's reload swaps sections in with model_copy()).
+@lru_cache(maxsize=8)
+def _read_config_cached(config_path: Path, mtime_ns: int, size: int) -> PrismaConfig:
+    return _read_config(config_path)
+
+
 class ConfigLoader:
     """Load and validate configuration from TOML files and environment variables."""
 
@@ -490,28 +534,15 @@ class ConfigLoader:
     
     def _load_config(self) -> PrismaConfig:
         """Load configuration from TOML file with defaults and validation."""
-        user_data = {}
-
         if self.config_path:
             try:
-                with open(self.config_path, 'rb') as f:
-                    user_data = tomllib.load(f) or {}
-                logger.debug(f"Loaded config from {self.config_path}")
-            except Exception as e:
-                logger.error(f"Failed to load config from {self.config_path}: {e}")
-                logger.warning("Using default configuration")
-        else:
-            logger.debug("No config file found, using defaults")
-        
-        try:
-            # Create Pydantic config with validation
-            config = PrismaConfig(**user_data)
-            return config
-        except Exception as e:
-            logger.error(f"Configuration validation failed: {e}")
-            logger.warning("Using default configuration")
-            return PrismaConfig()
-    
+                stat = self.config_path.stat()
+            except OSError:
+                pass  # let _read_config() report the unreadable file
+            else:
+                return _read_config_cached(self.config_path, stat.st_mtime_ns, stat.st_size)
+        return _read_config(self.config_path)
+
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation.
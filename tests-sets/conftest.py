@@ -31,3 +31,10 @@ def write_temp_config(tmp_path):
 def isolate_prisma_config(monkeypatch):
     """Ensure PRISMA_CONFIG from the environment never leaks into tests."""
     monkeypatch.delenv("PRISMA_CONFIG", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def isolate_status_cache(tmp_path):
+    """Keep `prisma status`'s probe cache out of ~/.cache and out of other tests."""
+    with patch("prisma.cli.prisma_cli._status_cache_path", return_value=tmp_path / "status.json"):
+        yield
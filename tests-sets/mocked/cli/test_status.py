@@ -28,7 +28,7 @@ MINIMAL_CONFIG = {
 
 
 def _run_status(tmp_path, config_data=None, wsl=False, windows_ip="10.0.0.1",
-                zotero_reachable=False, ollama_ping=None, online=True, env=None):
+                zotero_reachable=False, ollama_ping=None, online=True, env=None, args=()):
     """Helper: write config, patch boundaries, invoke `prisma status`."""
     runner = CliRunner()
 
@@ -55,7 +55,7 @@ def _run_status(tmp_path, config_data=None, wsl=False, windows_ip="10.0.0.1",
          patch("prisma.connectivity.monitor.is_online", online), \
          patch("prisma.integrations.zotero.client.check_web_api_reachable", return_value=zotero_reachable), \
          patch("requests.get", side_effect=fake_requests_get):
-        result = runner.invoke(cli, ["status"], env=invoke_env, catch_exceptions=False)
+        result = runner.invoke(cli, ["status", *args], env=invoke_env, catch_exceptions=False)
 
     return result
 
@@ -209,3 +209,64 @@ def test_all_green(tmp_path):
     result = _run_status(tmp_path, cfg, zotero_reachable=True, ollama_ping=200)
     assert result.exit_code == 0
     assert "Prisma is ready" in result.output
+
+
+# ── Case 12: Probe cache ──────────────────────────────────────────────────────
+
+def test_successful_probes_are_reused_until_no_cache(tmp_path):
+    cfg = dict(MINIMAL_CONFIG)
+    cfg["sources"] = {
+        "zotero": {
+            "enabled": True,
+            "api_key": "aabbccddeeff00112233445566778899aabb",
+            "library_id": "18078141",
+        }
+    }
+    assert _run_status(tmp_path, cfg, zotero_reachable=True, ollama_ping=200).exit_code == 0
+
+    cached = _run_status(tmp_path, cfg, zotero_reachable=False, ollama_ping=None, online=False)
+    assert cached.exit_code == 0
+    assert "aabbccddeeff" not in (tmp_path / "status.json").read_text()
+
+    forced = _run_status(tmp_path, cfg, zotero_reachable=False, ollama_ping=None, args=["--no-cache"])
+    assert forced.exit_code == 1
+    assert "Unreachable" in forced.output
+    assert "cannot connect" in forced.output
+
+
+# ── Case 13: Probes run concurrently ──────────────────────────────────────────
+
+def test_zotero_and_ollama_probes_overlap(tmp_path):
+    import threading
+
+    cfg = dict(MINIMAL_CONFIG)
+    cfg["sources"] = {
+        "zotero": {
+            "enabled": True,
+            "api_key": "aabbccddeeff00112233445566778899aabb",
+            "library_id": "18078141",
+        }
+    }
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(dict_to_toml(cfg))
+    both_started = threading.Barrier(2, timeout=5)  # broken if the probes run back to back
+
+    def reachable(*args, **kwargs):
+        both_started.wait()
+        return True
+
+    def ollama_get(url, **kwargs):
+        both_started.wait()
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {"models": []}
+        return resp
+
+    with patch("prisma.cli.prisma_cli._is_wsl", return_value=False), \
+         patch("prisma.connectivity.monitor.is_online", True), \
+         patch("prisma.integrations.zotero.client.check_web_api_reachable", side_effect=reachable), \
+         patch("requests.get", side_effect=ollama_get):
+        result = CliRunner().invoke(cli, ["status"], env={"PRISMA_CONFIG": str(config_file)},
+                                    catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert "Prisma is ready" in result.output
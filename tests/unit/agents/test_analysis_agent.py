@@ -2,6 +2,8 @@
 Unit tests for Analysis Agent.
 """
 
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 import sys
@@ -11,7 +13,8 @@ from datetime import datetime
 # Add prisma to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-from prisma.agents.analysis_agent import AnalysisAgent, _parse_confidence
+from prisma.agents.analysis_agent import AnalysisAgent, _parse_confidence, _response_cache
+from prisma.services.chat_llm import LeaseDenied
 from prisma.storage.models.agent_models import PaperMetadata, AnalysisResult, PaperSummary
 from prisma.utils.config import LLMConfig
 
@@ -32,6 +35,14 @@ class TestAnalysisAgent(unittest.TestCase):
         test_llm_config = LLMConfig(provider='ollama', model='qwen2.5:7b-32k', host='localhost:11434')
         with patch('prisma.agents.analysis_agent.config.get_llm_config', return_value=test_llm_config):
             self.analysis_agent = AnalysisAgent()
+        # The response cache is process-wide -- without this, a summary
+        # cached by one test would answer the same prompt in the next.
+        _response_cache.clear()
+        # analyze() preloads the model before its first batch -- keep that
+        # off the network here; TestWarmup below covers it directly.
+        preload_patcher = patch.object(self.analysis_agent._chat_llm, 'preload', return_value=True)
+        preload_patcher.start()
+        self.addCleanup(preload_patcher.stop)
         self.sample_paper = PaperMetadata(
             title='Test Paper Title',
             authors=['Author One', 'Author Two'],
@@ -70,6 +81,75 @@ class TestAnalysisAgent(unittest.TestCase):
         self.assertEqual(result.author_count, 2)
         self.assertIsInstance(result.summaries[0], PaperSummary)
 
+    def test_analyze_preserves_paper_order_across_concurrent_summaries(self):
+        """analyze() fans _summarize_paper out over a thread pool -- the
+        returned summaries must still line up with the input papers."""
+        papers = [self.sample_paper.model_copy(update={'title': f'Paper {i}'}) for i in range(6)]
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value='Summary.'):
+            result = self.analysis_agent.analyze(papers)
+
+        self.assertEqual([s.title for s in result.summaries], [p.title for p in papers])
+        self.assertEqual(result.total_papers, 6)
+
+    def test_analyze_average_time_comes_from_the_summaries_themselves(self):
+        papers = [self.sample_paper.model_copy(update={'title': f'Paper {i}'}) for i in range(3)]
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value='Summary.'):
+            result = self.analysis_agent.analyze(papers)
+
+        expected = sum(s.processing_time for s in result.summaries) / len(result.summaries)
+        self.assertAlmostEqual(result.avg_processing_time, expected)
+
+    def test_analyze_ranks_top_authors_by_paper_count(self):
+        papers = [
+            self.sample_paper.model_copy(update={'authors': ['A', 'B']}),
+            self.sample_paper.model_copy(update={'authors': ['B', 'C']}),
+            self.sample_paper.model_copy(update={'authors': ['B', 'C']}),
+        ]
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value='Summary.'):
+            result = self.analysis_agent.analyze(papers)
+
+        self.assertEqual(result.top_authors, ['B', 'C', 'A'])
+        self.assertEqual(result.author_count, 3)
+
+    def test_summarize_batch_maps_json_entries_back_by_index(self):
+        """One LLM call covers the whole batch when the reply is a valid
+        JSON array -- entries map back to papers by index, not by order."""
+        papers = [self.sample_paper.model_copy(update={'title': f'Paper {i}'}) for i in range(3)]
+        reply = ('```json\n[{"index": 2, "summary": "Second."}, {"index": 1, "summary": "First."},'
+                 ' {"index": 3, "summary": "Third."}]\n```')
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value=reply) as mock_complete:
+            summaries = self.analysis_agent._summarize_batch(papers)
+
+        self.assertEqual(mock_complete.call_count, 1)
+        self.assertEqual([s.summary for s in summaries], ['First.', 'Second.', 'Third.'])
+        self.assertEqual([s.title for s in summaries], ['Paper 0', 'Paper 1', 'Paper 2'])
+
+    def test_summarize_batch_only_re_asks_for_missing_papers(self):
+        papers = [self.sample_paper.model_copy(update={'title': f'Paper {i}'}) for i in range(3)]
+        replies = ['[{"index": 1, "summary": "First."}, {"index": 3, "summary": "Third."}]', 'Single.']
+        with patch.object(self.analysis_agent._chat_llm, 'complete', side_effect=replies) as mock_complete:
+            summaries = self.analysis_agent._summarize_batch(papers)
+
+        self.assertEqual(mock_complete.call_count, 2)
+        self.assertEqual([s.summary for s in summaries], ['First.', 'Single.', 'Third.'])
+
+    def test_summarize_batch_prompt_numbers_papers_and_keeps_fields_verbatim(self):
+        papers = [self.sample_paper.model_copy(update={'title': '100% {odd} title', 'abstract': 'First %s.'}),
+                  self.sample_paper.model_copy(update={'title': 'Second', 'abstract': 'Second.'})]
+        reply = '[{"index": 1, "summary": "First."}, {"index": 2, "summary": "Second."}]'
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value=reply) as mock_complete:
+            self.analysis_agent._summarize_batch(papers)
+
+        prompt = mock_complete.call_args.args[0][0]['content']
+        self.assertIn('following 2 research papers', prompt)
+        self.assertIn('[1] Title: 100% {odd} title\nAbstract: First %s.', prompt)
+        self.assertIn('[2] Title: Second\nAbstract: Second.', prompt)
+
+    def test_summary_batches_respect_batch_size(self):
+        papers = [self.sample_paper] * (AnalysisAgent._SUMMARY_BATCH_SIZE + 3)
+        batches = self.analysis_agent._summary_batches(papers)
+        self.assertEqual([len(b) for b in batches], [AnalysisAgent._SUMMARY_BATCH_SIZE, 3])
+
     def test_summarize_paper_structure(self):
         """Test paper summary structure."""
         with patch.object(self.analysis_agent._chat_llm, 'complete', return_value='Summary of the paper.'):
@@ -84,6 +164,27 @@ class TestAnalysisAgent(unittest.TestCase):
         self.assertIsInstance(summary.methodology, str)
         self.assertIsInstance(summary.connected_papers_url, str)
 
+    def test_summarize_paper_uses_structured_json_fields(self):
+        reply = ('{"summary": "A graph model.", "key_findings": ["It beats baselines."],'
+                 ' "methodology": "Message passing over molecule graphs."}')
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value=reply) as mock_complete:
+            summary = self.analysis_agent._summarize_paper(self.sample_paper)
+
+        self.assertEqual(summary.summary, 'A graph model.')
+        self.assertEqual(summary.key_findings, ['It beats baselines.'])
+        self.assertEqual(summary.methodology, 'Message passing over molecule graphs.')
+        self.assertEqual(mock_complete.call_args.kwargs['response_format'], {'type': 'json_object'})
+
+    def test_connected_papers_fallback_url_is_fully_encoded(self):
+        paper = self.sample_paper.model_copy(update={'title': 'Q&A #1: A/B tests?'})
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value='Summary.'):
+            summary = self.analysis_agent._summarize_paper(paper)
+
+        self.assertEqual(
+            summary.connected_papers_url,
+            'https://www.connectedpapers.com/search?q=Q%26A+%231%3A+A%2FB+tests%3F',
+        )
+
     def test_ollama_integration_success(self):
         """Test successful LLM integration."""
         with patch.object(
@@ -134,6 +235,79 @@ class TestAnalysisAgent(unittest.TestCase):
         self.assertEqual(kwargs['max_tokens'], 42)
         self.assertEqual(kwargs['timeout'], 7)
 
+    def test_summary_is_cached_across_agent_instances(self):
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value='Cached summary.') as mock_complete:
+            first = self.analysis_agent._get_ollama_summary('T', 'A')
+            second = self.analysis_agent._get_ollama_summary('T', 'A')
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_complete.call_count, 1)
+
+    def test_failed_answer_is_not_cached(self):
+        with patch.object(self.analysis_agent._chat_llm, 'complete', side_effect=[None, 'Recovered.']) as mock_complete:
+            self.assertEqual(self.analysis_agent._get_ollama_summary('T', 'A'), "")
+            self.assertEqual(self.analysis_agent._get_ollama_summary('T', 'A'), 'Recovered.')
+
+        self.assertEqual(mock_complete.call_count, 2)
+
+    def test_circuit_breaker_stops_calling_a_dead_backend(self):
+        threshold = AnalysisAgent._BREAKER_THRESHOLD
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value=None) as mock_complete:
+            for i in range(threshold + 2):
+                self.analysis_agent._call_llm(f"p{i}", temperature=0.1, max_tokens=5, timeout=1)
+
+        self.assertEqual(mock_complete.call_count, threshold)
+
+    def test_circuit_breaker_probes_again_after_cooldown(self):
+        threshold = AnalysisAgent._BREAKER_THRESHOLD
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value=None):
+            for i in range(threshold):
+                self.analysis_agent._call_llm(f"p{i}", temperature=0.1, max_tokens=5, timeout=1)
+        self.analysis_agent._breaker_open_until = 0.0  # cooldown elapsed
+
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value='back') as mock_complete:
+            self.assertEqual(self.analysis_agent._call_llm("probe", temperature=0.1, max_tokens=5, timeout=1), 'back')
+        mock_complete.assert_called_once()
+        self.assertEqual(self.analysis_agent._consecutive_failures, 0)
+
+    def test_lease_denials_do_not_open_the_circuit_breaker(self):
+        threshold = AnalysisAgent._BREAKER_THRESHOLD
+        with patch.object(self.analysis_agent._chat_llm, 'complete', side_effect=LeaseDenied("m")) as mock_complete:
+            for i in range(threshold + 2):
+                self.assertIsNone(self.analysis_agent._call_llm(f"p{i}", temperature=0.1, max_tokens=5, timeout=1))
+
+        self.assertEqual(mock_complete.call_count, threshold + 2)
+        self.assertEqual(self.analysis_agent._breaker_open_until, 0.0)
+
+    def test_circuit_breaker_lets_one_probe_through_after_cooldown(self):
+        threshold = AnalysisAgent._BREAKER_THRESHOLD
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value=None):
+            for i in range(threshold):
+                self.analysis_agent._call_llm(f"p{i}", temperature=0.1, max_tokens=5, timeout=1)
+        self.analysis_agent._breaker_open_until = time.monotonic() - 1  # cooldown elapsed
+
+        probe_started, release_probe = threading.Event(), threading.Event()
+
+        def slow_answer(*args, **kwargs):
+            probe_started.set()
+            release_probe.wait(timeout=5)
+            return 'back'
+
+        with patch.object(self.analysis_agent._chat_llm, 'complete', side_effect=slow_answer) as mock_complete:
+            probe = threading.Thread(
+                target=self.analysis_agent._call_llm, args=("probe",),
+                kwargs=dict(temperature=0.1, max_tokens=5, timeout=1),
+            )
+            probe.start()
+            self.assertTrue(probe_started.wait(timeout=5))
+            self.assertIsNone(self.analysis_agent._call_llm("other", temperature=0.1, max_tokens=5, timeout=1))
+            release_probe.set()
+            probe.join()
+            self.assertEqual(self.analysis_agent._call_llm("after", temperature=0.1, max_tokens=5, timeout=1), 'back')
+
+        self.assertEqual(mock_complete.call_count, 2)
+        self.assertEqual(self.analysis_agent._breaker_open_until, 0.0)
+
     def test_extract_key_findings(self):
         """Test key findings extraction."""
         text_with_findings = "The results show significant improvements. Key findings indicate better performance."
@@ -147,6 +321,80 @@ class TestAnalysisAgent(unittest.TestCase):
         self.assertTrue(len(findings1) > 0)
         self.assertTrue(len(findings2) > 0)
 
+    def test_assess_relevance_prompt_carries_topic_title_and_abstract_verbatim(self):
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value='RELEVANCE: RELEVANT') as mock_complete:
+            self.analysis_agent.assess_relevance('100% {odd} title', 'An abstract.', 'graph learning')
+
+        prompt = mock_complete.call_args.args[0][0]['content']
+        self.assertIn('Research Topic: graph learning', prompt)
+        self.assertIn('Paper Title: 100% {odd} title', prompt)
+        self.assertIn('Paper Abstract: An abstract.', prompt)
+
+    def test_assess_relevance_skips_llm_when_title_contains_every_topic_term(self):
+        with patch.object(self.analysis_agent._chat_llm, 'complete') as mock_complete:
+            result = self.analysis_agent.assess_relevance(
+                'Graph Neural Networks for Molecule Design', 'An abstract.', 'graph neural networks')
+
+        mock_complete.assert_not_called()
+        self.assertTrue(result.is_relevant)
+        self.assertEqual(result.relevance_level, 'RELEVANT')
+
+    def test_assess_relevance_low_lexical_overlap_still_asks_llm(self):
+        # No lexical overlap must never short-circuit to "not relevant" --
+        # semantic relevance without shared words is the LLM's job.
+        reply = 'RELEVANCE: RELEVANT\nCONFIDENCE: MEDIUM\nREASONING: Same field.'
+        with patch.object(self.analysis_agent._chat_llm, 'complete', return_value=reply) as mock_complete:
+            result = self.analysis_agent.assess_relevance(
+                'Neural networks for image recognition', 'An abstract.', 'computer vision')
+
+        mock_complete.assert_called_once()
+        self.assertTrue(result.is_relevant)
+
+    def test_parse_semantic_relevance_reads_all_three_fields(self):
+        result = self.analysis_agent._parse_semantic_relevance(
+            "Some preamble.\nRELEVANCE: HIGHLY_RELEVANT\n  Confidence: HIGH\nREASONING: Directly on topic."
+        )
+        self.assertTrue(result.is_relevant)
+        self.assertEqual(result.relevance_level, "HIGHLY_RELEVANT")
+        self.assertEqual(result.semantic_score, 0.9)
+        self.assertEqual(result.confidence, 0.9)
+        self.assertEqual(result.reasoning, "Directly on topic.")
+
+    def test_parse_semantic_relevance_defaults_when_fields_missing(self):
+        result = self.analysis_agent._parse_semantic_relevance("I cannot decide.")
+        self.assertFalse(result.is_relevant)
+        self.assertEqual(result.relevance_level, "NOT_RELEVANT")
+        self.assertEqual(result.reasoning, "Unable to parse reasoning")
+
+    def test_extract_methodology_keeps_substring_and_case_insensitive_matching(self):
+        self.assertEqual(
+            self.analysis_agent._extract_methodology("A novel METHODOLOGY for graphs."),
+            "Methodology identified in analysis",
+        )
+        self.assertEqual(
+            self.analysis_agent._extract_methodology("Nothing relevant here."),
+            "Methodology analysis from abstract",
+        )
+
+
+class TestWarmup(unittest.TestCase):
+    def setUp(self):
+        test_llm_config = LLMConfig(provider='ollama', model='qwen2.5:7b-32k', host='localhost:11434')
+        with patch('prisma.agents.analysis_agent.config.get_llm_config', return_value=test_llm_config):
+            self.analysis_agent = AnalysisAgent()
+
+    def test_warmup_preloads_once_after_success(self):
+        with patch.object(self.analysis_agent._chat_llm, 'preload', return_value=True) as mock_preload:
+            self.assertTrue(self.analysis_agent.warmup())
+            self.assertTrue(self.analysis_agent.warmup())
+        mock_preload.assert_called_once()
+
+    def test_warmup_retries_after_failure(self):
+        with patch.object(self.analysis_agent._chat_llm, 'preload', side_effect=[False, True]) as mock_preload:
+            self.assertFalse(self.analysis_agent.warmup())
+            self.assertTrue(self.analysis_agent.warmup())
+        self.assertEqual(mock_preload.call_count, 2)
+
 
 class TestParseConfidence(unittest.TestCase):
     def test_recognized_levels(self):
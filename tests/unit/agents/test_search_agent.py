@@ -2,6 +2,8 @@
 Unit tests for Search Agent.
 """
 
+import io
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 import sys
@@ -10,7 +12,9 @@ from pathlib import Path
 # Add prisma to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+from prisma.agents import search_agent
 from prisma.agents.search_agent import SearchAgent
+from prisma.integrations.sources import SourceSearchResult
 from prisma.storage.models.agent_models import SearchResult, PaperMetadata
 
 
@@ -19,6 +23,7 @@ class TestSearchAgent(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
+        search_agent._result_cache.clear()
         self.search_agent = SearchAgent()
     
     def test_initialization(self):
@@ -26,13 +31,13 @@ class TestSearchAgent(unittest.TestCase):
         expected = {"arxiv", "semanticscholar", "openlibrary", "googlebooks", "pubmed", "ieee_xplore"}
         self.assertEqual(self.search_agent.available_sources, expected)
 
-    @patch('prisma.integrations.sources.arxiv.requests.get')
+    @patch('prisma.integrations.sources.arxiv.http_session.get')
     def test_search_success(self, mock_get):
         """Test successful search operation."""
         # Mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.content = b'''<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.raw = io.BytesIO(b'''<?xml version="1.0" encoding="UTF-8"?>
 <feed xmlns="http://www.w3.org/2005/Atom">
   <entry>
     <id>http://arxiv.org/abs/test.123</id>
@@ -41,7 +46,7 @@ class TestSearchAgent(unittest.TestCase):
     <published>2024-01-01T00:00:00Z</published>
     <author><name>Test Author</name></author>
   </entry>
-</feed>'''
+</feed>''')
         mock_get.return_value = mock_response
         
         # Test search
@@ -73,7 +78,79 @@ class TestSearchAgent(unittest.TestCase):
         self.assertIsInstance(result, SearchResult)
         self.assertEqual(len(result.papers), 0)
         self.assertEqual(result.sources_searched, ["unsupported"])
+
+    def test_search_unsupported_source_logs_warning(self):
+        with self.assertLogs('prisma.agents.search_agent', level='WARNING') as logs:
+            self.search_agent.search(query="test query", sources=["unsupported"], limit=10)
+        self.assertIn("'unsupported' not yet implemented", logs.output[0])
     
+    def test_search_queries_sources_concurrently_and_keeps_source_order(self):
+        """Both sources must be in flight at once (each blocks until the
+        other has started), yet results fold in `sources` order."""
+        both_started = threading.Barrier(2, timeout=5)
+
+        def fake_source(title):
+            src = MagicMock()
+
+            def search(query, limit, published_after=None):
+                both_started.wait()
+                return SourceSearchResult(papers=[PaperMetadata(
+                    title=title, authors=['A'], abstract='x', source='arxiv', url='http://x',
+                )])
+            src.search.side_effect = search
+            return src
+
+        self.search_agent._sources = {'arxiv': fake_source('First'), 'pubmed': fake_source('Second')}
+        self.search_agent.prefer_high_quality = False
+        self.search_agent.require_academic_validation = False
+
+        with patch('prisma.agents.search_agent.significant_words', return_value=frozenset()):
+            result = self.search_agent.search(query="q", sources=["arxiv", "pubmed"], limit=10)
+
+        self.assertEqual([p.title for p in result.papers], ['First', 'Second'])
+
+    def _counting_source(self, n_papers=3):
+        src = MagicMock()
+        src.search.side_effect = lambda query, limit, published_after=None: SourceSearchResult(papers=[
+            PaperMetadata(title=f'P{i}', authors=['A'], abstract='x', source='arxiv', url='http://x')
+            for i in range(min(limit, n_papers))
+        ])
+        self.search_agent._sources = {'arxiv': src}
+        return src
+
+    def test_repeat_fetch_is_served_from_cache(self):
+        src = self._counting_source()
+        first = self.search_agent._fetch_source('arxiv', 'q', 3, None)
+        second = self.search_agent._fetch_source('arxiv', 'q', 2, None)
+
+        self.assertEqual(src.search.call_count, 1)
+        self.assertEqual(len(first.papers), 3)
+        self.assertEqual(len(second.papers), 2)
+
+    def test_larger_limit_than_cached_refetches(self):
+        src = self._counting_source(n_papers=10)
+        self.search_agent._fetch_source('arxiv', 'q', 2, None)
+        result = self.search_agent._fetch_source('arxiv', 'q', 5, None)
+
+        self.assertEqual(src.search.call_count, 2)
+        self.assertEqual(len(result.papers), 5)
+
+    def test_empty_results_are_not_cached(self):
+        src = self._counting_source(n_papers=0)
+        self.search_agent._fetch_source('arxiv', 'q', 3, None)
+        self.search_agent._fetch_source('arxiv', 'q', 3, None)
+
+        self.assertEqual(src.search.call_count, 2)
+
+    def test_expired_entry_refetches(self):
+        src = self._counting_source()
+        with patch('prisma.agents.search_agent.time.monotonic', return_value=0.0):
+            self.search_agent._fetch_source('arxiv', 'q', 3, None)
+        with patch('prisma.agents.search_agent.time.monotonic', return_value=search_agent._RESULT_CACHE_TTL_S['arxiv'] + 1):
+            self.search_agent._fetch_source('arxiv', 'q', 3, None)
+
+        self.assertEqual(src.search.call_count, 2)
+
     def test_deduplicate_papers(self):
         """Test paper deduplication functionality."""
         # Create test PaperMetadata objects
@@ -113,6 +190,85 @@ class TestSearchAgent(unittest.TestCase):
         self.assertIn('Paper A', titles)
         self.assertIn('Paper B', titles)
 
+    @patch('prisma.agents.search_agent.get_academic_confidence_score', return_value=1.0)
+    @patch('prisma.agents.search_agent.validate_academic_content', return_value=(True, []))
+    def test_search_stops_validating_once_paper_budget_is_met(self, mock_validate, _):
+        def source_of(n):
+            src = MagicMock()
+            src.search.return_value = SourceSearchResult(papers=[self._paper(f'P{n}-{i}') for i in range(5)])
+            return src
+
+        self.search_agent._sources = {'arxiv': source_of(1), 'pubmed': source_of(2)}
+        self.search_agent.prefer_high_quality = False
+        self.search_agent.require_academic_validation = True
+
+        with patch('prisma.agents.search_agent.significant_words', return_value=frozenset()):
+            result = self.search_agent.search(query="q", sources=["arxiv", "pubmed"], limit=2)
+
+        # budget = limit unique papers -- the second source is never validated
+        self.assertEqual(mock_validate.call_count, 2)
+        self.assertEqual([p.title for p in result.papers], ['P1-0', 'P1-1'])
+
+    @patch('prisma.agents.search_agent.significant_words', return_value=frozenset())
+    @patch('prisma.agents.search_agent.get_academic_confidence_score', return_value=1.0)
+    @patch('prisma.agents.search_agent.validate_academic_content', return_value=(True, []))
+    def test_cross_source_duplicates_do_not_use_up_the_paper_budget(self, *_):
+        first = MagicMock()
+        first.search.return_value = SourceSearchResult(papers=[self._paper('Shared'), self._paper('Only A')])
+        second = MagicMock()
+        second.search.return_value = SourceSearchResult(papers=[
+            self._paper('shared.'), self._paper('Only B'), self._paper('Only B2'),
+        ])
+        self.search_agent._sources = {'arxiv': first, 'pubmed': second}
+        self.search_agent.prefer_high_quality = False
+        self.search_agent.require_academic_validation = True
+
+        result = self.search_agent.search(query="q", sources=["arxiv", "pubmed"], limit=3)
+
+        self.assertEqual([p.title for p in result.papers], ['Shared', 'Only A', 'Only B'])
+
+    def test_quality_summary_lists_only_sources_that_contributed(self):
+        with self.assertLogs('prisma.agents.search_agent', level='INFO') as logs:
+            self.search_agent._log_quality_summary(
+                ['arxiv', 'pubmed'], [5, 4], [2, 0], [0, 0], [1, 3], 2, 0,
+            )
+        self.assertIn("arxiv: ⭐⭐⭐⭐⭐ - 2P + 0B (1 rejected)", logs.output[1])
+        self.assertFalse(any('pubmed' in line for line in logs.output))
+
+    def test_source_names_are_case_insensitive(self):
+        src = self._counting_source()
+        with patch('prisma.agents.search_agent.significant_words', return_value=frozenset()):
+            self.search_agent.require_academic_validation = False
+            result = self.search_agent.search(query="q", sources=["ArXiv"], limit=3)
+
+        src.search.assert_called_once()
+        self.assertEqual(len(result.papers), 3)
+        self.assertEqual(result.sources_searched, ["ArXiv"])
+
+    def test_search_does_not_print(self):
+        with patch('builtins.print') as mock_print:
+            self.search_agent.search(query="q", sources=["zotero"], limit=1)
+        mock_print.assert_not_called()
+
+    def _paper(self, title, **kw):
+        return PaperMetadata(title=title, authors=['A'], abstract='x', source='arxiv', url='http://x', **kw)
+
+    @patch('prisma.agents.search_agent.significant_words', return_value=frozenset())
+    def test_deduplicate_papers_matches_titles_ignoring_punctuation(self, _):
+        papers = [self._paper('Attention Is All You Need.'), self._paper('attention is all  you need')]
+        self.assertEqual(len(self.search_agent._deduplicate_papers(papers)), 1)
+
+    @patch('prisma.agents.search_agent.significant_words', side_effect=lambda t: frozenset(t.lower().split()))
+    def test_deduplicate_papers_drops_high_stem_overlap_only(self, _):
+        papers = [
+            self._paper('alpha beta gamma delta epsilon zeta'),
+            self._paper('unrelated words here entirely different title'),
+            self._paper('alpha beta gamma delta epsilon revisited'),  # 5 shared with the first
+            self._paper('alpha beta gamma delta other things'),  # only 4 shared
+        ]
+        kept = [p.title for p in self.search_agent._deduplicate_papers(papers)]
+        self.assertEqual(kept, [papers[0].title, papers[1].title, papers[3].title])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,472 @@
+"""
+Unit tests for Zotero Agent.
+"""
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from prisma.agents import zotero_agent
+from prisma.agents.zotero_agent import ZoteroAgent, ZoteroSearchCriteria
+from prisma.integrations.zotero import ZoteroClientError
+from prisma.storage.models import ZoteroCollection, ZoteroItem, ZoteroTag
+from prisma.utils.config import ZoteroConfig
+
+
+class TestZoteroAgentClient(unittest.TestCase):
+    """The API client is only built once something needs it."""
+
+    def test_client_is_built_on_first_access_only(self):
+        with patch('prisma.agents.zotero_agent.ZoteroClient') as client_cls:
+            agent = ZoteroAgent(ZoteroConfig(api_key="key123", library_id="12345", library_type="group"))
+            client_cls.assert_not_called()
+
+            self.assertIs(agent.client, agent.client)
+        client_cls.assert_called_once()
+        api_config = client_cls.call_args.args[0]
+        self.assertEqual((api_config.api_key, api_config.library_id, api_config.library_type),
+                         ("key123", "12345", "group"))
+
+    def test_close_skips_a_client_that_was_never_built(self):
+        with patch('prisma.agents.zotero_agent.ZoteroClient') as client_cls:
+            ZoteroAgent(ZoteroConfig(api_key="key123", library_id="12345")).close()
+        client_cls.assert_not_called()
+
+    def test_close_releases_a_built_client(self):
+        agent = ZoteroAgent(ZoteroConfig(api_key="key123", library_id="12345"))
+        client = agent.client = MagicMock()
+        agent.close()
+        client.close.assert_called_once()
+
+
+class TestZoteroAgentCollectionsCache(unittest.TestCase):
+    """get_collections() keeps a versioned, on-disk collections cache."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_path = Path(tmp.name) / "zotero_collections_12345.json"
+        patcher = patch('prisma.agents.zotero_agent._collections_cache_path', return_value=self.cache_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _agent(self):
+        agent = ZoteroAgent(ZoteroConfig(api_key="key123", library_id="12345"))
+        agent.client = MagicMock()
+        return agent
+
+    def _collections(self, *names):
+        return [ZoteroCollection(key=f"C{i}", name=name, version=1) for i, name in enumerate(names)]
+
+    def test_first_call_fetches_and_persists(self):
+        agent = self._agent()
+        agent.client.get_collections_if_modified.return_value = (5, self._collections("ML"))
+
+        self.assertEqual([c.name for c in agent.get_collections()], ["ML"])
+        agent.client.get_collections_if_modified.assert_called_once_with(None)
+        self.assertTrue(self.cache_path.exists())
+
+    def test_new_session_starts_from_disk_cache(self):
+        first = self._agent()
+        first.client.get_collections_if_modified.return_value = (5, self._collections("ML"))
+        first.get_collections()
+
+        second = self._agent()
+        second.client.get_collections_if_modified.return_value = None  # unchanged since version 5
+        self.assertEqual([c.name for c in second.get_collections()], ["ML"])
+        self.assertEqual([c.name for c in second.get_collections()], ["ML"])
+        second.client.get_collections_if_modified.assert_called_once_with(5)
+
+    def test_disk_cache_is_replaced_when_library_changed_since(self):
+        first = self._agent()
+        first.client.get_collections_if_modified.return_value = (5, self._collections("ML"))
+        first.get_collections()
+
+        second = self._agent()
+        second.client.get_collections_if_modified.return_value = (6, self._collections("ML", "NLP"))
+        self.assertEqual([c.name for c in second.get_collections()], ["ML", "NLP"])
+
+    def test_refresh_sends_cached_version_and_keeps_list_when_unchanged(self):
+        agent = self._agent()
+        agent.client.get_collections_if_modified.side_effect = [(5, self._collections("ML")), None]
+        agent.get_collections()
+
+        self.assertEqual([c.name for c in agent.get_collections(refresh_cache=True)], ["ML"])
+        agent.client.get_collections_if_modified.assert_called_with(5)
+
+    def test_refresh_replaces_list_when_library_changed(self):
+        agent = self._agent()
+        agent.client.get_collections_if_modified.side_effect = [
+            (5, self._collections("ML")),
+            (6, self._collections("ML", "NLP")),
+        ]
+        agent.get_collections()
+
+        self.assertEqual(len(agent.get_collections(refresh_cache=True)), 2)
+        fresh = self._agent()
+        fresh.client.get_collections_if_modified.return_value = None
+        self.assertEqual(fresh.get_collections()[1].name, "NLP")
+
+    def test_refresh_failure_falls_back_to_cached_list(self):
+        agent = self._agent()
+        agent.client.get_collections_if_modified.side_effect = [
+            (5, self._collections("ML")),
+            ZoteroClientError("offline"),
+        ]
+        agent.get_collections()
+
+        self.assertEqual([c.name for c in agent.get_collections(refresh_cache=True)], ["ML"])
+
+    def test_summary_revalidates_collections_once_library_version_moves(self):
+        agent = self._agent()
+        agent.client.get_items.return_value = []
+        agent.client.get_library_version.return_value = 5
+        agent.client.get_collections_if_modified.side_effect = [
+            (5, self._collections("ML")),
+            (8, self._collections("ML", "NLP")),
+        ]
+        agent.get_library_summary()
+        agent.get_library_summary()  # same version: no collections request
+        agent.client.get_library_version.return_value = 8
+
+        self.assertEqual(agent.get_library_summary().collections_count, 2)
+        agent.client.get_collections_if_modified.assert_called_with(5)
+
+    def test_unreadable_cache_file_is_ignored(self):
+        self.cache_path.write_text("not json")
+        agent = self._agent()
+        agent.client.get_collections_if_modified.return_value = (1, [])
+
+        self.assertEqual(agent.get_collections(), [])
+        agent.client.get_collections_if_modified.assert_called_once_with(None)
+
+
+class TestZoteroAgentSearchCache(unittest.TestCase):
+    """search_papers() caches results per criteria and library version."""
+
+    def setUp(self):
+        zotero_agent._item_cache.clear()
+        self.agent = ZoteroAgent(ZoteroConfig(api_key="key123", library_id="12345"))
+        self.agent.client = MagicMock()
+        self.agent.client.get_library_version.return_value = 10
+        self.agent.client.search_items.return_value = [
+            ZoteroItem(key="I1", itemType="journalArticle", title="Paper"),
+        ]
+
+    def test_repeat_search_at_same_version_is_served_from_cache(self):
+        criteria = ZoteroSearchCriteria(query="transformers")
+        first = self.agent.search_papers(criteria)
+        second = self.agent.search_papers(criteria)
+
+        self.assertEqual([p.key for p in second], [p.key for p in first])
+        self.agent.client.search_items.assert_called_once()
+
+    def test_new_library_version_refetches(self):
+        criteria = ZoteroSearchCriteria(query="transformers")
+        self.agent.search_papers(criteria)
+        self.agent.client.get_library_version.return_value = 11
+        self.agent.search_papers(criteria)
+
+        self.assertEqual(self.agent.client.search_items.call_count, 2)
+
+    def test_different_criteria_are_cached_separately(self):
+        self.agent.search_papers(ZoteroSearchCriteria(query="transformers"))
+        self.agent.search_papers(ZoteroSearchCriteria(query="diffusion"))
+
+        self.assertEqual(self.agent.client.search_items.call_count, 2)
+
+    def test_collection_search_fetches_all_collections_in_one_bounded_call(self):
+        self.agent.client.get_items_in_collections.return_value = []
+        self.agent.search_papers(ZoteroSearchCriteria(collections=["A", "B"], limit=20))
+
+        self.agent.client.get_items_in_collections.assert_called_once_with(["A", "B"], limit=20, item_types=None)
+        self.agent.client.get_collection_items.assert_not_called()
+
+    def test_library_wide_date_range_reads_in_date_order(self):
+        self.agent.client.get_items_in_year_range.return_value = [
+            ZoteroItem(key="A", itemType="journalArticle", title="T", date="2024"),
+        ]
+        papers = self.agent.get_recent_papers(years_back=3, limit=7)
+
+        self.assertEqual([p.key for p in papers], ["A"])
+        args, kwargs = self.agent.client.get_items_in_year_range.call_args
+        self.assertEqual(args[1] - args[0], 3)
+        self.assertEqual(kwargs["limit"], 7)
+        self.agent.client.get_items.assert_not_called()
+
+    def test_item_types_are_sent_to_zotero(self):
+        self.agent.search_papers(ZoteroSearchCriteria(query="q", item_types=["journalArticle", "thesis"]))
+
+        self.agent.client.search_items.assert_called_once_with(
+            "q", limit=100, item_types=["journalArticle", "thesis"])
+
+    def test_version_failure_searches_uncached(self):
+        self.agent.client.get_library_version.side_effect = ZoteroClientError("down")
+        criteria = ZoteroSearchCriteria(query="transformers")
+        self.agent.search_papers(criteria)
+        self.agent.search_papers(criteria)
+
+        self.assertEqual(self.agent.client.search_items.call_count, 2)
+        self.assertEqual(len(zotero_agent._item_cache), 0)
+
+    def test_clear_cache_forces_refetch(self):
+        criteria = ZoteroSearchCriteria(query="transformers")
+        with patch('prisma.agents.zotero_agent._collections_cache_path') as mock_path:
+            self.agent.search_papers(criteria)
+            self.agent.clear_cache()
+            self.agent.search_papers(criteria)
+
+        mock_path.return_value.unlink.assert_called_once_with(missing_ok=True)
+        self.assertEqual(self.agent.client.search_items.call_count, 2)
+
+
+class TestZoteroAgentInflightCoalescing(unittest.TestCase):
+    """Identical concurrent searches share one Zotero round trip."""
+
+    def setUp(self):
+        zotero_agent._item_cache.clear()
+        self.agent = ZoteroAgent(ZoteroConfig(api_key="key123", library_id="12345"))
+        self.agent.client = MagicMock()
+        # No version -> no result cache, so only coalescing can save a call
+        self.agent.client.get_library_version.side_effect = ZoteroClientError("down")
+
+    def test_identical_concurrent_search_joins_the_running_one(self):
+        criteria = ZoteroSearchCriteria(query="transformers")
+        follower_result = []
+
+        def slow_search(query, limit, item_types=None):
+            follower = threading.Thread(
+                target=lambda: follower_result.extend(self.agent.search_papers(criteria)))
+            follower.start()
+            time.sleep(0.2)  # let the follower find this search in flight
+            self._follower = follower
+            return [ZoteroItem(key="I1", itemType="journalArticle", title="Paper")]
+
+        self.agent.client.search_items.side_effect = slow_search
+        leader_result = self.agent.search_papers(criteria)
+        self._follower.join(timeout=5)
+
+        self.agent.client.search_items.assert_called_once()
+        self.assertEqual([p.key for p in follower_result], [p.key for p in leader_result])
+        self.assertEqual(zotero_agent._inflight, {})
+
+    def test_failed_search_is_cleared_from_inflight(self):
+        self.agent.client.search_items.side_effect = RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            self.agent.search_papers(ZoteroSearchCriteria(query="transformers"))
+        self.assertEqual(zotero_agent._inflight, {})
+
+
+class TestZoteroAgentFilters(unittest.TestCase):
+    """_apply_filters() combines item type, tag and year filters."""
+
+    def setUp(self):
+        self.agent = ZoteroAgent(ZoteroConfig(api_key="key123", library_id="12345"))
+        self.papers = [
+            ZoteroItem(key="A", itemType="journalArticle", date="2021", tags=[ZoteroTag(tag="ML")]),
+            ZoteroItem(key="B", itemType="book", date="2021", tags=[ZoteroTag(tag="ml")]),
+            ZoteroItem(key="C", itemType="journalArticle", date="2010", tags=[ZoteroTag(tag="ML")]),
+            ZoteroItem(key="D", itemType="journalArticle", date="2022", tags=[ZoteroTag(tag="NLP")]),
+            ZoteroItem(key="E", itemType="journalArticle", tags=[ZoteroTag(tag="ml")]),
+        ]
+
+    def _keys(self, **criteria):
+        return [p.key for p in self.agent._apply_filters(self.papers, ZoteroSearchCriteria(**criteria))]
+
+    def test_no_filters_keeps_everything(self):
+        self.assertEqual(self._keys(), ["A", "B", "C", "D", "E"])
+
+    def test_all_filters_must_match(self):
+        self.assertEqual(
+            self._keys(item_types=["journalArticle"], tags=["Ml"], date_range=(2020, 2025)), ["A"])
+
+    def test_tags_match_case_insensitively_and_any_tag_suffices(self):
+        self.assertEqual(self._keys(tags=["ML", "other"]), ["A", "B", "C", "E"])
+
+    def test_undated_papers_fail_a_date_range(self):
+        self.assertEqual(self._keys(date_range=(2000, 2030)), ["A", "B", "C", "D"])
+
+
+class TestZoteroSearchCriteria(unittest.TestCase):
+
+    def test_invalid_item_types_are_all_reported(self):
+        with self.assertRaises(ValueError) as ctx:
+            ZoteroSearchCriteria(item_types=["journalArticle", "blogpost", "tweet"])
+        self.assertIn("['blogpost', 'tweet']", str(ctx.exception))
+
+    def test_valid_item_types_pass_through(self):
+        criteria = ZoteroSearchCriteria(item_types=["book", "thesis"])
+        self.assertEqual(criteria.item_types, ["book", "thesis"])
+
+
+class TestZoteroAgentFindCollections(unittest.TestCase):
+    """find_collections_by_name() indexes the cached collections list."""
+
+    def setUp(self):
+        self.agent = ZoteroAgent(ZoteroConfig(api_key="key123", library_id="12345"))
+        self.collections = [
+            ZoteroCollection(key="C1", name="Machine Learning"),
+            ZoteroCollection(key="C2", name="Deep learning papers"),
+            ZoteroCollection(key="C3", name="Biology"),
+        ]
+        patcher = patch.object(self.agent, 'get_collections', side_effect=lambda: self.collections)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matches_case_insensitive_substring(self):
+        self.assertEqual([c.key for c in self.agent.find_collections_by_name("LEARNING")], ["C1", "C2"])
+
+    def test_returned_list_is_a_copy_of_the_memoized_answer(self):
+        self.agent.find_collections_by_name("learning").clear()
+        self.assertEqual(len(self.agent.find_collections_by_name("learning")), 2)
+
+    def test_new_collections_list_invalidates_memoized_answers(self):
+        self.agent.find_collections_by_name("bio")
+        self.collections = self.collections + [ZoteroCollection(key="C4", name="Bioinformatics")]
+
+        self.assertEqual([c.key for c in self.agent.find_collections_by_name("bio")], ["C3", "C4"])
+
+
+class TestZoteroAgentLibrarySummary(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = agent = ZoteroAgent(ZoteroConfig(api_key="key123", library_id="12345"))
+        agent.client = MagicMock()
+        agent.client.get_library_version.return_value = 7
+        agent.client.get_items.return_value = [
+            ZoteroItem(key="A", itemType="journalArticle", date="2019"),
+            ZoteroItem(key="B", itemType="thesis", date="2023-01-02"),
+            ZoteroItem(key="C", itemType="book"),
+        ]
+        self.collections = [ZoteroCollection(key="C1", name="ML")]
+        patcher = patch.object(agent, 'get_collections', side_effect=lambda refresh_cache=False: self.collections)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_summary_counts_types_years_and_academic_papers(self):
+        summary = self.agent.get_library_summary()
+
+        self.assertEqual(summary.item_types, {"journalArticle": 1, "thesis": 1, "book": 1})
+        self.assertEqual(summary.academic_papers_in_sample, 2)
+        self.assertEqual(summary.year_range, (2019, 2023))
+        self.assertEqual(summary.collections_count, 1)
+
+    def test_unchanged_library_reuses_previous_summary(self):
+        first = self.agent.get_library_summary()
+        second = self.agent.get_library_summary()
+
+        self.assertEqual(second, first)
+        self.agent.client.get_items.assert_called_once()
+
+    def test_library_change_rebuilds_summary(self):
+        self.agent.get_library_summary()
+        self.agent.client.get_library_version.return_value = 8
+        self.collections = self.collections + [ZoteroCollection(key="C2", name="NLP")]
+
+        summary = self.agent.get_library_summary()
+        self.assertEqual([c.key for c in summary.collections], ["C1", "C2"])
+        self.assertEqual(self.agent.client.get_items.call_count, 2)
+
+
+class TestZoteroAgentIncrementalSync(unittest.TestCase):
+    """sync_library() keeps a versioned mirror updated with since=."""
+
+    def setUp(self):
+        zotero_agent._item_cache.clear()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.mirror_path = Path(tmp.name) / "zotero_items_12345.json"
+        patcher = patch('prisma.agents.zotero_agent._items_mirror_path', return_value=self.mirror_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _agent(self):
+        agent = ZoteroAgent(ZoteroConfig(api_key="key123", library_id="12345"))
+        agent.client = MagicMock()
+        return agent
+
+    def _item(self, key, title="T", **kw):
+        return ZoteroItem(key=key, itemType="journalArticle", title=title, **kw)
+
+    def test_first_sync_is_full_then_only_changes_are_merged(self):
+        agent = self._agent()
+        agent.client.get_items_since.side_effect = [
+            (5, [self._item("A"), self._item("B")], []),
+            (6, [self._item("B", title="Edited"), self._item("C")], ["A"]),
+        ]
+        agent.sync_library()
+        items = agent.sync_library()
+
+        self.assertEqual(agent.client.get_items_since.call_args_list[1].args, (5,))
+        self.assertEqual({i.key: i.title for i in items}, {"B": "Edited", "C": "T"})
+
+    def test_mirror_survives_a_new_session(self):
+        first = self._agent()
+        first.client.get_items_since.return_value = (5, [self._item("A")], [])
+        first.sync_library()
+
+        second = self._agent()
+        second.client.get_items_since.return_value = (5, [], [])
+        self.assertEqual([i.key for i in second.sync_library()], ["A"])
+        second.client.get_items_since.assert_called_once_with(5)
+
+    def test_mirror_file_leaves_out_raw_data(self):
+        agent = self._agent()
+        agent.client.get_items_since.return_value = (5, [self._item("A", raw_data={"data": {"title": "T"}})], [])
+        agent.sync_library()
+
+        self.assertNotIn("raw_data", self.mirror_path.read_text())
+
+    def test_known_current_version_skips_the_request(self):
+        agent = self._agent()
+        agent.client.get_items_since.return_value = (5, [self._item("A")], [])
+        agent.sync_library()
+        agent.sync_library(current_version=5)
+
+        agent.client.get_items_since.assert_called_once()
+
+    def test_incremental_search_filters_the_mirror_locally(self):
+        agent = self._agent()
+        agent.client.get_library_version.return_value = 5
+        agent.client.get_items_since.return_value = (5, [
+            self._item("A", collections=["C1"], date_modified="2024-01-01"),
+            self._item("B", collections=["C2"]),
+            self._item("C", collections=["C1"], date_modified="2024-06-01"),
+        ], [])
+        papers = agent.search_papers(ZoteroSearchCriteria(collections=["C1"], incremental=True, limit=5))
+
+        self.assertEqual([p.key for p in papers], ["C", "A"])
+        agent.client.get_items_in_collections.assert_not_called()
+
+    def test_mirror_searches_intersect_postings_built_once_per_sync(self):
+        agent = self._agent()
+        agent.client.get_library_version.return_value = 5
+        agent.client.get_items_since.return_value = (5, [
+            self._item("A", date="2021", tags=[{"tag": "ML"}]),
+            self._item("B", date="2019", tags=[{"tag": "ml"}]),
+            self._item("C", date="2022", tags=[{"tag": "nlp"}]),
+            self._item("D", tags=[{"tag": "ML"}]),
+        ], [])
+        by_tag = agent.search_papers(ZoteroSearchCriteria(tags=["Ml"], incremental=True))
+        postings = agent._mirror_postings()
+        by_both = agent.search_papers(ZoteroSearchCriteria(
+            tags=["ml"], date_range=(2020, 2023), incremental=True,
+        ))
+
+        self.assertEqual({p.key for p in by_tag}, {"A", "B", "D"})
+        self.assertEqual([p.key for p in by_both], ["A"])
+        self.assertIs(agent._mirror_postings(), postings)
+
+        agent.client.get_library_version.return_value = 6
+        agent.client.get_items_since.return_value = (6, [], ["A"])
+        by_both = agent.search_papers(ZoteroSearchCriteria(
+            tags=["ml"], date_range=(2020, 2023), incremental=True,
+        ))
+        self.assertEqual(by_both, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -163,6 +163,19 @@ index_extensions = ["md", ".yaml"]
             elif 'PRISMA_CONFIG' in os.environ:
                 del os.environ['PRISMA_CONFIG']
 
+    def test_unchanged_file_is_parsed_once_and_edits_are_picked_up(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.toml"
+            path.write_text('vault_root = "/first"\n')
+            first = ConfigLoader(config_path=path)
+            with patch('prisma.utils.config.tomllib.load') as load:
+                second = ConfigLoader(config_path=path)
+            load.assert_not_called()
+            self.assertIs(second.config, first.config)
+
+            path.write_text('vault_root = "/second-edit"\n')
+            self.assertEqual(ConfigLoader(config_path=path).get_vault_root(), Path("/second-edit"))
+
     def test_get_method_with_dot_notation(self):
         """Test the get method with dot notation for backward compatibility."""
         # Isolated from whatever real ~/.config/prisma/config.toml exists on
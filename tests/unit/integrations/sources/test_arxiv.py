@@ -1,6 +1,9 @@
+import io
+import xml.etree.ElementTree as ET
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
-from prisma.integrations.sources.arxiv import ArxivSource
+from prisma.integrations.sources.arxiv import ArxivSource, _parse_entry
 
 _ATOM_FEED = b'''<?xml version="1.0" encoding="UTF-8"?>
 <feed xmlns="http://www.w3.org/2005/Atom">
@@ -14,14 +17,18 @@ _ATOM_FEED = b'''<?xml version="1.0" encoding="UTF-8"?>
 </feed>'''
 
 
-@patch("prisma.integrations.sources.arxiv.requests.get")
-def test_search_parses_entries(mock_get):
-    mock_response = MagicMock(status_code=200, content=_ATOM_FEED)
+@patch("prisma.integrations.sources.http_session.session")
+def test_search_parses_entries(mock_session):
+    mock_response = MagicMock(status_code=200, raw=io.BytesIO(_ATOM_FEED))
+    mock_get = mock_session.return_value.get
     mock_get.return_value = mock_response
 
     source = ArxivSource()
     result = source.search("machine learning", limit=1)
 
+    assert mock_get.call_args.kwargs["stream"] is True
+    mock_response.close.assert_called_once()
+
     assert len(result.papers) == 1
     paper = result.papers[0]
     assert paper.arxiv_id == "test.123"
@@ -30,19 +37,43 @@ def test_search_parses_entries(mock_get):
     assert result.books == []
 
 
-@patch("prisma.integrations.sources.arxiv.requests.get")
-def test_search_returns_empty_on_http_error(mock_get):
-    mock_get.side_effect = Exception("network down")
+@patch("prisma.integrations.sources.http_session.session")
+def test_search_returns_empty_on_http_error(mock_session):
+    mock_session.return_value.get.side_effect = Exception("network down")
     source = ArxivSource()
     result = source.search("test", limit=1)
     assert result.papers == []
     assert result.books == []
 
 
-@patch("prisma.integrations.sources.arxiv.requests.get")
-def test_rate_limiter_denial_skips_the_call(mock_get):
+@patch("prisma.integrations.sources.http_session.session")
+def test_rate_limiter_denial_skips_the_call(mock_session):
     source = ArxivSource()
     source._limiter.acquire = MagicMock(return_value=False)
     result = source.search("test", limit=1)
     assert result.papers == []
-    mock_get.assert_not_called()
+    mock_session.return_value.get.assert_not_called()
+
+
+def test_parse_entry_collects_every_author_in_order():
+    entry = ET.fromstring(_ATOM_FEED.replace(
+        b"<author><name>Test Author</name></author>",
+        b"<author><name>First</name></author><author><name>Second</name></author>",
+    )).find("{http://www.w3.org/2005/Atom}entry")
+
+    paper = _parse_entry(entry)
+
+    assert paper.authors == ["First", "Second"]
+    assert paper.title == "A Sufficiently Long Test Paper Title About Machine Learning"
+    assert paper.published_date == "2024-01-01"
+
+
+@patch("prisma.integrations.sources.http_session.session")
+def test_query_is_passed_as_params_not_hand_encoded(mock_session):
+    mock_get = mock_session.return_value.get
+    mock_get.return_value = MagicMock(status_code=200, raw=io.BytesIO(_ATOM_FEED))
+    ArxivSource().search("graph & networks", limit=5, published_after=datetime(2024, 1, 2))
+
+    params = mock_get.call_args.kwargs["params"]
+    assert params["search_query"] == "all:graph & networks AND submittedDate:[20240102000000 TO 99991231235959]"
+    assert params["max_results"] == 5
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, patch
 
+import orjson
+
 from prisma.integrations.sources.googlebooks import GoogleBooksSource
 
 _RESPONSE = {
@@ -27,9 +29,9 @@ _RESPONSE = {
 }
 
 
-@patch("prisma.integrations.sources.googlebooks.requests.get")
+@patch("prisma.integrations.sources.googlebooks.http_session.get")
 def test_search_parses_items(mock_get):
-    mock_get.return_value = MagicMock(status_code=200, json=lambda: _RESPONSE)
+    mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps(_RESPONSE))
     source = GoogleBooksSource()
 
     result = source.search("deep learning", limit=1)
@@ -40,9 +42,9 @@ def test_search_parses_items(mock_get):
     assert book.cover_url == "https://books.google.com/thumb.jpg"
 
 
-@patch("prisma.integrations.sources.googlebooks.requests.get")
+@patch("prisma.integrations.sources.googlebooks.http_session.get")
 def test_api_key_added_to_params(mock_get):
-    mock_get.return_value = MagicMock(status_code=200, json=lambda: {"items": []})
+    mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps({"items": []}))
     source = GoogleBooksSource(api_key="secret")
 
     source.search("query", limit=1)
@@ -55,8 +57,8 @@ def test_daily_cap_exhausted_skips_request():
     source = GoogleBooksSource(daily_cap=1)
     source._limiter.acquire = MagicMock(side_effect=[True, False])
 
-    with patch("prisma.integrations.sources.googlebooks.requests.get") as mock_get:
-        mock_get.return_value = MagicMock(status_code=200, json=lambda: {"items": []})
+    with patch("prisma.integrations.sources.googlebooks.http_session.get") as mock_get:
+        mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps({"items": []}))
         source.search("q1", limit=1)
         result = source.search("q2", limit=1)
 
@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+import pytest
+
+from prisma.integrations.sources import http_session
+
+
+def test_session_is_built_once_and_shared():
+    assert http_session.session() is http_session.session()
+
+
+def test_adapter_pools_connections_and_retries_transient_statuses():
+    adapter = http_session.session().get_adapter("https://api.semanticscholar.org")
+    assert adapter._pool_maxsize == http_session._POOL_MAXSIZE
+    assert adapter.max_retries.total == 3
+    assert 429 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.raise_on_status is False
+
+
+def test_retry_waits_are_capped():
+    retry = http_session.session().get_adapter("https://api.semanticscholar.org").max_retries
+    assert retry.backoff_max == http_session._RETRY_WAIT_MAX
+    assert retry.parse_retry_after("3600") == http_session._RETRY_WAIT_MAX
+
+
+def test_get_delegates_to_the_shared_session():
+    with patch.object(http_session.session(), "get") as mock_get:
+        http_session.get("https://example.org", timeout=5)
+    mock_get.assert_called_once_with("https://example.org", timeout=5)
+
+
+def test_get_refuses_to_stream():
+    with pytest.raises(ValueError):
+        http_session.get("https://example.org", stream=True)
+
+
+def test_stream_holds_the_host_slot_until_the_block_exits():
+    slots = http_session._slots_for("http://export.arxiv.org/api/query")
+    with patch.object(http_session.session(), "get") as mock_get:
+        with http_session.stream("http://export.arxiv.org/api/query", timeout=5) as response:
+            assert not slots.acquire(blocking=False)  # body still being read
+            response.close.assert_not_called()
+    mock_get.assert_called_once_with("http://export.arxiv.org/api/query", stream=True, timeout=5)
+    response.close.assert_called_once()
+    assert slots.acquire(blocking=False)
+    slots.release()
+
+
+def test_brotli_is_advertised_when_decodable():
+    pytest.importorskip("brotli")
+    assert "br" in http_session.session().headers["Accept-Encoding"]
+
+
+def test_arxiv_is_limited_to_one_request_in_flight():
+    slots = http_session._slots_for("http://export.arxiv.org/api/query")
+    assert slots is http_session._slots_for("http://export.arxiv.org/other")
+    assert slots.acquire(blocking=False)
+    try:
+        assert not slots.acquire(blocking=False)
+    finally:
+        slots.release()
+
+
+def test_unlisted_hosts_get_the_default_cap():
+    slots = http_session._slots_for("https://unlisted.example.org/x")
+    acquired = 0
+    while slots.acquire(blocking=False):
+        acquired += 1
+    for _ in range(acquired):
+        slots.release()
+    assert acquired == http_session._DEFAULT_MAX_IN_FLIGHT
@@ -21,7 +21,7 @@ _FAKE_ARTICLE = {
 
 def test_no_api_key_skips_entirely_without_network():
     source = IEEEXploreSource()  # no key
-    with patch("prisma.integrations.sources.ieee_xplore.requests.get") as mock_get:
+    with patch("prisma.integrations.sources.ieee_xplore.http_session.get") as mock_get:
         result = source.search("robotics", limit=3)
     assert result.papers == []
     mock_get.assert_not_called()
@@ -32,7 +32,7 @@ def test_no_api_key_fails_probe():
     assert source.probe() is False
 
 
-@patch("prisma.integrations.sources.ieee_xplore.requests.get")
+@patch("prisma.integrations.sources.ieee_xplore.http_session.get")
 def test_search_with_key_parses_articles(mock_get):
     mock_get.return_value = MagicMock(status_code=200, json=lambda: {"articles": [_FAKE_ARTICLE]})
     source = IEEEXploreSource(api_key="secret")
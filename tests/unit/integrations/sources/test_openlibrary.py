@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, patch
 
+import orjson
+
 from prisma.integrations.sources.openlibrary import OpenLibrarySource
 
 _RESPONSE = {
@@ -20,9 +22,9 @@ _RESPONSE = {
 }
 
 
-@patch("prisma.integrations.sources.openlibrary.requests.get")
+@patch("prisma.integrations.sources.openlibrary.http_session.get")
 def test_search_parses_docs(mock_get):
-    mock_get.return_value = MagicMock(status_code=200, json=lambda: _RESPONSE)
+    mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps(_RESPONSE))
     source = OpenLibrarySource()
 
     result = source.search("deep learning", limit=1)
@@ -39,9 +41,9 @@ def test_search_parses_docs(mock_get):
     assert book.language == "eng"
 
 
-@patch("prisma.integrations.sources.openlibrary.requests.get")
+@patch("prisma.integrations.sources.openlibrary.http_session.get")
 def test_sends_identifying_user_agent(mock_get):
-    mock_get.return_value = MagicMock(status_code=200, json=lambda: {"start": 0, "num_found": 0, "docs": []})
+    mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps({"start": 0, "num_found": 0, "docs": []}))
     source = OpenLibrarySource()
 
     source.search("query", limit=1)
@@ -50,11 +52,11 @@ def test_sends_identifying_user_agent(mock_get):
     assert "User-Agent" in kwargs["headers"]
 
 
-@patch("prisma.integrations.sources.openlibrary.requests.get")
+@patch("prisma.integrations.sources.openlibrary.http_session.get")
 def test_doc_with_no_language_returns_none(mock_get):
     docs = dict(_RESPONSE)
     docs["docs"] = [{**_RESPONSE["docs"][0], "language": []}]
-    mock_get.return_value = MagicMock(status_code=200, json=lambda: docs)
+    mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps(docs))
     source = OpenLibrarySource()
 
     result = source.search("deep learning", limit=1)
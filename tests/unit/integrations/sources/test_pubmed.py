@@ -37,7 +37,7 @@ def _mock_response(json_data=None, content=None):
     return m
 
 
-@patch("prisma.integrations.sources.pubmed.requests.get")
+@patch("prisma.integrations.sources.pubmed.http_session.get")
 def test_search_makes_three_calls_and_parses(mock_get):
     mock_get.side_effect = [
         _mock_response(json_data=_ESEARCH_RESPONSE),
@@ -57,7 +57,7 @@ def test_search_makes_three_calls_and_parses(mock_get):
     assert "long enough abstract" in paper.abstract
 
 
-@patch("prisma.integrations.sources.pubmed.requests.get")
+@patch("prisma.integrations.sources.pubmed.http_session.get")
 def test_empty_esearch_short_circuits(mock_get):
     mock_get.return_value = _mock_response(json_data={"esearchresult": {"idlist": []}})
     source = PubMedSource()
@@ -68,7 +68,7 @@ def test_empty_esearch_short_circuits(mock_get):
     assert mock_get.call_count == 1  # esummary/efetch never called
 
 
-@patch("prisma.integrations.sources.pubmed.requests.get")
+@patch("prisma.integrations.sources.pubmed.http_session.get")
 def test_api_key_added_to_every_call(mock_get):
     mock_get.side_effect = [
         _mock_response(json_data=_ESEARCH_RESPONSE),
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, patch
 
+import orjson
+
 from prisma.integrations.sources.semantic_scholar import SemanticScholarSource
 
 _RESPONSE = {
@@ -18,9 +20,9 @@ _RESPONSE = {
 }
 
 
-@patch("prisma.integrations.sources.semantic_scholar.requests.get")
+@patch("prisma.integrations.sources.semantic_scholar.http_session.get")
 def test_search_parses_papers(mock_get):
-    mock_get.return_value = MagicMock(status_code=200, json=lambda: _RESPONSE)
+    mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps(_RESPONSE))
     source = SemanticScholarSource()
 
     result = source.search("deep learning", limit=1)
@@ -32,9 +34,9 @@ def test_search_parses_papers(mock_get):
     assert paper.source == "semanticscholar"
 
 
-@patch("prisma.integrations.sources.semantic_scholar.requests.get")
+@patch("prisma.integrations.sources.semantic_scholar.http_session.get")
 def test_api_key_sets_header(mock_get):
-    mock_get.return_value = MagicMock(status_code=200, json=lambda: {"data": []})
+    mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps({"data": []}))
     source = SemanticScholarSource(api_key="secret-key")
 
     source.search("query", limit=1)
@@ -43,9 +45,9 @@ def test_api_key_sets_header(mock_get):
     assert kwargs["headers"] == {"x-api-key": "secret-key"}
 
 
-@patch("prisma.integrations.sources.semantic_scholar.requests.get")
+@patch("prisma.integrations.sources.semantic_scholar.http_session.get")
 def test_no_key_sends_no_auth_header(mock_get):
-    mock_get.return_value = MagicMock(status_code=200, json=lambda: {"data": []})
+    mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps({"data": []}))
     source = SemanticScholarSource()
 
     source.search("query", limit=1)
@@ -10,6 +10,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from prisma.storage.models import zotero_models
+from prisma.integrations.zotero import client as client_module
 from prisma.integrations.zotero.client import (
     ZoteroAPIConfig,
     ZoteroClient,
@@ -18,6 +20,14 @@ from prisma.integrations.zotero.client import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_parse_cache():
+    # Fixtures below reuse keys like "K1" at version 1 with different
+    # payloads; don't let one test's parse be served to the next.
+    zotero_models._parsed_items.clear()
+    client_module._known_versions.clear()
+
+
 def _client() -> ZoteroClient:
     c = ZoteroClient(ZoteroAPIConfig(api_key="key123", library_id="12345", library_type="user"))
     c._client = MagicMock()
@@ -211,6 +221,121 @@ def test_get_collection_items_paginates_past_first_page():
     c._client.everything.assert_called_once_with("page1_query_result")
 
 
+def _collections(contents):
+    """collection_items() stand-in serving `contents[key][start:start + limit]`."""
+    return lambda key, limit, start=0: contents[key][start:start + limit]
+
+
+def test_get_items_in_collections_splits_limit_and_dedupes():
+    c = _client()
+    c._client.collection_items.side_effect = _collections({
+        "A": [_zotero_item_raw("K1", title="A"), _zotero_item_raw("K2", title="B"),
+              _zotero_item_raw("K8", title="second pass"), _zotero_item_raw("K9", title="never reached")],
+        "B": [_zotero_item_raw("K2", title="B"), _zotero_item_raw("K3", title="C")],
+    })
+    items = c.get_items_in_collections(["A", "B"], limit=4)
+    # K2 is in both, so the first pass yields 3 -- A is revisited for the 4th
+    assert [i.key for i in items] == ["K1", "K2", "K3", "K8"]
+    c._client.collection_items.assert_any_call("A", limit=2)
+    c._client.collection_items.assert_any_call("A", limit=1, start=2)
+    c._client.everything.assert_not_called()
+
+
+def test_get_items_in_collections_small_collection_passes_on_its_share():
+    c = _client()
+    c._client.collection_items.side_effect = _collections({
+        "A": [_zotero_item_raw("S1", title="x")],
+        "B": [_zotero_item_raw(f"B{i}", title="x") for i in range(10)],
+        "C": [_zotero_item_raw(f"C{i}", title="x") for i in range(10)],
+    })
+    items = c.get_items_in_collections(["A", "B", "C"], limit=9)
+    assert len(items) == 9
+    assert [i.key for i in items][:1] == ["S1"]
+    assert len({i.key for i in items}) == 9
+
+
+def test_get_items_in_collections_stops_when_every_collection_is_exhausted():
+    c = _client()
+    c._client.collection_items.side_effect = _collections({
+        "A": [_zotero_item_raw("K1", title="x")],
+        "B": [_zotero_item_raw("K1", title="x"), _zotero_item_raw("K2", title="x")],
+    })
+    items = c.get_items_in_collections(["A", "B"], limit=10)
+    assert [i.key for i in items] == ["K1", "K2"]
+
+
+def test_get_items_in_collections_follows_pages_until_share_is_met():
+    c = _client()
+    c._client.collection_items.return_value = [_zotero_item_raw(f"K{i}", title="x") for i in range(100)]
+    c._client.follow.side_effect = [
+        [_zotero_item_raw(f"K{i}", title="x") for i in range(100, 200)],
+        None,
+    ]
+    items = c.get_items_in_collections(["A"], limit=150)
+    assert len(items) == 150
+    c._client.collection_items.assert_called_once_with("A", limit=100)
+    assert c._client.follow.call_count == 1
+
+
+def _dated(key, date):
+    raw = _zotero_item_raw(key, title="x")
+    raw["data"]["date"] = date
+    return raw
+
+
+def test_get_items_in_year_range_stops_at_first_older_item():
+    c = _client()
+    c._client.items.return_value = [_dated("K1", "2031"), _dated("K2", "March 2024"), _dated("K3", "")]
+    c._client.follow.side_effect = [
+        [_dated("K4", "2022-05-01"), _dated("K5", "2019"), _dated("K6", "2023")],
+        AssertionError("paged past the start year"),
+    ]
+    items = c.get_items_in_year_range(2020, 2030, limit=10)
+    assert [i.key for i in items] == ["K2", "K4"]
+    c._client.items.assert_called_once_with(sort="date", direction="desc", limit=10)
+
+
+def test_get_items_in_year_range_stops_at_limit():
+    c = _client()
+    c._client.items.return_value = [_dated(f"K{i}", "2024") for i in range(5)]
+    items = c.get_items_in_year_range(2020, 2030, limit=3)
+    assert len(items) == 3
+    c._client.follow.assert_not_called()
+
+
+def test_item_types_become_one_ored_itemtype_param():
+    c = _client()
+    c._client.items.return_value = []
+    c.search_items("q", limit=5, item_types=["journalArticle", "preprint"])
+    c._client.items.assert_called_once_with(q="q", limit=5, itemType="journalArticle || preprint")
+
+
+def test_get_items_in_collections_empty_keys_makes_no_request():
+    c = _client()
+    assert c.get_items_in_collections([], limit=10) == []
+    c._client.collection_items.assert_not_called()
+
+
+def test_get_items_since_fetches_changes_and_deletions():
+    c = _client()
+    c._client.everything.return_value = [_zotero_item_raw("K2", title="Edited")]
+    c._client.request.headers = {"last-modified-version": "12"}
+    c._client.deleted.return_value = {"items": ["K1"], "collections": []}
+    version, changed, deleted = c.get_items_since(10)
+    assert (version, [i.key for i in changed], deleted) == (12, ["K2"], ["K1"])
+    c._client.items.assert_called_once_with(since=10)
+    c._client.deleted.assert_called_once_with(since=10)
+
+
+def test_get_items_since_without_version_is_a_full_fetch():
+    c = _client()
+    c._client.everything.return_value = []
+    c._client.request.headers = {"last-modified-version": "3"}
+    assert c.get_items_since(None) == (3, [], [])
+    c._client.items.assert_called_once_with()
+    c._client.deleted.assert_not_called()
+
+
 # ── ensure_collection ──────────────────────────────────────────────────────
 
 def test_ensure_collection_returns_existing():
@@ -239,8 +364,8 @@ def test_ensure_collection_creates_when_missing():
 def test_get_all_collections_paginates_via_everything():
     # Regression: get_collections()'s 100-item cap meant ensure_collection()
     # could miss an existing collection past page 1 and create a duplicate.
-    # get_all_collections() must route through pyzotero's everything() the
-    # same way get_all_items() already does.
+    # get_all_collections() must route through pyzotero's everything() to
+    # page past the first 100, the way get_all_items() follows its pages.
     c = _client()
     c._client.collections.return_value = "page1_query_result"
     c._client.everything.return_value = [
@@ -252,6 +377,86 @@ def test_get_all_collections_paginates_via_everything():
     c._client.everything.assert_called_once_with("page1_query_result")
 
 
+def test_get_library_version_wraps_failures():
+    c = _client()
+    c._client.last_modified_version.return_value = 42
+    assert c.get_library_version() == 42
+    c._client.last_modified_version.side_effect = RuntimeError("boom")
+    with pytest.raises(ZoteroClientError):
+        c.get_library_version()
+
+
+def test_get_library_version_reuses_a_recent_version_within_max_age():
+    c = _client()
+    c._client.last_modified_version.return_value = 42
+    assert c.get_library_version(max_age=30) == 42
+    c._client.last_modified_version.return_value = 43
+    # A second client for the same library shares the remembered version
+    other = _client()
+    other._client.last_modified_version.return_value = 43
+    assert c.get_library_version(max_age=30) == 42
+    assert other.get_library_version(max_age=30) == 42
+    assert c._client.last_modified_version.call_count == 1
+    other._client.last_modified_version.assert_not_called()
+    # Without max_age it always asks
+    assert c.get_library_version() == 43
+
+
+def test_get_library_version_probes_again_once_max_age_passes():
+    c = _client()
+    c._client.last_modified_version.side_effect = [42, 43]
+    with patch.object(client_module.time, "monotonic", side_effect=[100.0, 131.0, 131.0]):
+        assert c.get_library_version(max_age=30) == 42
+        assert c.get_library_version(max_age=30) == 43
+
+
+def test_get_library_version_remembers_version_from_other_responses():
+    c = _client()
+    c._client.everything.return_value = []
+    c._client.request.headers = {"last-modified-version": "57"}
+    c.get_items_since(None)
+    assert c.get_library_version(max_age=30) == 57
+    c._client.last_modified_version.assert_not_called()
+
+
+def test_get_library_version_forgets_remembered_version_after_a_write():
+    c = _client()
+    c._client.last_modified_version.side_effect = [42, 43]
+    assert c.get_library_version(max_age=30) == 42
+    c._client.delete_item.return_value = True
+    c.delete_item("K1")
+    assert c.get_library_version(max_age=30) == 43
+
+
+def test_get_collections_if_modified_returns_none_when_library_unchanged():
+    c = _client()
+    c._client.collection_versions.return_value = {}
+    c._client.request.headers = {"last-modified-version": "42"}
+    assert c.get_collections_if_modified(42) is None
+    c._client.collection_versions.assert_called_once_with(since=42)
+    c._client.everything.assert_not_called()
+
+
+def test_get_collections_if_modified_refetches_on_new_version():
+    c = _client()
+    c._client.collection_versions.return_value = {"C1": 43}
+    c._client.request.headers = {"last-modified-version": "43"}
+    c._client.everything.return_value = [
+        {"key": "C1", "version": 43, "data": {"name": "Renamed"}, "library": {}},
+    ]
+    version, collections = c.get_collections_if_modified(42)
+    assert version == 43
+    assert [col.name for col in collections] == ["Renamed"]
+
+
+def test_get_collections_if_modified_without_version_fetches_everything():
+    c = _client()
+    c._client.request.headers = {"last-modified-version": "7"}
+    c._client.everything.return_value = []
+    assert c.get_collections_if_modified(None) == (7, [])
+    c._client.collection_versions.assert_not_called()
+
+
 def test_ensure_collection_raises_when_creation_fails():
     # Regression: ensure_collection() used to return None on a failed
     # create_collection(), and callers (e.g. stream_runner.py) immediately
@@ -328,6 +533,42 @@ def test_add_paper_raises_on_failure():
         c.add_paper(paper)
 
 
+def test_add_papers_batches_and_aligns_results_with_input():
+    c = _client()
+    c._client.create_items.side_effect = [
+        {"successful": {str(i): _zotero_item_raw(f"K{i}", title=f"T{i}") for i in range(50)}},
+        {"successful": {}, "failed": {"0": {"code": 400}}},
+    ]
+    papers = [_FakePaper(title=f"T{i}", authors=[]) for i in range(51)]
+    items = c.add_papers(papers, collection_key="COLL1")
+    assert c._client.create_items.call_count == 2
+    assert len(c._client.create_items.call_args_list[0][0][0]) == 50
+    assert [i.key for i in items[:50]] == [f"K{i}" for i in range(50)]
+    assert items[50] is None
+
+
+def test_add_papers_failed_batch_costs_only_its_own_entries():
+    c = _client()
+    c._client.create_items.side_effect = [
+        {"successful": {str(i): _zotero_item_raw(f"K{i}", title=f"T{i}") for i in range(50)}},
+        Exception("HTTP 503"),
+    ]
+    papers = [_FakePaper(title=f"T{i}", authors=[]) for i in range(52)]
+    items = c.add_papers(papers)
+    assert len(items) == 52
+    assert [i.key for i in items[:50]] == [f"K{i}" for i in range(50)]
+    assert items[50:] == [None, None]
+
+
+def test_add_papers_skips_a_paper_that_cannot_be_converted():
+    c = _client()
+    c._client.create_items.return_value = {"successful": {"0": _zotero_item_raw("K1", title="Good")}}
+    items = c.add_papers([_FakePaper(title="Bad", authors=5), _FakePaper(title="Good", authors=[])])
+    assert len(c._client.create_items.call_args[0][0]) == 1
+    assert items[0] is None
+    assert items[1].key == "K1"
+
+
 # ── save_items ─────────────────────────────────────────────────────────────
 
 def test_save_items_creates_and_assigns_collection():
@@ -349,3 +590,91 @@ def test_save_items_continues_after_one_failure():
         {"itemType": "journalArticle", "title": "Succeeds"},
     ])
     assert keys == ["K2"]
+
+
+# ── delete_items ──────────────────────────────────────────────────────────────
+
+def test_delete_items_batches_fifty_keys_per_request():
+    c = _client()
+    c._client.last_modified_version.side_effect = [7, 8]
+    keys = [f"K{i}" for i in range(60)]
+    result = c.delete_items(keys)
+    assert result == dict.fromkeys(keys, True)
+    first, second = c._client.delete_item.call_args_list
+    assert [p["key"] for p in first.args[0]] == keys[:50] and first.kwargs == {"last_modified": 7}
+    assert [p["key"] for p in second.args[0]] == keys[50:] and second.kwargs == {"last_modified": 8}
+    c._client.item.assert_not_called()
+
+
+def test_delete_items_falls_back_per_item_when_a_batch_fails():
+    c = _client()
+    c._client.last_modified_version.return_value = 7
+    c._client.item.side_effect = lambda key: {"key": key, "version": 7} if key == "K1" else None
+    c._client.delete_item.side_effect = [RuntimeError("412 Precondition Failed"), True]
+    assert c.delete_items(["K1", "K2"]) == {"K1": True, "K2": False}
+
+
+# ── add_items_to_collection ───────────────────────────────────────────────────
+
+def test_add_items_to_collection_updates_in_one_batch():
+    c = _client()
+    c._client.items.return_value = [
+        _zotero_item_raw("A", title="A"),
+        _zotero_item_raw("B", title="B", collections=["COLL1"]),
+    ]
+    c._client.request.json.return_value = {"successful": {"0": {"key": "A"}}, "failed": {}}
+    result = c.add_items_to_collection(["A", "B", "MISSING"], "COLL1")
+    assert result == {"A": True, "B": True, "MISSING": False}
+    assert c._client.items.call_args.kwargs["itemKey"] == "A,B,MISSING"
+    updated = c._client.update_items.call_args[0][0]
+    assert [d["title"] for d in updated] == ["A"]  # B was already in the collection
+    assert updated[0]["collections"] == ["COLL1"]
+
+
+def test_add_items_to_collection_reports_keys_zotero_rejected_as_not_added():
+    c = _client()
+    c._client.items.return_value = [_zotero_item_raw("A", title="A"), _zotero_item_raw("B", title="B")]
+    c._client.update_items.return_value = True  # pyzotero says True regardless
+    c._client.request.json.return_value = {
+        "successful": {"1": {"key": "B"}},
+        "failed": {"0": {"key": "A", "code": 412, "message": "Item has been modified since specified version"}},
+    }
+    assert c.add_items_to_collection(["A", "B"], "COLL1") == {"A": False, "B": True}
+
+
+def test_add_items_to_collection_falls_back_per_item_on_batch_failure():
+    c = _client()
+    c._client.items.side_effect = Exception("HTTP 503")
+    with patch.object(c, "add_item_to_collection", side_effect=[True, False]) as per_item:
+        assert c.add_items_to_collection(["A", "B"], "COLL1") == {"A": True, "B": False}
+    assert per_item.call_count == 2
+
+
+# ── iter_all_items / get_library_stats ────────────────────────────────────────
+
+def test_iter_all_items_fetches_pages_as_consumed():
+    c = _client()
+    c._client.items.return_value = [_zotero_item_raw("K1", title="A"), _zotero_item_raw("K2", title="B")]
+    c._client.follow.side_effect = [[_zotero_item_raw("K3", title="C")], None]
+    it = c.iter_all_items()
+
+    assert next(it).key == "K1"
+    c._client.follow.assert_not_called()
+    assert [i.key for i in it] == ["K2", "K3"]
+    c._client.items.assert_called_once_with(limit=100)
+
+
+def test_iter_all_items_wraps_errors():
+    c = _client()
+    c._client.items.side_effect = RuntimeError("boom")
+    with pytest.raises(ZoteroClientError):
+        list(c.iter_all_items())
+
+
+def test_get_library_stats_counts_without_listing_items():
+    c = _client()
+    c._client.count_items.return_value = 1234
+    c._client.collections.return_value = []
+    stats = c.get_library_stats()
+    assert stats.total_items == 1234 and stats.api_available
+    c._client.items.assert_not_called()
@@ -3,7 +3,9 @@ Test Zotero data models
 """
 
 import pytest
+import timeit
 from datetime import datetime
+from unittest.mock import patch
 from prisma.storage.models.zotero_models import (
     ZoteroItem, 
     ZoteroCollection, 
@@ -81,6 +83,20 @@ class TestZoteroTag:
         assert tag.tag == "neural networks"
         assert tag.type == 1
 
+    def test_equal_tags_share_one_string(self):
+        """Tag text is interned, so repeated tags across items cost one string"""
+        first = ZoteroTag(tag="".join(["deep ", "learning"]))
+        second = ZoteroTag(tag="".join(["deep ", "learning "]))
+        
+        assert first.tag is second.tag
+    
+    def test_tag_lower_is_not_serialized(self):
+        """tag_lower is a derived helper, not part of the model's data"""
+        tag = ZoteroTag(tag="Deep Learning")
+        
+        assert tag.tag_lower == "deep learning"
+        assert tag.model_dump() == {"tag": "Deep Learning", "type": 0}
+
 
 class TestZoteroCollection:
     """Test ZoteroCollection data model"""
@@ -273,6 +289,60 @@ class TestZoteroItem:
         assert item.collections == ["COLLECTION1"]
         assert item.version == 10
     
+    def test_from_zotero_data_reuses_parse_for_same_version(self):
+        """An unchanged item version is parsed once; each call still gets its own copy"""
+        data = {"key": "CACHED1", "version": 3, "library": {"id": 1},
+                "data": {"itemType": "book", "title": "Original"}}
+        first = ZoteroItem.from_zotero_data(data)
+        first.title = "Mutated by caller"
+        
+        with patch.object(ZoteroItem, "_parse_zotero_data") as mock_parse:
+            second = ZoteroItem.from_zotero_data(data)
+        
+        mock_parse.assert_not_called()
+        assert second.title == "Original"
+
+    def test_from_zotero_data_in_place_mutation_leaves_cache_alone(self):
+        """Appending to a returned item's lists must not leak into later calls"""
+        data = {"key": "CACHED3", "version": 1, "library": {"id": 1},
+                "data": {"itemType": "book", "title": "Original",
+                         "tags": [{"tag": "kept"}], "collections": ["C1"]}}
+        first = ZoteroItem.from_zotero_data(data)
+        first.tags.append(ZoteroTag(tag="leaked"))
+        first.collections.append("C2")
+
+        refetched = {**data}
+        second = ZoteroItem.from_zotero_data(refetched)
+
+        assert [t.tag for t in second.tags] == ["kept"]
+        assert second.collections == ["C1"]
+        # raw_data is the caller's own dict, as on a miss -- never copied
+        assert second.raw_data is refetched
+
+    def test_from_zotero_data_hit_is_cheaper_than_a_parse(self):
+        """The whole point of the cache: a hit must cost less than re-validating"""
+        data = {"key": "CACHED4", "version": 1, "library": {"id": 1},
+                "data": {"itemType": "journalArticle", "title": "A study", "abstractNote": "x" * 800,
+                         "creators": [{"creatorType": "author", "firstName": f"F{i}", "lastName": f"L{i}"}
+                                      for i in range(6)],
+                         "tags": [{"tag": f"t{i}"} for i in range(5)], "collections": ["C1"]}}
+        ZoteroItem.from_zotero_data(data)
+
+        def best_of(fn, runs=5, number=300):
+            return min(timeit.timeit(fn, number=number) for _ in range(runs))
+
+        hit = best_of(lambda: ZoteroItem.from_zotero_data(data))
+        parse = best_of(lambda: ZoteroItem._parse_zotero_data(data))
+        assert hit < parse
+
+    def test_from_zotero_data_reparses_new_version(self):
+        """A bumped version is a cache miss"""
+        data = {"key": "CACHED2", "version": 3, "data": {"itemType": "book", "title": "Old"}}
+        ZoteroItem.from_zotero_data(data)
+        
+        updated = {"key": "CACHED2", "version": 4, "data": {"itemType": "book", "title": "New"}}
+        assert ZoteroItem.from_zotero_data(updated).title == "New"
+    
     def test_to_dict_serialization(self):
         """Test dictionary serialization"""
         creators = [
@@ -301,4 +371,5 @@ class TestZoteroItem:
         assert item_dict["doi"] == "10.1000/test"
         assert item_dict["tags"] == ["machine learning"]
         assert item_dict["is_academic_paper"] is True
+        assert item_dict["citation_key"] == item.citation_key == "Doe2023AStudy"
         assert "citation_key" in item_dict
\ No newline at end of file
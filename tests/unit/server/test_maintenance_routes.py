@@ -7,7 +7,7 @@ from unittest.mock import MagicMock
 
 from fastapi.testclient import TestClient
 
-from prisma.server.app import DedupJobState, _run_deduplicate, app
+from prisma.server.app import DedupJobState, WouldDeleteEntry, _run_deduplicate, app
 from prisma.storage.models.zotero_models import ZoteroCreator, ZoteroItem
 
 client = TestClient(app, client=("127.0.0.1", 12345))
@@ -49,17 +49,30 @@ def test_real_dedup_job_returns_its_state(monkeypatch):
     assert body["duplicates_found"] == 2
 
 
+def test_dedup_job_status_serializes_would_delete_entries(monkeypatch):
+    import prisma.server.app as app_mod
+    job = DedupJobState(status="done", dry_run=True, max_level=1, sensitivity="medium", would_delete=[
+        WouldDeleteEntry(key="B", title="Paper B", keep_key="A", keep_title="Paper A"),
+    ])
+    monkeypatch.setitem(app_mod._jobs, "dedup-job-2", job)
+    resp = client.get("/maintenance/deduplicate/dedup-job-2")
+    assert resp.status_code == 200
+    assert resp.json()["would_delete"] == [
+        {"key": "B", "title": "Paper B", "doi": None, "keep_key": "A", "keep_title": "Paper A"},
+    ]
+
+
 def test_run_deduplicate_does_not_count_failed_deletes_as_successful(monkeypatch):
-    # Regression: delete_item() catches its own exceptions and returns
-    # bool -- it never raises. items_deleted used to be incremented
-    # unconditionally right after the call, so a False return (a real
+    # Regression: delete_items() catches its own exceptions and reports
+    # per key -- it never raises. items_deleted used to be incremented
+    # unconditionally right after the call, so a False result (a real
     # failure) was silently counted as a successful deletion.
     import prisma.server.app as app_mod
 
     dup_a, dup_b = _item("A", "10.1/x"), _item("B", "10.1/x")
     mock_zotero = MagicMock()
     mock_zotero.get_all_items.return_value = [dup_a, dup_b]
-    mock_zotero.delete_item.return_value = False  # simulated failure, no exception
+    mock_zotero.delete_items.return_value = {"B": False}  # simulated failure, no exception
     monkeypatch.setattr(app_mod, "_zotero", mock_zotero)
 
     _run_deduplicate("job-x", dry_run=False, max_level=1, sensitivity="medium")
@@ -67,4 +80,21 @@ def test_run_deduplicate_does_not_count_failed_deletes_as_successful(monkeypatch
     job = app_mod._jobs["job-x"]
     assert job.duplicates_found == 1
     assert job.items_deleted == 0
-    assert job.errors and "delete_item returned False" in job.errors[0]
+    assert job.errors == ["B: delete failed"]
+
+
+def test_run_deduplicate_deletes_all_duplicates_in_one_batch(monkeypatch):
+    import prisma.server.app as app_mod
+
+    items = [_item("A", "10.1/x"), _item("B", "10.1/x"), _item("C", "10.1/y"), _item("D", "10.1/y")]
+    mock_zotero = MagicMock()
+    mock_zotero.get_all_items.return_value = items
+    mock_zotero.delete_items.side_effect = lambda keys: dict.fromkeys(keys, True)
+    monkeypatch.setattr(app_mod, "_zotero", mock_zotero)
+
+    _run_deduplicate("job-y", dry_run=False, max_level=1, sensitivity="medium")
+
+    mock_zotero.delete_items.assert_called_once()
+    mock_zotero.delete_item.assert_not_called()
+    job = app_mod._jobs["job-y"]
+    assert job.items_deleted == 2 and job.errors == []
@@ -12,6 +12,7 @@ from fastapi.testclient import TestClient
 
 from prisma.server.streams_routes import build_streams_router
 from prisma.services.vault import VaultService
+from prisma.storage.models.vault_models import StreamRunResult
 
 
 class _Recorder:
@@ -132,3 +133,54 @@ def test_run_stream_broadcasts_progress(client, vault, zotero, recorder):
     assert r.status_code == 200
     assert "not due" in r.json()["errors"][0]
     assert recorder.broadcasts[0][0] == {"type": "stream_progress", "slug": "my-stream", "status": "running"}
+
+
+def test_create_stream_with_run_initial_runs_in_background(client, vault, recorder):
+    import threading
+    from unittest.mock import patch
+
+    release = threading.Event()
+    finished = threading.Event()
+
+    def fake_runner(slug, vault_arg, zotero_arg, force=False, **kwargs):
+        release.wait(timeout=5)
+        finished.set()
+        assert force is True
+        return StreamRunResult(slug=slug, papers_found=0, papers_saved=0, sources_used=[], sources_skipped=[])
+
+    with patch("prisma.services.stream_runner.run_stream", side_effect=fake_runner):
+        r = client.post("/streams", json={"title": "My Stream", "query": "q", "run_initial": True})
+        assert r.status_code == 201  # returned while the run is still blocked
+        assert r.json()["running"] is True
+        assert client.get("/streams/my-stream").json()["running"] is True
+
+        release.set()
+        assert finished.wait(timeout=5)
+
+    for _ in range(50):
+        if not client.get("/streams/my-stream").json()["running"]:
+            break
+        threading.Event().wait(0.01)
+    assert client.get("/streams/my-stream").json()["running"] is False
+
+
+def test_run_stream_conflicts_while_already_running(client, vault):
+    from prisma.server import streams_routes
+
+    vault.create_stream(title="My Stream", query="q")
+    assert streams_routes._claim_run("my-stream")
+    try:
+        r = client.post("/streams/my-stream/run")
+        assert r.status_code == 409
+        assert not streams_routes._claim_run("my-stream")
+    finally:
+        streams_routes._running_streams.discard("my-stream")
+
+
+def test_create_stream_without_run_initial_does_not_run(client):
+    from unittest.mock import patch
+
+    with patch("prisma.server.streams_routes.run_stream_and_notify") as run:
+        r = client.post("/streams", json={"title": "My Stream", "query": "q"})
+    assert r.json()["running"] is False
+    run.assert_not_called()
@@ -1002,3 +1002,22 @@ def test_check_pool_vram_fit_skips_pool_without_vram_budget(tmp_path, monkeypatc
     model_vram = {"local-ollama": {"model-a": 999999, "model-b": 999999}}
 
     assert _check_pool_vram_fit(pool_models, {"local-ollama": None}, {"local-ollama"}, model_vram) == {}
+
+
+def test_main_fails_on_taken_control_port_before_starting_workers(tmp_path, monkeypatch):
+    import socket
+
+    import pytest
+
+    from prisma.server import supervisor as sup
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(sup, "_configure_logging", lambda: None)
+    monkeypatch.setattr(sup.Supervisor, "start_all", lambda self: pytest.fail("workers started"))
+    monkeypatch.setattr(sup.threading.Thread, "start", lambda self: pytest.fail(f"{self.name} started"))
+
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        with pytest.raises(OSError):
+            sup.main(supervisor_port=taken.getsockname()[1])
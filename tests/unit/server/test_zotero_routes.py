@@ -34,7 +34,7 @@ def _item(item_type="journalArticle", doi="10.1/x", abstract="abs", authors=("A"
 
 def test_zotero_stats_empty_library(monkeypatch):
     from prisma.server import app as app_module
-    monkeypatch.setattr(app_module._zotero, "get_all_items", lambda **kw: [])
+    monkeypatch.setattr(app_module._zotero, "iter_all_items", lambda **kw: iter([]))
 
     r = client.get("/zotero/stats")
     assert r.status_code == 200
@@ -50,7 +50,7 @@ def test_zotero_stats_counts_and_quality(monkeypatch):
         _item(doi=None),
         _item(abstract=None, authors=()),
     ]
-    monkeypatch.setattr(app_module._zotero, "get_all_items", lambda **kw: items)
+    monkeypatch.setattr(app_module._zotero, "iter_all_items", lambda **kw: iter(items))
 
     r = client.get("/zotero/stats")
     assert r.status_code == 200
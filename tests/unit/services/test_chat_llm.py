@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from prisma.services.chat_llm import ChatLLM
+from prisma.services.chat_llm import ChatLLM, LeaseDenied
 from prisma.utils.config import ChatConfig, LLMConfig
 
 
@@ -58,6 +58,15 @@ def test_complete_returns_none_when_lease_denied():
     assert result is None
 
 
+def test_complete_raises_lease_denied_when_asked_to():
+    llm = _llm()
+    with patch("prisma.services.chat_llm.resource_lock.acquire", return_value=(False, None, None)), \
+         patch("prisma.services.chat_llm.resource_lock.backoff.retry_with_backoff",
+               side_effect=lambda attempt, is_success, **kw: attempt()), \
+         pytest.raises(LeaseDenied):
+        llm.complete([{"role": "user", "content": "hi"}], raise_on_denied=True)
+
+
 def test_complete_returns_content_on_success():
     llm = _llm()
     mock_resp = MagicMock()
@@ -121,6 +130,19 @@ def test_complete_per_call_max_tokens_and_timeout_override_config():
     assert mock_create.call_args.kwargs["timeout"] == 7
 
 
+def test_complete_passes_response_format_only_when_given():
+    llm = _llm()
+    mock_resp = MagicMock()
+    mock_resp.choices = [MagicMock(message=MagicMock(content="{}"))]
+    with patch("prisma.services.chat_llm.resource_lock.acquire", return_value=(True, "local-ollama", "req-1")), \
+         patch("prisma.services.chat_llm.resource_lock.release"), \
+         patch.object(llm._client.chat.completions, "create", return_value=mock_resp) as mock_create:
+        llm.complete([{"role": "user", "content": "hi"}])
+        llm.complete([{"role": "user", "content": "hi"}], response_format={"type": "json_object"})
+    assert "response_format" not in mock_create.call_args_list[0].kwargs
+    assert mock_create.call_args_list[1].kwargs["response_format"] == {"type": "json_object"}
+
+
 def test_default_priority_is_interactive():
     # Preserves chat's original behavior — a live chat request must never
     # queue behind bulk background work.
@@ -140,6 +162,50 @@ def test_explicit_priority_is_honored_in_lease():
     assert mock_acquire.call_args.kwargs["priority"] == "background"
 
 
+def test_instances_with_same_endpoint_share_one_client():
+    # One httpx pool per endpoint for the whole process, so keep-alive
+    # connections are reused across every ChatLLM/AnalysisAgent instance.
+    a = _llm(provider="ollama")
+    b = ChatLLM(ChatConfig(provider="ollama"), ollama_host="localhost:11434", priority="background")
+    assert a._client is b._client
+
+
+def test_instances_with_different_endpoints_get_separate_clients():
+    a = ChatLLM(ChatConfig(provider="ollama"), ollama_host="localhost:11434")
+    b = ChatLLM(ChatConfig(provider="ollama"), ollama_host="otherhost:11434")
+    assert a._client is not b._client
+
+
+def test_http2_only_for_https_endpoints_when_h2_installed(monkeypatch):
+    import prisma.services.chat_llm as chat_llm_mod
+    monkeypatch.setattr(chat_llm_mod, "_clients", {})
+    monkeypatch.setattr(chat_llm_mod, "_HTTP2_AVAILABLE", True)
+    with patch("prisma.services.chat_llm.DefaultHttpxClient") as mock_http, \
+         patch("prisma.services.chat_llm.OpenAI"):
+        chat_llm_mod._shared_client("http://localhost:11434/v1", "ollama")
+        chat_llm_mod._shared_client("https://openrouter.ai/api/v1", "sk-test")
+    assert [c.kwargs["http2"] for c in mock_http.call_args_list] == [False, True]
+
+
+def test_preload_posts_keep_alive_to_native_ollama_endpoint():
+    llm = _llm(provider="ollama", model="qwen2.5:7b-32k")
+    with patch("prisma.services.chat_llm.resource_lock.acquire", return_value=(True, "local-ollama", "req-1")), \
+         patch("prisma.services.chat_llm.resource_lock.release"), \
+         patch("prisma.services.chat_llm.requests.post") as mock_post:
+        assert llm.preload(keep_alive="30m") is True
+    url = mock_post.call_args.args[0]
+    assert url == "http://localhost:11434/api/generate"
+    assert mock_post.call_args.kwargs["json"]["keep_alive"] == "30m"
+    assert mock_post.call_args.kwargs["json"]["prompt"] == ""
+
+
+def test_preload_is_a_noop_for_non_ollama_providers():
+    llm = _llm(provider="llama_cpp")
+    with patch("prisma.services.chat_llm.requests.post") as mock_post:
+        assert llm.preload() is False
+    mock_post.assert_not_called()
+
+
 class TestFromLlmConfig:
     def test_adapts_fields_and_defaults_priority_to_background(self):
         llm_config = LLMConfig(provider="ollama", model="qwen2.5:7b-32k", host="localhost:11434")
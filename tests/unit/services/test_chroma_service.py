@@ -53,22 +53,33 @@ def test_chunk_markdown_empty_text_returns_one_chunk():
 def test_embed_texts_returns_embeddings_on_200():
     mock_resp = MagicMock()
     mock_resp.status_code = 200
-    mock_resp.json.return_value = {"embeddings": [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]}
-    with patch("prisma.services.chroma_service.requests.post", return_value=mock_resp):
+    mock_resp.content = b'{"embeddings": [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]}'
+    with patch("prisma.services.chroma_service._embed_session.post", return_value=mock_resp):
         result = _embed_texts(["hello", "world"], model="nomic-embed-text")
     assert result == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
 
 
+def test_embed_texts_llama_cpp_orders_by_index():
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.content = (
+        b'{"data": [{"index": 1, "embedding": [0.4, 0.5]}, {"index": 0, "embedding": [0.1, 0.2]}]}'
+    )
+    with patch("prisma.services.chroma_service._embed_session.post", return_value=mock_resp):
+        result = _embed_texts(["hello", "world"], model="bge-m3", provider="llama_cpp")
+    assert result == [[0.1, 0.2], [0.4, 0.5]]
+
+
 def test_embed_texts_returns_none_on_non_200():
     mock_resp = MagicMock()
     mock_resp.status_code = 500
-    with patch("prisma.services.chroma_service.requests.post", return_value=mock_resp):
+    with patch("prisma.services.chroma_service._embed_session.post", return_value=mock_resp):
         result = _embed_texts(["hello"], model="nomic-embed-text")
     assert result is None
 
 
 def test_embed_texts_returns_none_on_exception():
-    with patch("prisma.services.chroma_service.requests.post", side_effect=ConnectionError("down")):
+    with patch("prisma.services.chroma_service._embed_session.post", side_effect=ConnectionError("down")):
         result = _embed_texts(["hello"], model="nomic-embed-text")
     assert result is None
 
@@ -147,6 +147,14 @@ def test_find_duplicate_title_match():
     assert hit.key == "K1"
 
 
+@patch("prisma.services.dedup.significant_words", return_value=frozenset())
+def test_find_duplicate_title_match_ignores_punctuation(_):
+    items = [_item("K1", "Attention Is All You Need.")]
+    by_doi, by_title, stems = build_index(items)
+    hit = find_duplicate(_paper("Attention is all you need"), by_doi, by_title, stems)
+    assert hit is not None and hit.key == "K1"
+
+
 def test_find_duplicate_no_match():
     items = [_item("K1", "Completely Unrelated Work on Chemistry")]
     by_doi, by_title, stems = build_index(items)
@@ -271,6 +279,15 @@ def test_find_all_duplicates_doi_group():
     assert keys == {"K1", "K2"}
 
 
+def test_find_all_duplicates_doi_group_ignores_resolver_prefix():
+    items = [
+        _item("K1", "Paper A", doi="10.1/Same"),
+        _item("K2", "Paper A (preprint)", doi="https://doi.org/10.1/same"),
+    ]
+    groups = find_all_duplicates(items, max_level=1)
+    assert [{i.key for i in g} for g in groups] == [{"K1", "K2"}]
+
+
 # ---------------------------------------------------------------------------
 # find_all_duplicates — level 2
 # ---------------------------------------------------------------------------
@@ -287,6 +304,28 @@ def test_find_all_duplicates_title_group():
     assert keys == {"K1", "K2"}
 
 
+def test_find_all_duplicates_title_group_ignores_punctuation():
+    items = [
+        _item("K1", "Don’t Stop Pretraining."),
+        _item("K2", "Don't stop pretraining"),
+        _item("K3", "?"),
+        _item("K4", "!"),
+    ]
+    groups = find_all_duplicates(items, max_level=2)
+    assert [{i.key for i in g} for g in groups] == [{"K1", "K2"}]
+
+
+def test_find_all_duplicates_title_group_keeps_symbol_variants_apart():
+    items = [
+        _item("K1", "C++ Programming"),
+        _item("K2", "C# Programming"),
+        _item("K3", "C Programming"),
+        _item("K4", "Version 1.5 Results"),
+        _item("K5", "Version 15 Results"),
+    ]
+    assert find_all_duplicates(items, max_level=2) == []
+
+
 # ---------------------------------------------------------------------------
 # find_all_duplicates — level 3: year + author
 # ---------------------------------------------------------------------------
@@ -318,6 +357,19 @@ def test_find_all_duplicates_year_mismatch_no_group():
     assert len(groups) == 0
 
 
+def test_find_all_duplicates_year_author_groups_in_library_order():
+    items = [
+        _item("K1", "Title One", year=2020, authors=["Smith, John", "Doe, Ann"]),
+        _item("K2", "Title Two", year=2015, authors=["Lee, Kim"]),
+        _item("K3", "Title Three", year=2021, authors=["Doe, Alice"]),
+        _item("K4", "Title Four", year=None, authors=["Smith, Jim"]),
+        _item("K5", "Title Five", year=2023, authors=["Smith, John"]),
+    ]
+    groups = find_all_duplicates(items, max_level=3)
+    # K5 shares an author with K1 but is two years out; K2 shares no one
+    assert [[i.key for i in g] for g in groups] == [["K1", "K3", "K4"]]
+
+
 # ---------------------------------------------------------------------------
 # find_all_duplicates — max_level stops early
 # ---------------------------------------------------------------------------
@@ -351,6 +403,21 @@ def test_find_all_duplicates_stem_certain_group():
     assert keys == {"K1", "K2"}
 
 
+def test_find_all_duplicates_grouped_items_skip_later_levels():
+    items = [
+        _item("K1", "Same DOI One", doi="10.1/x", year=2020, authors=["Smith, John"]),
+        _item("K2", "Same DOI Two", doi="10.1/x", year=2020, authors=["Smith, John"]),
+        _item("K3", "Alone", year=2001, authors=["Doe, Ann"]),
+    ]
+    with patch("prisma.services.dedup.significant_words", return_value=frozenset()) as stems, \
+            patch("prisma.services.dedup._author_pairs", return_value=set()) as pairs:
+        groups = find_all_duplicates(items, max_level=4)
+
+    assert [{i.key for i in g} for g in groups] == [{"K1", "K2"}]
+    assert [c.args[0] for c in stems.call_args_list] == ["Alone"]
+    assert [c.args[0].key for c in pairs.call_args_list] == ["K3"]
+
+
 def test_find_all_duplicates_max_level_3_skips_stem_matching():
     items = [
         _item("K1", _STEM_CERTAIN_TITLE_A),
@@ -11,6 +11,7 @@ SearchAgent/AnalysisAgent are imported *inside* run_stream
 (`from prisma.agents.search_agent import SearchAgent`), so they must be
 patched at their source module, not at prisma.services.stream_runner.
 """
+import threading
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
@@ -107,7 +108,7 @@ def test_zotero_offline_finds_but_does_not_save(vault):
     # Zotero offline -> the internet-paper loop breaks immediately, so
     # relevance checking (and any Zotero write) never happens.
     MockAnalysisAgent.return_value.batch_relevance_check.assert_not_called()
-    zotero.add_paper.assert_not_called()
+    zotero.add_papers.assert_not_called()
 
 
 def test_saves_relevant_new_paper_via_zotero_online(vault):
@@ -118,7 +119,7 @@ def test_saves_relevant_new_paper_via_zotero_online(vault):
     zotero.get_collection_items.return_value = []  # empty existing collection
     zotero.find_by_identifier.return_value = None  # not already in library
     saved_item = _zotero_item("NEW1", "Paper One", version=1)
-    zotero.add_paper.return_value = saved_item
+    zotero.add_papers.return_value = [saved_item]
 
     mock_search_agent = MagicMock()
     mock_search_agent.preflight.return_value = ["arxiv"]
@@ -135,8 +136,8 @@ def test_saves_relevant_new_paper_via_zotero_online(vault):
 
     assert result.papers_saved == 1
     assert result.papers_skipped_llm == 0
-    zotero.add_paper.assert_called_once()
-    zotero.add_item_to_collection.assert_called_once_with("NEW1", "COLLECTION1")
+    zotero.add_papers.assert_called_once()
+    zotero.add_items_to_collection.assert_called_once_with(["NEW1"], "COLLECTION1")
 
     # collection_key was persisted onto the stream (ensure_collection's
     # result differs from the stream's prior None collection_key)
@@ -167,7 +168,7 @@ def test_dedup_skips_paper_already_in_collection(vault):
 
     assert result.papers_saved == 0
     # never even reaches the bookmark/relevance-check stage for this paper
-    zotero.add_paper.assert_not_called()
+    zotero.add_papers.assert_not_called()
     mock_analysis_agent.batch_relevance_check.assert_not_called()
 
 
@@ -178,7 +179,7 @@ def test_llm_relevance_check_rejects_paper(vault):
     zotero.ensure_collection.return_value = MagicMock(key="COLLECTION1")
     zotero.get_collection_items.return_value = []
     zotero.find_by_identifier.return_value = None
-    zotero.add_paper.return_value = _zotero_item("NEW1", "Irrelevant Paper")
+    zotero.add_papers.return_value = [_zotero_item("NEW1", "Irrelevant Paper")]
 
     mock_search_agent = MagicMock()
     mock_search_agent.preflight.return_value = ["arxiv"]
@@ -195,7 +196,7 @@ def test_llm_relevance_check_rejects_paper(vault):
 
     assert result.papers_saved == 0
     assert result.papers_skipped_llm == 1
-    zotero.add_item_to_collection.assert_not_called()
+    zotero.add_items_to_collection.assert_not_called()
 
 
 def test_library_search_source_saves_relevant_existing_item(vault):
@@ -226,4 +227,170 @@ def test_library_search_source_saves_relevant_existing_item(vault):
         result = run_stream(stream.slug, vault, zotero, force=True)
 
     assert result.papers_saved == 1
-    zotero.add_item_to_collection.assert_called_once_with("LIB1", "COLLECTION1")
+    zotero.add_items_to_collection.assert_called_once_with(["LIB1"], "COLLECTION1")
+
+
+@patch("prisma.services.dedup.significant_words", return_value=frozenset())
+@patch("prisma.services.stream_runner.significant_words", return_value=frozenset())
+def test_new_papers_are_created_in_one_batch_without_in_run_duplicates(_, __, vault):
+    stream = vault.create_stream(title="Test Stream", query="short")
+    zotero = MagicMock()
+    zotero.is_available.return_value = True
+    zotero.ensure_collection.return_value = MagicMock(key="COLLECTION1")
+    zotero.get_collection_items.return_value = []
+    zotero.find_by_identifier.return_value = None
+    zotero.add_papers.return_value = [_zotero_item("NEW1", "Paper One"), None]
+
+    papers = [_paper("Paper One"), _paper("Paper Two"), _paper("paper one.")]
+    mock_search_agent = MagicMock()
+    mock_search_agent.preflight.return_value = ["arxiv"]
+    mock_search_agent.search.return_value = MagicMock(papers=papers)
+
+    mock_analysis_agent = MagicMock()
+    mock_analysis_agent.batch_relevance_check.return_value = [True]
+
+    with patch("prisma.agents.search_agent.SearchAgent", return_value=mock_search_agent), \
+         patch("prisma.utils.config.ConfigLoader") as MockConfigLoader, \
+         patch("prisma.agents.analysis_agent.AnalysisAgent", return_value=mock_analysis_agent):
+        MockConfigLoader.return_value.get_search_config.return_value = _search_config()
+        result = run_stream(stream.slug, vault, zotero, force=True)
+
+    zotero.add_papers.assert_called_once_with(papers[:2])
+    assert result.papers_saved == 1
+    assert result.errors == ["bookmark: Zotero rejected 'Paper Two'"]
+
+
+@patch("prisma.services.stream_runner.significant_words", return_value=frozenset())
+def test_item_zotero_did_not_add_to_collection_is_not_counted(_, vault):
+    stream = vault.create_stream(title="Test Stream", query="short")
+    zotero = MagicMock()
+    zotero.is_available.return_value = True
+    zotero.ensure_collection.return_value = MagicMock(key="COLLECTION1")
+    zotero.get_collection_items.return_value = []
+    zotero.search_items.return_value = [
+        _zotero_item("LIB1", "Library Paper"), _zotero_item("LIB2", "Other Paper"),
+    ]
+    zotero.add_items_to_collection.return_value = {"LIB1": True, "LIB2": False}
+
+    mock_search_agent = MagicMock()
+    mock_search_agent.preflight.return_value = ["arxiv"]
+    mock_search_agent.search.return_value = MagicMock(papers=[])
+
+    mock_analysis_agent = MagicMock()
+    mock_analysis_agent.batch_relevance_check.return_value = [True, True]
+
+    with patch("prisma.agents.search_agent.SearchAgent", return_value=mock_search_agent), \
+         patch("prisma.utils.config.ConfigLoader") as MockConfigLoader, \
+         patch("prisma.agents.analysis_agent.AnalysisAgent", return_value=mock_analysis_agent):
+        MockConfigLoader.return_value.get_search_config.return_value = _search_config()
+        result = run_stream(stream.slug, vault, zotero, force=True)
+
+    zotero.add_items_to_collection.assert_called_once_with(["LIB1", "LIB2"], "COLLECTION1")
+    assert result.papers_saved == 1
+    assert result.errors == ["add to collection failed: LIB2"]
+
+
+@patch("prisma.services.dedup.significant_words", return_value=frozenset())
+@patch("prisma.services.stream_runner.significant_words", return_value=frozenset())
+def test_concurrent_runs_sharing_bookmark_lock_create_a_common_paper_once(_, __, vault):
+    slugs = [vault.create_stream(title=title, query="short").slug for title in ("One", "Two")]
+    created = {}
+    second_lookup = threading.Event()
+    lookups = []
+
+    def find_by_identifier(doi=None, title=None):
+        hit = created.get(title)
+        lookups.append(title)
+        if len(lookups) == 1:
+            # Without the lock, the other run's lookup lands here, before
+            # either has created the paper.
+            second_lookup.wait(timeout=0.5)
+        else:
+            second_lookup.set()
+        return hit
+
+    def add_papers(papers):
+        return [created.setdefault(p.title, _zotero_item(f"NEW{len(created)}", p.title)) for p in papers]
+
+    zotero = MagicMock()
+    zotero.is_available.return_value = True
+    zotero.ensure_collection.return_value = MagicMock(key="COLLECTION1")
+    zotero.get_collection_items.return_value = []
+    zotero.search_items.return_value = []
+    zotero.find_by_identifier.side_effect = find_by_identifier
+    zotero.add_papers.side_effect = add_papers
+    zotero.add_items_to_collection.side_effect = lambda keys, collection_key: {k: True for k in keys}
+
+    mock_search_agent = MagicMock()
+    mock_search_agent.preflight.return_value = ["arxiv"]
+    mock_search_agent.search.return_value = MagicMock(papers=[_paper("Shared Paper")])
+
+    mock_analysis_agent = MagicMock()
+    mock_analysis_agent.batch_relevance_check.side_effect = lambda query, candidates: [True] * len(candidates)
+
+    lock = threading.Lock()
+    results = {}
+    with patch("prisma.agents.search_agent.SearchAgent", return_value=mock_search_agent), \
+         patch("prisma.utils.config.ConfigLoader") as MockConfigLoader, \
+         patch("prisma.agents.analysis_agent.AnalysisAgent", return_value=mock_analysis_agent):
+        MockConfigLoader.return_value.get_search_config.return_value = _search_config()
+        threads = [
+            threading.Thread(target=lambda slug=slug: results.update(
+                {slug: run_stream(slug, vault, zotero, force=True, bookmark_lock=lock)}
+            ))
+            for slug in slugs
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert zotero.add_papers.call_count == 1
+    assert [results[slug].papers_saved for slug in slugs] == [1, 1]
+
+
+@patch("prisma.services.dedup.significant_words", return_value=frozenset())
+@patch("prisma.services.stream_runner.significant_words", return_value=frozenset())
+def test_paper_whose_collection_write_zotero_rejected_is_not_counted_as_saved(_, __, vault):
+    # A real ZoteroClient over a mocked pyzotero, so the batched
+    # add_items_to_collection() write response is what decides "saved".
+    from prisma.integrations.zotero.client import ZoteroAPIConfig, ZoteroClient
+    from prisma.storage.models.zotero_models import ZoteroItem
+
+    def _raw(key, title):
+        return {"key": key, "version": 1,
+                "data": {"key": key, "itemType": "journalArticle", "title": title, "collections": []}}
+
+    stream = vault.create_stream(title="Test Stream", query="short")
+    zotero = ZoteroClient(ZoteroAPIConfig(api_key="key123", library_id="12345", library_type="user"))
+    zotero._client = MagicMock()
+    zotero._client.items.return_value = [_raw("NEW1", "Paper One"), _raw("NEW2", "Paper Two")]
+    zotero._client.request.json.return_value = {
+        "successful": {"1": {"key": "NEW2"}},
+        "failed": {"0": {"key": "NEW1", "code": 412, "message": "Item has been modified"}},
+    }
+
+    mock_search_agent = MagicMock()
+    mock_search_agent.preflight.return_value = ["arxiv"]
+    mock_search_agent.search.return_value = MagicMock(papers=[_paper("Paper One"), _paper("Paper Two")])
+
+    mock_analysis_agent = MagicMock()
+    mock_analysis_agent.batch_relevance_check.return_value = [True, True]
+
+    with patch("prisma.agents.search_agent.SearchAgent", return_value=mock_search_agent), \
+         patch("prisma.utils.config.ConfigLoader") as MockConfigLoader, \
+         patch("prisma.agents.analysis_agent.AnalysisAgent", return_value=mock_analysis_agent), \
+         patch.object(zotero, "is_available", return_value=True), \
+         patch.object(zotero, "ensure_collection", return_value=MagicMock(key="COLLECTION1")), \
+         patch.object(zotero, "get_collection_items", return_value=[]), \
+         patch.object(zotero, "search_items", return_value=[]), \
+         patch.object(zotero, "find_by_identifier", return_value=None), \
+         patch.object(zotero, "add_papers", return_value=[
+             ZoteroItem.from_zotero_data(_raw("NEW1", "Paper One")),
+             ZoteroItem.from_zotero_data(_raw("NEW2", "Paper Two")),
+         ]):
+        MockConfigLoader.return_value.get_search_config.return_value = _search_config()
+        result = run_stream(stream.slug, vault, zotero, force=True)
+
+    assert result.papers_saved == 1
+    assert result.errors == ["add to collection failed: NEW1"]
@@ -4,6 +4,8 @@ behavior (prisma.server.streams_routes). All external boundaries (SearchAgent,
 ConfigLoader, network) are mocked.
 """
 
+import threading
+
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -165,6 +167,66 @@ class TestStreamSchedulerTick:
 
         assert "fine" in calls
 
+    def test_skips_stream_already_running(self, vault):
+        from prisma.server import streams_routes
+
+        vault.create_stream(title="Busy", query="q")  # next_update=None -> due
+        vault.create_stream(title="Idle", query="q")
+        scheduler, calls, fake_run = self._make_tick(vault)
+        streams_routes._running_streams.add("busy")
+        try:
+            with patch("prisma.server.streams_routes.run_stream_and_notify", fake_run):
+                scheduler._tick()
+        finally:
+            streams_routes._running_streams.discard("busy")
+
+        assert calls == ["idle"]
+
+    def test_due_streams_run_concurrently(self, vault):
+        vault.create_stream(title="One", query="q")
+        vault.create_stream(title="Two", query="q")
+        both_started = threading.Barrier(2, timeout=5)
+        calls = []
+
+        def blocking_run(vault_arg, zotero_arg, slug, broadcast_fn, force=False):
+            both_started.wait()  # raises BrokenBarrierError if runs are sequential
+            calls.append(slug)
+            return StreamRunResult(slug=slug, papers_found=0, papers_saved=0,
+                                   sources_used=[], sources_skipped=[])
+
+        scheduler, _, _ = self._make_tick(vault)
+        with patch("prisma.server.streams_routes.run_stream_and_notify", blocking_run):
+            scheduler._tick()
+
+        assert sorted(calls) == ["one", "two"]
+
+    def test_tick_logs_completion_count_and_summary(self, vault, caplog):
+        vault.create_stream(title="One", query="q")
+        vault.create_stream(title="Two", query="q")
+
+        scheduler, _, fake_run = self._make_tick(vault)
+        with patch("prisma.server.streams_routes.run_stream_and_notify", fake_run), \
+             caplog.at_level("INFO", logger="prisma.maintenance"):
+            scheduler._tick()
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert any("done (1/2)" in m for m in messages)
+        assert any("done (2/2)" in m for m in messages)
+        assert any("tick done — 2 run, 0 failed" in m for m in messages)
+
+    def test_serialized_zotero_holds_lock_during_calls(self):
+        from prisma.server.streams_routes import _SerializedZotero
+
+        lock = threading.Lock()
+        client = MagicMock()
+        client.config = "cfg"
+        client.is_available.side_effect = lambda: lock.locked()
+        proxy = _SerializedZotero(client, lock)
+
+        assert proxy.is_available() is True
+        assert proxy.config == "cfg"
+        assert not lock.locked()
+
 
 # ── run_stream_and_notify() ───────────────────────────────────────────────────
 
@@ -195,7 +257,7 @@ class TestRunStream:
         z.get_collection_items.return_value = []
         z.search_items.return_value = []
         z.find_by_identifier.return_value = None
-        z.add_paper.return_value = MagicMock(key="ITEM1", version=0, collections=[])
+        z.add_papers.return_value = [MagicMock(key="ITEM1", version=0, collections=[])]
         return z
 
     def _patched_run(self, cfg, agent_mock):
@@ -305,7 +367,7 @@ class TestRunStream:
         zotero.get_collection_items.return_value = []
         zotero.search_items.return_value = []
         zotero.find_by_identifier.return_value = None
-        zotero.add_paper.return_value = MagicMock(key="ITEM1", version=0, collections=[])
+        zotero.add_papers.return_value = [MagicMock(key="ITEM1", version=0, collections=[])]
 
         p1, p2, p3 = self._patched_run(mock_cfg, agent)
         with p1, p2, p3:
@@ -314,8 +376,8 @@ class TestRunStream:
         assert result.papers_found == 1
         assert result.papers_saved == 1
         zotero.ensure_collection.assert_called_once()
-        zotero.add_paper.assert_called_once()
-        zotero.add_item_to_collection.assert_called_once()
+        zotero.add_papers.assert_called_once()
+        zotero.add_items_to_collection.assert_called_once()
 
     def test_does_not_save_duplicate_papers(self, vault, mock_cfg):
         vault.create_stream(title="AI", query="q")
@@ -342,7 +404,7 @@ class TestRunStream:
             result = self._run(vault, zotero, "ai", force=True)
 
         assert result.papers_saved == 0
-        zotero.add_paper.assert_not_called()
+        zotero.add_papers.assert_not_called()
 
     def test_updates_stream_metadata_after_run(self, vault, mock_cfg, mock_zotero):
         vault.create_stream(title="Meta", query="q", refresh_frequency="weekly")
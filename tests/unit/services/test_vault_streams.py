@@ -90,6 +90,36 @@ class TestListStreams:
         streams = vault.list_streams()
         assert len(streams) == 1
 
+    def test_does_not_rescan_directory_per_stream(self, vault, monkeypatch):
+        for i in range(3):
+            vault.create_stream(title=f"Stream {i}", query="q")
+        monkeypatch.setattr(vault, "find_stream_path", lambda slug: pytest.fail("per-stream lookup"))
+        assert sorted(s.slug for s in vault.list_streams()) == ["stream-0", "stream-1", "stream-2"]
+
+    def test_unchanged_files_are_not_reparsed(self, vault, monkeypatch):
+        vault.create_stream(title="Cached", query="q")
+        vault.list_streams()
+        monkeypatch.setattr(vault, "_parse_stream", lambda path, stat: pytest.fail("re-parsed"))
+        assert [s.slug for s in vault.list_streams()] == ["cached"]
+
+    def test_save_invalidates_cached_stream(self, vault):
+        vault.create_stream(title="Cached", query="q")
+        vault.list_streams()
+        vault.save_stream("cached", status="paused")
+        assert vault.list_streams()[0].status == StreamStatus.paused
+
+
+class TestListDueStreams:
+    def test_filters_to_active_scheduled_and_due(self, vault):
+        now = datetime(2026, 1, 15, 12, 0, 0)
+        for title in ("Never Run", "Overdue", "Later", "Paused", "Manual"):
+            vault.create_stream(title=title, query="q")
+        vault.save_stream("overdue", next_update=datetime(2026, 1, 14))
+        vault.save_stream("later", next_update=datetime(2026, 1, 16))
+        vault.save_stream("paused", status="paused")
+        vault.save_stream("manual", refresh_frequency="manual")
+        assert sorted(s.slug for s in vault.list_due_streams(now)) == ["never-run", "overdue"]
+
 
 class TestSaveStream:
     def test_updates_fields(self, vault):
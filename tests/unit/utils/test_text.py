@@ -1,7 +1,10 @@
 """Unit tests for prisma.utils.text.content_hash — the single source of
 truth for the SHA256-content-hash algorithm on the Python side, mirrored by
 prisma-desktop's Rust content_hash() (sync/mod.rs)."""
-from prisma.utils.text import content_hash, make_citekey
+from unittest.mock import MagicMock, patch
+
+from prisma.utils import text
+from prisma.utils.text import content_hash, make_citekey, normalize_doi, normalize_title, strict_title_key
 
 
 def test_content_hash_matches_known_digest():
@@ -48,3 +51,50 @@ def test_make_citekey_does_not_raise_on_whitespace_only_title_with_no_authors():
 
 def test_make_citekey_ignores_blank_author_strings():
     assert make_citekey(["", "  ", "Smith J"], 2024) == "j2024"
+
+
+def test_normalize_title_ignores_case_punctuation_and_whitespace():
+    assert normalize_title("Attention Is All You Need.") == normalize_title("  attention is   all you need ")
+
+
+def test_normalize_title_keeps_non_latin_words():
+    assert normalize_title("深度学习：综述") == "深度学习 综述"
+
+
+def test_normalize_title_punctuation_is_a_word_break():
+    assert normalize_title("Version 1.5 results") != normalize_title("Version 15 results")
+    assert normalize_title("state-of-the-art") == "state of the art"
+
+
+def test_strict_title_key_keeps_meaningful_symbols():
+    keys = {strict_title_key(t) for t in ("C++ programming", "C# programming", "C programming")}
+    assert len(keys) == 3
+    assert strict_title_key("Version 1.5 results") != strict_title_key("Version 15 results")
+
+
+def test_strict_title_key_folds_typography_and_trailing_period():
+    assert strict_title_key("Don’t  Stop Pretraining.") == strict_title_key("don't stop pretraining")
+
+
+def test_normalize_title_ascii_and_unicode_paths_agree():
+    # "é" forces the regex path; the rest is identical ASCII punctuation
+    assert normalize_title("Deep_Nets (v2): a re-look!") + " é" == normalize_title("Deep_Nets (v2): a re-look! é")
+
+
+def test_normalize_doi_strips_resolver_prefixes_and_case():
+    assert normalize_doi(" https://doi.org/10.1000/ABC ") == "10.1000/abc"
+    assert normalize_doi("http://dx.doi.org/10.1000/abc") == "10.1000/abc"
+    assert normalize_doi("DOI: 10.1000/abc") == "10.1000/abc"
+    assert normalize_doi("10.1000/abc") == "10.1000/abc"
+
+
+def test_significant_words_stems_each_distinct_text_once():
+    tokenize = MagicMock(side_effect=str.split)
+    text.significant_words.cache_clear()
+    with patch("prisma.utils.text._nltk_tools", return_value=(tokenize, frozenset({"the"}), str.upper)):
+        first = text.significant_words("The Cached Title")
+        second = text.significant_words("The Cached Title")
+    text.significant_words.cache_clear()
+
+    assert first == second == frozenset({"CACHED", "TITLE"})
+    tokenize.assert_called_once()